@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Literal
 from pathlib import Path
@@ -8,6 +9,8 @@ import base64
 import os
 
 from resumetailor.core.session import session_manager
+from resumetailor.api.job_profile import discard_pending_extraction
+from resumetailor.llm import resume_writer
 from resumetailor.services.storage import (
     create_data_dir,
     save_job_profile,
@@ -16,11 +19,37 @@ from resumetailor.services.storage import (
     load_private_info,
 )
 from resumetailor.models import OutputResume
+from resumetailor.services.retry import CircuitBreaker
 
 # Configuration for ResumeGen microservice
 RESUMEGEN_API_URL = os.getenv("RESUMEGEN_API_URL", "http://localhost:8000")
 
 
+def _is_resumegen_outage(error: Exception) -> bool:
+    """Connection problems, timeouts and 5xx responses mean ResumeGen is down."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    )
+
+
+resumegen_circuit_breaker = CircuitBreaker(
+    "resumegen", is_failure=_is_resumegen_outage, register=True
+)
+
+
+def _post_resumegen(endpoint: str, data: dict) -> dict:
+    response = requests.post(
+        f"{RESUMEGEN_API_URL}/{endpoint}",
+        json=data,
+        headers={"Content-Type": "application/json"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def call_resumegen_api(endpoint: str, data: dict) -> dict:
     """
     Call the ResumeGen microservice API.
@@ -31,16 +60,12 @@ def call_resumegen_api(endpoint: str, data: dict) -> dict:
 
     Returns:
         API response containing html_content and pdf_content
+
+    Raises:
+        CircuitOpenError: If ResumeGen is known to be down
     """
     try:
-        response = requests.post(
-            f"{RESUMEGEN_API_URL}/{endpoint}",
-            json=data,
-            headers={"Content-Type": "application/json"},
-            timeout=30,
-        )
-        response.raise_for_status()
-        return response.json()
+        return resumegen_circuit_breaker.call(_post_resumegen, endpoint, data)
     except requests.exceptions.RequestException as e:
         raise HTTPException(
             status_code=500,
@@ -87,7 +112,7 @@ class ApplicationRequest(BaseModel):
 
 
 @router.post("/application/initialize")
-def initialize_job_application(req: ApplicationRequest):
+async def initialize_job_application(req: ApplicationRequest):
     """
     Initialize a job application session.
     This endpoint creates a new session for the job application process.
@@ -102,16 +127,21 @@ class CompleteApplicationRequest(BaseModel):
 
 
 @router.post("/application/complete")
-def complete_application(req: CompleteApplicationRequest):
+async def complete_application(req: CompleteApplicationRequest):
     """
     Complete or discard the job application session.
     If action is "save", render and save resume and cover letter using ResumeGen microservice.
     If action is "discard", delete the session and its data.
     """
     if req.action == "discard":
+        discard_pending_extraction(req.session_id)
+        resume_writer.discard_speculative_compile(req.session_id)
         session_manager.delete_session(req.session_id)
         return {"detail": "Session discarded."}
 
+    # Fail fast (503) before writing anything if ResumeGen is known to be down
+    resumegen_circuit_breaker.raise_if_open()
+
     # Load session data
     job_profile = session_manager.get_session_data(req.session_id, "job_profile")
 
@@ -142,7 +172,10 @@ def complete_application(req: CompleteApplicationRequest):
             "resume_data": resume_dict,
         }
 
-        resume_content = call_resumegen_api("generate-resume", resume_data)
+        # requests is blocking, keep it off the event loop
+        resume_content = await run_in_threadpool(
+            call_resumegen_api, "generate-resume", resume_data
+        )
         resume_html_path, resume_pdf_path = save_generated_content(
             req.session_id, resume_content, "resume"
         )
@@ -157,8 +190,8 @@ def complete_application(req: CompleteApplicationRequest):
                 "cover_letter_data": cover_letter.model_dump(),
             }
 
-            cover_letter_content = call_resumegen_api(
-                "generate-cover-letter", cover_letter_data
+            cover_letter_content = await run_in_threadpool(
+                call_resumegen_api, "generate-cover-letter", cover_letter_data
             )
             cover_letter_html_path, cover_letter_pdf_path = save_generated_content(
                 req.session_id, cover_letter_content, "cover_letter"
@@ -171,6 +204,8 @@ def complete_application(req: CompleteApplicationRequest):
 
     except Exception as e:
         # Clean up session on error
+        discard_pending_extraction(req.session_id)
+        resume_writer.discard_speculative_compile(req.session_id)
         session_manager.delete_session(req.session_id)
         raise HTTPException(
             status_code=500,
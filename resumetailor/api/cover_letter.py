@@ -17,7 +17,7 @@ class GenerateCoverLetterRequest(BaseModel):
 
 
 @router.post("/cover-letter/generate", response_model=CoverLetter)
-def generate_cover_letter(req: GenerateCoverLetterRequest):
+async def generate_cover_letter(req: GenerateCoverLetterRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
     job_description = session_manager.get_session_data(
@@ -25,7 +25,7 @@ def generate_cover_letter(req: GenerateCoverLetterRequest):
     )
     job_profile = session_manager.get_session_data(req.session_id, "job_profile")
     refined_resume = session_manager.get_session_data(req.session_id, "refined_resume")
-    cover_letter = cover_letter_writer.generate(
+    cover_letter = await cover_letter_writer.agenerate(
         thread_id=req.session_id,
         job_profile=job_profile,
         candidate_resume=refined_resume,
@@ -42,12 +42,12 @@ class EditCoverLetterRequest(BaseModel):
 
 
 @router.post("/cover-letter/edit", response_model=CoverLetter)
-def edit_section(req: EditCoverLetterRequest):
+async def edit_section(req: EditCoverLetterRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
     if req.user_edited_cover_letter is not None:
         req.user_edited_cover_letter.personal_information = load_anon_info()
-    edited_cover_letter = cover_letter_writer.edit(
+    edited_cover_letter = await cover_letter_writer.aedit(
         thread_id=req.session_id,
         editing_suggestions=req.editing_suggestions,
         user_edited_cover_letter=req.user_edited_cover_letter,
@@ -63,12 +63,12 @@ class CompleteCoverLetterRequest(BaseModel):
 
 
 @router.post("/cover-letter/complete")
-def complete_cover_letter(req: CompleteCoverLetterRequest):
+async def complete_cover_letter(req: CompleteCoverLetterRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
     if req.user_edited_cover_letter is not None:
         req.user_edited_cover_letter.personal_information = load_anon_info()
-    final_cover_letter = cover_letter_writer.complete(
+    final_cover_letter = await cover_letter_writer.acomplete(
         thread_id=req.session_id, user_edited_cover_letter=req.user_edited_cover_letter
     )
     if req.decision == "discard":
@@ -5,6 +5,8 @@ import json
 from shutil import rmtree
 
 from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.services.near_duplicates import near_duplicate_index
+from resumetailor.services.warm_start import warm_start_index
 
 router = APIRouter()
 
@@ -100,4 +102,6 @@ def delete_data_id(id: str):
         rmtree(dir_path)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete: {e}")
+    near_duplicate_index.remove(id)
+    warm_start_index.remove(id)
     return {"detail": f"Deleted {id} successfully."}
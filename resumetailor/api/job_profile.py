@@ -1,13 +1,82 @@
+import asyncio
+import logging
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Literal
+from functools import partial
 
 from resumetailor.llm import extractor
-from resumetailor.models import JobProfile
+from resumetailor.models import JobProfile, FitScore
 from resumetailor.core.session import session_manager
+from resumetailor.services.fit_score import keyword_index_store
+from resumetailor.services.near_duplicates import near_duplicate_index
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Background LLM extractions started by /job-profile/draft, per session
+_pending_extractions: dict[str, tuple[str, asyncio.Task]] = {}
+
+
+def _store_extraction(session_id: str, job_description: str, task: asyncio.Task):
+    """
+    Done-callback of a background extraction: store its profile in the session.
+
+    The entry is removed here, so the extractions of sessions that never call
+    another endpoint do not pile up. Extractions that were awaited, replaced or
+    cancelled in the meantime are left alone.
+    """
+    if task.cancelled():
+        return
+    error = task.exception()
+    if _pending_extractions.get(session_id, (None, None))[1] is not task:
+        return
+    del _pending_extractions[session_id]
+    if error is not None:
+        logger.warning(f"Background job profile extraction failed: {error}")
+        return
+    session = session_manager.sessions.get(session_id)
+    if session is not None and session.job_description == job_description:
+        session_manager.update_session_data(
+            session_id=session_id, job_profile=task.result(), job_profile_extracted=True
+        )
+
+
+def discard_pending_extraction(session_id: str):
+    """Cancel the background extraction of a session that is deleted."""
+    _, task = _pending_extractions.pop(session_id, (None, None))
+    if task is not None:
+        task.cancel()
+
+
+async def _finish_pending_extraction(
+    session_id: str, job_description: str | None = None
+) -> JobProfile | None:
+    """
+    Wait for the background extraction of a session and store its result.
+
+    A pending extraction of a different job description is cancelled instead.
+    An extraction that already finished was stored by its done-callback.
+
+    Returns:
+        JobProfile | None: The extracted profile, None if there was none to wait for
+    """
+    pending_description, task = _pending_extractions.pop(session_id, (None, None))
+    if task is None:
+        session = session_manager.get_session(session_id)
+        if session.job_profile_extracted and job_description in (None, session.job_description):
+            return session.job_profile
+        return None
+    if job_description is not None and job_description != pending_description:
+        task.cancel()
+        return None
+    extracted_profile = await task
+    session_manager.update_session_data(
+        session_id=session_id, job_profile=extracted_profile, job_profile_extracted=True
+    )
+    return extracted_profile
+
 
 class GenerateJobProfileRequest(BaseModel):
     session_id: str
@@ -15,20 +84,62 @@ class GenerateJobProfileRequest(BaseModel):
 
 
 @router.post("/job-profile/generate", response_model=JobProfile)
-def generate_job_profile(req: GenerateJobProfileRequest):
+async def generate_job_profile(req: GenerateJobProfileRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
-    extracted_profile = extractor.extract(
-        job_description=req.job_description, thread_id=req.session_id
+    extracted_profile = await _finish_pending_extraction(
+        req.session_id, req.job_description
     )
+    if extracted_profile is None:
+        extracted_profile = await extractor.aextract(
+            job_description=req.job_description,
+            thread_id=req.session_id,
+            job_profile=near_duplicate_index.find_profile(req.job_description),
+        )
     session_manager.update_session_data(
         session_id=req.session_id,
         job_description=req.job_description,
         job_profile=extracted_profile,
+        job_profile_extracted=True,
     )
     return extracted_profile
 
 
+@router.post("/job-profile/draft", response_model=JobProfile)
+async def draft_job_profile(req: GenerateJobProfileRequest):
+    """
+    Draft job profile from a dictionary scan of the description, returned instantly.
+
+    The LLM extraction starts in the background; /job-profile/generate with the
+    same description then returns its result.
+    """
+    if req.session_id not in session_manager.sessions:
+        raise HTTPException(status_code=404, detail="Session not found.")
+    draft_profile = extractor.draft(req.job_description)
+    pending_description, task = _pending_extractions.get(req.session_id, (None, None))
+    if task is None or pending_description != req.job_description:
+        if task is not None:
+            task.cancel()
+        task = asyncio.create_task(
+            extractor.aextract(
+                job_description=req.job_description,
+                thread_id=req.session_id,
+                job_profile=near_duplicate_index.find_profile(req.job_description),
+            )
+        )
+        _pending_extractions[req.session_id] = (req.job_description, task)
+        task.add_done_callback(
+            partial(_store_extraction, req.session_id, req.job_description)
+        )
+    session_manager.update_session_data(
+        session_id=req.session_id,
+        job_description=req.job_description,
+        job_profile=draft_profile,
+        job_profile_extracted=False,
+    )
+    return draft_profile
+
+
 class EditJobProfileRequest(BaseModel):
     session_id: str
     user_edited_profile: JobProfile | None = None
@@ -36,10 +147,11 @@ class EditJobProfileRequest(BaseModel):
 
 
 @router.post("/job-profile/edit", response_model=JobProfile)
-def edit_job_profile(req: EditJobProfileRequest):
+async def edit_job_profile(req: EditJobProfileRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
-    ai_edited_profile = extractor.edit(
+    await _finish_pending_extraction(req.session_id)
+    ai_edited_profile = await extractor.aedit(
         thread_id=req.session_id,
         editing_suggestions=req.suggestion,
         edited_job_profile=req.user_edited_profile,
@@ -54,10 +166,11 @@ class CompleteJobProfileRequest(BaseModel):
 
 
 @router.post("/job-profile/complete")
-def complete_job_profile(req: CompleteJobProfileRequest):
+async def complete_job_profile(req: CompleteJobProfileRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
-    final_job_profile = extractor.complete(
+    await _finish_pending_extraction(req.session_id)
+    final_job_profile = await extractor.acomplete(
         thread_id=req.session_id,
         edited_job_profile=req.user_edited_profile,
     )
@@ -76,3 +189,37 @@ def complete_job_profile(req: CompleteJobProfileRequest):
         raise HTTPException(
             status_code=400, detail="Invalid decision. Must be 'save' or 'discard'."
         )
+
+
+class FitScoreRequest(BaseModel):
+    session_id: str | None = None
+    job_profile: JobProfile | None = None
+    job_description: str | None = None
+
+
+@router.post("/job-profile/fit-score", response_model=FitScore)
+async def fit_score(req: FitScoreRequest):
+    """
+    Keyword coverage of the full resume for a job, computed without LLM calls.
+
+    Scores the given job profile, else the draft profile of the given job
+    description, else the job profile (or description) of the session.
+    """
+    index = keyword_index_store.get()
+    if index is None:
+        raise HTTPException(status_code=404, detail="Full resume not found.")
+    job_profile = req.job_profile
+    job_description = req.job_description
+    if job_profile is None and job_description is None and req.session_id is not None:
+        if req.session_id not in session_manager.sessions:
+            raise HTTPException(status_code=404, detail="Session not found.")
+        session = session_manager.get_session(req.session_id)
+        job_profile = session.job_profile
+        job_description = session.job_description
+    if job_profile is None and job_description:
+        job_profile = extractor.draft(job_description)
+    if job_profile is None:
+        raise HTTPException(
+            status_code=400, detail="A job profile or job description is required."
+        )
+    return index.fit_score(job_profile)
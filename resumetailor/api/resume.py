@@ -1,22 +1,49 @@
 from fastapi import APIRouter
 from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Literal
+from typing import Any, Literal
+import asyncio
+import json
+import logging
 from copy import deepcopy as dcp
 from rich import print
 
 from resumetailor.llm import resume_writer
-from resumetailor.models import Resume, SectionType
+from resumetailor.models import Resume, JobProfile, SectionType
 from resumetailor.core.session import session_manager, Info
 from resumetailor.services.storage import (
     load_full_resume,
     load_private_info,
     load_anon_info,
 )
+from resumetailor.services.warm_start import section_digests, warm_start_index
+from resumetailor.services.candidate_context import candidate_context_store
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Background LLM digest of long full resume sections
+_condense_task: asyncio.Task | None = None
+
+
+def schedule_candidate_condensing():
+    """Condense long full resume sections without a digest in the background (no-op if disabled)."""
+    global _condense_task
+    if _condense_task is not None and not _condense_task.done():
+        return
+    if not candidate_context_store.to_condense():
+        return
+
+    def log_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Condensing candidate data failed: {task.exception()}")
+
+    _condense_task = asyncio.create_task(resume_writer.acondense_candidate_data())
+    _condense_task.add_done_callback(log_failure)
+
 
 class GenerateResumeRequest(BaseModel):
     session_id: str
@@ -24,8 +51,8 @@ class GenerateResumeRequest(BaseModel):
     focus_aspects: str | None = None
 
 
-@router.post("/resume/generate", response_model=Resume)
-def generate_resume(req: GenerateResumeRequest):
+def _prepare_generation(req: GenerateResumeRequest) -> tuple[Resume, JobProfile | None]:
+    """Validate the session and store the target of the resume in its info."""
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
     full_resume = load_full_resume()
@@ -38,18 +65,70 @@ def generate_resume(req: GenerateResumeRequest):
         job_profile = session_manager.get_session_data(req.session_id, "job_profile")
         info.company = job_profile.company
         info.position = job_profile.position
-    session_manager.update_session_data(session_id=req.session_id, info=info)
-    refined_resume = resume_writer.generate(
+    session_manager.update_session_data(
+        session_id=req.session_id,
+        info=info,
+        section_digests=section_digests(full_resume),
+    )
+    # Sections changed since the last digest are condensed for the next generation
+    schedule_candidate_condensing()
+    return full_resume, job_profile
+
+
+@router.post("/resume/generate", response_model=Resume)
+async def generate_resume(req: GenerateResumeRequest):
+    full_resume, job_profile = _prepare_generation(req)
+    refined_resume = await resume_writer.agenerate(
         thread_id=req.session_id,
         resume=full_resume,
         job_profile=job_profile,
         job_titles=req.job_titles,
         focus_aspects=req.focus_aspects,
+        warm_start=warm_start_index.find(job_profile),
     )
     refined_resume.personal_information = load_private_info()
     return refined_resume
 
 
+def _sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+@router.post("/resume/generate/stream")
+async def generate_resume_stream(req: GenerateResumeRequest):
+    """
+    Server-Sent Events variant of `/resume/generate`.
+
+    Emits a `section` event (section_key, section_data, explanation) as soon as
+    each section writer finishes, then a `resume` event with the full resume.
+    Failures after the stream has started are reported as an `error` event.
+    """
+    full_resume, job_profile = _prepare_generation(req)
+
+    async def events():
+        try:
+            async for event, data in resume_writer.astream_generate(
+                thread_id=req.session_id,
+                resume=full_resume,
+                job_profile=job_profile,
+                job_titles=req.job_titles,
+                focus_aspects=req.focus_aspects,
+                warm_start=warm_start_index.find(job_profile),
+            ):
+                if event == "resume":
+                    data.personal_information = load_private_info()
+                yield _sse_event(event, data)
+        except Exception as e:
+            logger.exception("Streaming resume generation failed")
+            yield _sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 class EditSectionRequest(BaseModel):
     session_id: str
     section_key: str
@@ -58,10 +137,10 @@ class EditSectionRequest(BaseModel):
 
 
 @router.post("/resume/edit-section", response_model=SectionType)
-def edit_section(req: EditSectionRequest):
+async def edit_section(req: EditSectionRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
-    edited_section = resume_writer.edit_section(
+    edited_section = await resume_writer.aedit_section(
         thread_id=req.session_id,
         section_key=req.section_key,
         editing_suggestions=req.editing_suggestions,
@@ -77,23 +156,24 @@ class CompleteResumeRequest(BaseModel):
 
 
 @router.post("/resume/complete")
-def complete_resume(req: CompleteResumeRequest):
+async def complete_resume(req: CompleteResumeRequest):
     if req.session_id not in session_manager.sessions:
         raise HTTPException(status_code=404, detail="Session not found.")
     if req.user_edited_resume is not None:
         req.user_edited_resume.personal_information = load_anon_info()
-    final_resume = resume_writer.complete(
+    final_resume = await resume_writer.acomplete(
         thread_id=req.session_id, user_edited_resume=req.user_edited_resume
     )
     if req.decision == "discard":
         session_manager.update_session_data(
-            session_id=req.session_id, refined_resume=None
+            session_id=req.session_id, refined_resume=None, tailored_resume=None
         )
         return {"message": "Resume discarded."}
     elif req.decision == "save":
         session_manager.update_session_data(
             session_id=req.session_id,
             refined_resume=final_resume,
+            tailored_resume=req.user_edited_resume or resume_writer.get_resume(req.session_id),
         )
         return {"message": "Resume saved."}
     else:
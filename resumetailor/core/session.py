@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 from typing import Any, Literal, List
 from pathlib import Path
 
-from resumetailor.models import JobProfile, OutputResume, CoverLetter
+from resumetailor.models import JobProfile, Resume, OutputResume, CoverLetter
 from resumetailor.core.constants import BASE_DATA_DIR
 
 
@@ -24,7 +24,13 @@ class Session(BaseModel):
     data_dir: Path | None = Field(None)
     job_description: str | None = Field(None)
     job_profile: JobProfile | None = Field(None)
+    # Whether job_profile is the LLM extraction of job_description, not a draft
+    job_profile_extracted: bool = Field(False)
     refined_resume: OutputResume | None = Field(None)
+    # The refined resume before compilation, and the digests of the full resume
+    # sections it was generated from (both recorded for warm starts)
+    tailored_resume: Resume | None = Field(None)
+    section_digests: dict[str, str] | None = Field(None)
     cover_letter: CoverLetter | None = Field(None)
 
 
@@ -1,4 +1,5 @@
 from typing import Annotated, Any
+from pydantic import Field
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langgraph.graph import StateGraph, START, END
@@ -6,6 +7,7 @@ from langgraph.graph import MessagesState
 from langgraph.types import interrupt, Command
 from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage, AIMessage, AnyMessage
+from langchain_core.runnables import RunnableLambda
 import os
 from dotenv import load_dotenv
 
@@ -13,16 +15,29 @@ load_dotenv()
 
 from resumetailor.models import CoverLetter
 from resumetailor.llm.prompts import cover_letter_prompts as prompts
-from resumetailor.services.utils import model_to_str
+from resumetailor.services.utils import model_to_str, model_to_prompt
 from resumetailor.services.retry import RetryableChain
+from resumetailor.services.boilerplate import strip_boilerplate
 import uuid
 
+# Cover letter generation: "single_call" (structured output directly) or "two_step" (prose, then structured)
+COVER_LETTER_MODE = os.getenv("COVER_LETTER_MODE", "single_call")
+
+
+class CoverLetterDraft(CoverLetter):
+    """A cover letter with the reasoning behind it, written in a single structured call."""
+
+    explanation: str = Field(
+        ...,
+        description="Explanation and reasoning for the choices or edits made in the cover letter.",
+    )
+
 
 class CoverLetterState(MessagesState):
     job_profile: Annotated[str, "The AI-extracted job profile as JSON string."]
     candidate_resume: Annotated[str, "The candidate's refined resume as JSON string."]
     job_description: Annotated[
-        str | None, "The original job description text, for style/tone only."
+        str | None, "The job description text without boilerplate, for style/tone only."
     ]
     editing_suggestions: Annotated[
         str | None, "User suggestions or comments for editing the cover letter."
@@ -41,6 +56,7 @@ class CoverLetterWriter:
 
     def __init__(self):
         self._create_model()
+        self._create_chains()
         self._create_graph()
 
     def generate(
@@ -61,14 +77,33 @@ class CoverLetterWriter:
             CoverLetter: The generated cover letter object.
         """
         config = {"configurable": {"thread_id": thread_id}}
-        initial_state = CoverLetterState(
+        initial_state = self._initial_state(job_profile, candidate_resume, job_description)
+        result = self.graph.invoke(initial_state, config=config)
+        return result["cover_letter"]
+
+    async def agenerate(
+        self,
+        thread_id: str,
+        job_profile: str,
+        candidate_resume: str,
+        job_description: str | None = None,
+    ) -> CoverLetter:
+        """Async variant of `generate`."""
+        config = {"configurable": {"thread_id": thread_id}}
+        initial_state = self._initial_state(job_profile, candidate_resume, job_description)
+        result = await self.graph.ainvoke(initial_state, config=config)
+        return result["cover_letter"]
+
+    @staticmethod
+    def _initial_state(
+        job_profile: str, candidate_resume: str, job_description: str | None
+    ) -> CoverLetterState:
+        return CoverLetterState(
             job_profile=job_profile,
             candidate_resume=candidate_resume,
-            job_description=job_description,
+            job_description=strip_boilerplate(job_description),
             done=False,
         )
-        result = self.graph.invoke(initial_state, config=config)
-        return result["cover_letter"]
 
     def edit(
         self,
@@ -87,17 +122,37 @@ class CoverLetterWriter:
         """
         config = {"configurable": {"thread_id": thread_id}}
         result = self.graph.invoke(
-            Command(
-                resume={
-                    "user_edited_cover_letter": user_edited_cover_letter,
-                    "editing_suggestions": editing_suggestions,
-                    "done": False,
-                }
-            ),
+            self._edit_command(editing_suggestions, user_edited_cover_letter),
             config=config,
         )
         return result["cover_letter"]
 
+    async def aedit(
+        self,
+        thread_id: str,
+        editing_suggestions: str,
+        user_edited_cover_letter: str | None = None,
+    ) -> CoverLetter:
+        """Async variant of `edit`."""
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await self.graph.ainvoke(
+            self._edit_command(editing_suggestions, user_edited_cover_letter),
+            config=config,
+        )
+        return result["cover_letter"]
+
+    @staticmethod
+    def _edit_command(
+        editing_suggestions: str, user_edited_cover_letter: str | None
+    ) -> Command:
+        return Command(
+            resume={
+                "user_edited_cover_letter": user_edited_cover_letter,
+                "editing_suggestions": editing_suggestions,
+                "done": False,
+            }
+        )
+
     def complete(
         self, thread_id: str, user_edited_cover_letter: CoverLetter | None = None
     ) -> CoverLetter:
@@ -111,59 +166,124 @@ class CoverLetterWriter:
         """
         config = {"configurable": {"thread_id": thread_id}}
         result = self.graph.invoke(
-            Command(
-                resume={
-                    "user_edited_cover_letter": user_edited_cover_letter,
-                    "done": True,
-                }
-            ),
-            config=config,
+            self._complete_command(user_edited_cover_letter), config=config
         )
         return result["cover_letter"]
 
+    async def acomplete(
+        self, thread_id: str, user_edited_cover_letter: CoverLetter | None = None
+    ) -> CoverLetter:
+        """Async variant of `complete`."""
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await self.graph.ainvoke(
+            self._complete_command(user_edited_cover_letter), config=config
+        )
+        return result["cover_letter"]
+
+    @staticmethod
+    def _complete_command(user_edited_cover_letter: CoverLetter | None) -> Command:
+        return Command(
+            resume={
+                "user_edited_cover_letter": user_edited_cover_letter,
+                "done": True,
+            }
+        )
+
     def _create_model(self):
         self.model = ChatOpenAI(
             model=os.getenv(self._model_type),
             use_responses_api=True,
         )
 
-    def _create_graph(self):
-        def writer_node(state: CoverLetterState):
-            prompt = ChatPromptTemplate.from_messages(
+    def _create_chains(self):
+        def writer_prompt(name: str) -> ChatPromptTemplate:
+            return ChatPromptTemplate.from_messages(
+                [
+                    ("system", prompts[name]["system_message"]),
+                    ("human", prompts[name]["prompt"]),
+                ]
+            )
+
+        def editor_prompt(name: str) -> ChatPromptTemplate:
+            return ChatPromptTemplate.from_messages(
                 [
-                    ("system", prompts["writer"]["system_message"]),
-                    ("human", prompts["writer"]["prompt"]),
+                    ("system", prompts[name]["system_message"]),
+                    MessagesPlaceholder("messages"),
+                    ("human", prompts[name]["prompt"]),
                 ]
             )
-            chain = prompt | self.model
-            retryable_chain = RetryableChain(chain)
-            result = retryable_chain.invoke(state)
-            
-            structured_chain = self.model.with_structured_output(CoverLetter)
-            retryable_structured_chain = RetryableChain(structured_chain)
-            cover_letter = retryable_structured_chain.invoke([result])
-            
+
+        self.chains = {
+            "writer": RetryableChain(writer_prompt("writer") | self.model),
+            "editor": RetryableChain(editor_prompt("editor") | self.model),
+            "structured": RetryableChain(
+                self.model.with_structured_output(CoverLetter), output_schema=CoverLetter
+            ),
+            # COVER_LETTER_MODE=single_call, the explanation is a field of the structured output
+            "draft_writer": RetryableChain(
+                writer_prompt("draft_writer") | self.model.with_structured_output(CoverLetterDraft),
+                output_schema=CoverLetterDraft,
+            ),
+            "draft_editor": RetryableChain(
+                editor_prompt("draft_editor") | self.model.with_structured_output(CoverLetterDraft),
+                output_schema=CoverLetterDraft,
+            ),
+        }
+
+    def _create_graph(self):
+        def _prompt_inputs(state: CoverLetterState):
+            return {
+                **state,
+                "job_profile": model_to_prompt(state["job_profile"]),
+                "candidate_resume": model_to_prompt(state["candidate_resume"]),
+            }
+
+        def _draft_update(draft: CoverLetterDraft):
+            # The letter and its reasoning stay in the message history for later edits
+            cover_letter = CoverLetter.model_validate(draft.model_dump(exclude={"explanation"}))
+            message = AIMessage(
+                f"```json\n{model_to_str(cover_letter)}\n```\n\n**Explanation:**\n{draft.explanation}"
+            )
+            return {
+                "messages": [message],
+                "cover_letter": cover_letter,
+            }
+
+        def writer_node(state: CoverLetterState):
+            if COVER_LETTER_MODE == "single_call":
+                return _draft_update(self.chains["draft_writer"].invoke(_prompt_inputs(state)))
+            result = self.chains["writer"].invoke(_prompt_inputs(state))
+            cover_letter = self.chains["structured"].invoke([result])
+            return {
+                "messages": [result],
+                "cover_letter": cover_letter,
+            }
+
+        async def awriter_node(state: CoverLetterState):
+            if COVER_LETTER_MODE == "single_call":
+                return _draft_update(await self.chains["draft_writer"].ainvoke(_prompt_inputs(state)))
+            result = await self.chains["writer"].ainvoke(_prompt_inputs(state))
+            cover_letter = await self.chains["structured"].ainvoke([result])
             return {
                 "messages": [result],
                 "cover_letter": cover_letter,
             }
 
         def editor_node(state: CoverLetterState):
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", prompts["editor"]["system_message"]),
-                    MessagesPlaceholder("messages"),
-                    ("human", prompts["editor"]["prompt"]),
-                ]
-            )
-            chain = prompt | self.model
-            retryable_chain = RetryableChain(chain)
-            result = retryable_chain.invoke(state)
-            
-            structured_chain = self.model.with_structured_output(CoverLetter)
-            retryable_structured_chain = RetryableChain(structured_chain)
-            cover_letter = retryable_structured_chain.invoke([result])
-            
+            if COVER_LETTER_MODE == "single_call":
+                return _draft_update(self.chains["draft_editor"].invoke(_prompt_inputs(state)))
+            result = self.chains["editor"].invoke(_prompt_inputs(state))
+            cover_letter = self.chains["structured"].invoke([result])
+            return {
+                "messages": [result],
+                "cover_letter": cover_letter,
+            }
+
+        async def aeditor_node(state: CoverLetterState):
+            if COVER_LETTER_MODE == "single_call":
+                return _draft_update(await self.chains["draft_editor"].ainvoke(_prompt_inputs(state)))
+            result = await self.chains["editor"].ainvoke(_prompt_inputs(state))
+            cover_letter = await self.chains["structured"].ainvoke([result])
             return {
                 "messages": [result],
                 "cover_letter": cover_letter,
@@ -195,8 +315,8 @@ class CoverLetterWriter:
                 return END
 
         builder = StateGraph(CoverLetterState)
-        builder.add_node("writer_node", writer_node)
-        builder.add_node("editor_node", editor_node)
+        builder.add_node("writer_node", RunnableLambda(writer_node, afunc=awriter_node))
+        builder.add_node("editor_node", RunnableLambda(editor_node, afunc=aeditor_node))
         builder.add_node("human_node", human_node)
 
         builder.add_edge(START, "writer_node")
@@ -1,10 +1,14 @@
 from typing import Annotated
 import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, AnyMessage
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph import MessagesState
 from langgraph.types import interrupt, Command
@@ -12,14 +16,25 @@ from langgraph.checkpoint.memory import MemorySaver
 
 from resumetailor.models import JobProfile
 from resumetailor.llm.prompts import job_profile_prompts as prompts
-from resumetailor.services.utils import model_to_str, str_to_model
+from resumetailor.services.utils import model_to_str, str_to_model, model_to_prompt
 from resumetailor.services.retry import RetryableChain
+from resumetailor.services.tech_dictionary import tech_dictionary
+from resumetailor.services.boilerplate import strip_boilerplate
+from resumetailor.services.job_profile_cache import job_profile_cache
+from resumetailor.services.map_reduce import (
+    MAP_REDUCE_MAX_WORKERS,
+    needs_map_reduce,
+    split_job_description,
+    merge_job_profiles,
+)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class JobState(MessagesState):
-    job_description: Annotated[str, "The full job description text."]
+    job_description: Annotated[str, "The job description text without boilerplate."]
     job_profile: Annotated[
         JobProfile | None, "The extracted information from the job description."
     ]
@@ -36,6 +51,7 @@ class JobProfileExtractor:
 
     def __init__(self):
         self._create_model()
+        self._create_chains()
         self._create_graph()
 
     def _create_model(self):
@@ -44,39 +60,63 @@ class JobProfileExtractor:
             use_responses_api=True,
         ).with_structured_output(JobProfile)
 
+    def _create_chains(self):
+        extract_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", prompts["extractor"]["system_message"]),
+                ("human", prompts["extractor"]["prompt"]),
+            ]
+        )
+        edit_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", prompts["editor"]["system_message"]),
+                MessagesPlaceholder("messages"),
+                ("human", prompts["editor"]["prompt"]),
+            ]
+        )
+        self.chains = {
+            "extractor": RetryableChain(
+                extract_prompt | self.model_job_profile, output_schema=JobProfile
+            ),
+            "editor": RetryableChain(
+                edit_prompt | self.model_job_profile, output_schema=JobProfile
+            ),
+        }
+
     def _create_graph(self):
-        def extract_job_profile(state: JobState):
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", prompts["extractor"]["system_message"]),
-                    ("human", prompts["extractor"]["prompt"]),
-                ]
-            )
-            chain = prompt | self.model_job_profile
-            retryable_chain = RetryableChain(chain)
-            response = retryable_chain.invoke(state)
+        def _profile_update(response: JobProfile):
             message = AIMessage(
                 "Here is the extracted job profile:\n\n"
-                f"```json\n{model_to_str(response)}\n```"
+                f"```json\n{model_to_prompt(response)}\n```"
             )
             return {"job_profile": response, "messages": [message]}
 
-        def edit_job_profile(state: JobState):
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", prompts["editor"]["system_message"]),
-                    MessagesPlaceholder("messages"),
-                    ("human", prompts["editor"]["prompt"]),
-                ]
-            )
-            chain = prompt | self.model_job_profile
-            retryable_chain = RetryableChain(chain)
-            response = retryable_chain.invoke(state)
-            message = AIMessage(
-                "Here is the extracted job profile:\n\n"
-                f"```json\n{model_to_str(response)}\n```"
+        def extract_job_profile(state: JobState):
+            if state.get("job_profile") is not None:  # cached by extract()
+                return _profile_update(state["job_profile"])
+            chunks = self._chunk_inputs(state)
+            if chunks is None:
+                return _profile_update(self.chains["extractor"].invoke(state))
+            with ThreadPoolExecutor(max_workers=min(len(chunks), MAP_REDUCE_MAX_WORKERS)) as executor:
+                partials = list(executor.map(self.chains["extractor"].invoke, chunks))
+            return _profile_update(merge_job_profiles(partials))
+
+        async def aextract_job_profile(state: JobState):
+            if state.get("job_profile") is not None:  # cached by aextract()
+                return _profile_update(state["job_profile"])
+            chunks = self._chunk_inputs(state)
+            if chunks is None:
+                return _profile_update(await self.chains["extractor"].ainvoke(state))
+            partials = await self.chains["extractor"].abatch(
+                chunks, {"max_concurrency": MAP_REDUCE_MAX_WORKERS}
             )
-            return {"job_profile": response, "messages": [message]}
+            return _profile_update(merge_job_profiles(partials))
+
+        def edit_job_profile(state: JobState):
+            return _profile_update(self.chains["editor"].invoke(state))
+
+        async def aedit_job_profile(state: JobState):
+            return _profile_update(await self.chains["editor"].ainvoke(state))
 
         def human_node(state: JobState):
             result = interrupt(None)
@@ -91,7 +131,7 @@ class JobProfileExtractor:
                     "messages": [
                         {
                             "role": "user",
-                            "content": f"I updated the job profile to better fit my needs. \n\n**Job Profile:** \n{model_to_str(result['edited_job_profile'])}",
+                            "content": f"I updated the job profile to better fit my needs. \n\n**Job Profile:** \n{model_to_prompt(result['edited_job_profile'])}",
                         }
                     ],
                     "editing_suggestions": result["editing_suggestions"],
@@ -105,8 +145,14 @@ class JobProfileExtractor:
                 return END
 
         builder = StateGraph(JobState)
-        builder.add_node("extract_job_profile", extract_job_profile)
-        builder.add_node("edit_job_profile", edit_job_profile)
+        builder.add_node(
+            "extract_job_profile",
+            RunnableLambda(extract_job_profile, afunc=aextract_job_profile),
+        )
+        builder.add_node(
+            "edit_job_profile",
+            RunnableLambda(edit_job_profile, afunc=aedit_job_profile),
+        )
         builder.add_node("human_node", human_node)
 
         builder.add_edge(START, "extract_job_profile")
@@ -116,12 +162,74 @@ class JobProfileExtractor:
         checkpointer = MemorySaver()
         self.graph = builder.compile(checkpointer=checkpointer)
 
-    def extract(self, job_description: str, thread_id: str) -> JobProfile:
+    @staticmethod
+    def _chunk_inputs(state: JobState) -> list[dict] | None:
+        """Extractor inputs per chunk of a long job description, None if it fits one call."""
+        job_description = state["job_description"]
+        if not needs_map_reduce(job_description):
+            return None
+        chunks = split_job_description(job_description)
+        if len(chunks) < 2:
+            return None
+        logger.info(f"Extracting job profile from {len(chunks)} chunks in parallel")
+        return [{**state, "job_description": chunk} for chunk in chunks]
+
+    def draft(self, job_description: str) -> JobProfile:
+        """Draft job profile from a dictionary scan of the description, without an LLM call."""
+        return tech_dictionary.draft_job_profile(strip_boilerplate(job_description))
+
+    def extract(
+        self,
+        job_description: str,
+        thread_id: str,
+        job_profile: JobProfile | None = None,
+    ) -> JobProfile:
+        """
+        Extract the job profile, answered from the job profile cache when possible.
+
+        Args:
+            job_description: The job description text
+            thread_id: Conversation thread of the session
+            job_profile: A known profile (e.g. of a near-duplicate posting) used instead of extracting
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        cached = job_profile or job_profile_cache.get(job_description)
+        result = self.graph.invoke(
+            self._initial_state(job_description, cached), config=config
+        )
+        if cached is None:
+            job_profile_cache.set(job_description, result["job_profile"])
+        return result["job_profile"]
+
+    async def aextract(
+        self,
+        job_description: str,
+        thread_id: str,
+        job_profile: JobProfile | None = None,
+    ) -> JobProfile:
+        """Async variant of `extract`."""
         config = {"configurable": {"thread_id": thread_id}}
-        initial_state = JobState(job_description=job_description)
-        result = self.graph.invoke(initial_state, config=config)
+        cached = job_profile or await asyncio.to_thread(
+            job_profile_cache.get, job_description
+        )
+        result = await self.graph.ainvoke(
+            self._initial_state(job_description, cached), config=config
+        )
+        if cached is None:
+            await asyncio.to_thread(
+                job_profile_cache.set, job_description, result["job_profile"]
+            )
         return result["job_profile"]
 
+    @staticmethod
+    def _initial_state(job_description: str, cached: JobProfile | None) -> JobState:
+        if cached is not None:
+            logger.info("Job profile known, skipping extraction")
+        # Always set job_profile, so a profile left in the thread is not taken as cached
+        return JobState(
+            job_description=strip_boilerplate(job_description), job_profile=cached
+        )
+
     def edit(
         self,
         editing_suggestions: str,
@@ -130,13 +238,20 @@ class JobProfileExtractor:
     ) -> JobProfile:
         config = {"configurable": {"thread_id": thread_id}}
         result = self.graph.invoke(
-            Command(
-                resume={
-                    "edited_job_profile": edited_job_profile,
-                    "editing_suggestions": editing_suggestions,
-                    "done": False,
-                }
-            ),
+            self._resume_command(edited_job_profile, editing_suggestions, done=False),
+            config=config,
+        )
+        return result["job_profile"]
+
+    async def aedit(
+        self,
+        editing_suggestions: str,
+        thread_id: str,
+        edited_job_profile: JobProfile | None = None,
+    ) -> JobProfile:
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await self.graph.ainvoke(
+            self._resume_command(edited_job_profile, editing_suggestions, done=False),
             config=config,
         )
         return result["job_profile"]
@@ -146,13 +261,31 @@ class JobProfileExtractor:
     ) -> JobProfile:
         config = {"configurable": {"thread_id": thread_id}}
         result = self.graph.invoke(
-            Command(
-                resume={
-                    "edited_job_profile": edited_job_profile,
-                    "editing_suggestions": None,
-                    "done": True,
-                }
-            ),
+            self._resume_command(edited_job_profile, None, done=True),
             config=config,
         )
         return result["job_profile"]
+
+    async def acomplete(
+        self, thread_id: str, edited_job_profile: JobProfile | None = None
+    ) -> JobProfile:
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await self.graph.ainvoke(
+            self._resume_command(edited_job_profile, None, done=True),
+            config=config,
+        )
+        return result["job_profile"]
+
+    @staticmethod
+    def _resume_command(
+        edited_job_profile: JobProfile | None,
+        editing_suggestions: str | None,
+        done: bool,
+    ) -> Command:
+        return Command(
+            resume={
+                "edited_job_profile": edited_job_profile,
+                "editing_suggestions": editing_suggestions,
+                "done": done,
+            }
+        )
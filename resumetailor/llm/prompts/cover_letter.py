@@ -92,10 +92,110 @@ Review the previous messages and the user's editing suggestions below. Use the c
 Return the revised cover letter as a JSON object, strictly following the schema and only modifying what is necessary based on the user's input. After the JSON object, provide a clear explanation and reasoning for your edits: why you made the changes, how you aligned the letter with the job profile, resume, and user feedback, and how you matched the style/tone if a job description was provided.
 """
 
+# COVER_LETTER_MODE=single_call: the explanation is a field of the structured output
+draft_writer_system_message = """
+You are an expert career assistant and cover letter writer. Your task is to generate a concise, professional, and tailored cover letter for a job application, using the provided job profile and candidate resume. Your output must be structured as a JSON object matching the provided schema, with clear, well-written paragraphs for each section. Do not include any HTML or markdown in the cover letter itself.
+
+- The cover letter should have:
+    - An opening paragraph introducing the candidate and stating the position applied for.
+    - One or more body paragraphs highlighting relevant qualifications, experiences, and alignment with the job requirements and company values, as described in the job profile.
+    - A closing paragraph expressing enthusiasm and gratitude.
+- Use only the information present in the job_profile and candidate_resume. Do not invent, infer, or extrapolate any information beyond what is provided.
+- If a job_description is provided, use it only to match the writing style or tone, not for content. If present, you must carefully analyze the job_description and match the tone, formality, and style in your writing.
+- If information is missing, leave the relevant field empty or as an empty list.
+- Output must be valid JSON and compatible with the provided schema.
+- In the `explanation` field, provide a clear explanation and reasoning for your choices: why you structured the cover letter this way, how you aligned it with the job profile and resume, and how you matched the style/tone if a job description was provided.
+"""
+
+draft_writer_prompt_template = """
+Generate a cover letter for the following job application. Structure your output as a JSON object with the following fields:
+- opening_paragraph (string)
+- body_paragraphs (list of strings)
+- closing_paragraph (string)
+- explanation (string)
+
+**Instructions:**
+- Use only the information present in the job_profile and candidate_resume.
+- Do not invent, infer, or extrapolate any information beyond what is provided.
+- If job_description is provided, use it only to match the writing style or tone, not for content. If present, you must carefully analyze the job_description and match the tone, formality, and style in your writing.
+- Do not include any HTML or markdown in the cover letter itself.
+- Write clear, well-structured paragraphs for each section.
+- If a section is missing information, leave it empty or as an empty list.
+
+**Job Profile (JSON):**
+---
+```json
+{job_profile}
+```
+---
+
+**Candidate Resume (JSON):**
+---
+```json
+{candidate_resume}
+```
+---
+
+**Job Description (for style only, optional):**
+---
+{job_description}
+---
+
+In the `explanation` field, provide a clear explanation and reasoning for your choices: why you structured the cover letter this way, how you aligned it with the job profile and resume, and how you matched the style/tone if a job description was provided.
+"""
+
+draft_editor_system_message = """
+You are an expert cover letter editor. Your task is to review and refine the cover letter, using the message history containing previous versions and the user's editing suggestions. Focus on clarity, accuracy, and alignment with the user's intent. Only modify the cover letter as needed based on the feedback; leave other details unchanged. Ensure the output is well-structured, professionally formatted, and strictly follows the schema. Do not include any HTML or markdown in the cover letter itself.
+
+- Use only the information present in the job_profile and candidate_resume. Do not invent, infer, or extrapolate any information beyond what is provided.
+- If job_description is provided, use it only to match the writing style or tone, not for content. If present, you must carefully analyze the job_description and match the tone, formality, and style in your writing.
+- Output must be valid JSON and compatible with the provided schema.
+- In the `explanation` field, provide a clear explanation and reasoning for your edits: why you made the changes, how you aligned the letter with the job profile, resume, and user feedback, and how you matched the style/tone if a job description was provided.
+"""
+
+draft_editor_prompt = """
+Review the previous messages and the user's editing suggestions below. Use the cover letter in the last message as your starting point for revisions.
+
+**Guidelines:**
+- Carefully consider the user's editing suggestions and any directly edited cover letter.
+- Make only the changes necessary to address the feedback or edits; leave other details unchanged.
+- Ensure the final cover letter is clear, accurate, and professionally formatted according to the required schema.
+- If a section is not mentioned in the suggestions or edits, do not modify it.
+
+**Job Profile (JSON):**
+---
+```json
+{job_profile}
+```
+---
+
+**Candidate Resume (JSON):**
+---
+```json
+{candidate_resume}
+```
+---
+
+**Job Description (for style only, optional):**
+---
+{job_description}
+---
+
+**Editing Suggestions:**
+{editing_suggestions}
+
+Return the revised cover letter as a JSON object, strictly following the schema and only modifying what is necessary based on the user's input. In the `explanation` field, provide a clear explanation and reasoning for your edits: why you made the changes, how you aligned the letter with the job profile, resume, and user feedback, and how you matched the style/tone if a job description was provided.
+"""
+
 cover_letter_prompts = {
     "writer": {
         "system_message": writer_system_message,
         "prompt": writer_prompt_template,
     },
     "editor": {"system_message": editor_system_message, "prompt": editor_prompt},
+    "draft_writer": {
+        "system_message": draft_writer_system_message,
+        "prompt": draft_writer_prompt_template,
+    },
+    "draft_editor": {"system_message": draft_editor_system_message, "prompt": draft_editor_prompt},
 }
@@ -1,45 +1,26 @@
-# Prompts for resume compiler
+# Prompts for the LLM compiler of a single resume section (RESUME_COMPILE_MODE=llm)
 system_message = """
-You are a precise and reliable resume compiler. Your role is to transform a complete JSON resume to be compliant with the provided Pydantic schema.
+You are a precise and reliable resume compiler. Your role is to transform the {section_name} section of a JSON resume to be compliant with the provided Pydantic schema.
 
-- Only use the information explicitly present in the provided JSON resume.
+- Only use the information explicitly present in the provided JSON section.
 - Do not invent, infer, or extrapolate any data.
-- The input resume may contain additional keys that are not in the target schema - ignore these extra keys.
-- Map the relevant data from the input resume to the correct fields and structure as defined by the schema.
-- If a required field is missing in the input resume, leave it blank or omit it as required by the schema.
-- Do not add, merge, or modify content beyond what is present in the input resume.
+- The input section may contain additional keys that are not in the target schema - ignore these extra keys.
+- Map the relevant data from the input section to the correct fields and structure as defined by the schema.
+- If a required field is missing in the input section, leave it blank or omit it as required by the schema.
+- Do not add, merge, or modify content beyond what is present in the input section.
 - Your output must be fully compatible with the provided schema for structured output parsing.
-
-**Exception for professional_summary field:**
-If the schema includes a `professional_summary` field, write a single-paragraph summary (3–4 sentences) in third person, without mentioning the applicant’s name. Follow this order:
-1. Technical capabilities and projects: Start with current skills, technologies, and what the applicant can build.
-2. Certifications: Mention industry credentials or professional certifications.
-3. Work experience impact: Highlight achievements, measurable results, and current or recent roles.
-4. Educational foundation: End with academic background or relevant education.
-Use only information present in the resume. The summary should be professional, concise, and cohesive, matching the style of the provided examples.
 """
 
 prompt_template = """
-Transform the provided JSON resume to be compliant with the specified Pydantic schema.
+Transform the provided {section_name} section to be compliant with the specified Pydantic schema.
 
 **Instructions:**
-- Use only the information present in the provided JSON resume.
-- Map relevant fields from the input resume to the corresponding fields in the target schema.
-- Ignore any additional keys in the input resume that are not part of the target schema.
-- Do not create, infer, or modify any information.
-- If a required field is missing in the input, leave it blank or omit it as required by the schema.
-- Output only the schema-compliant resume in JSON format, with no extra commentary.
-
-**Special instruction for professional_summary (if present in schema):**
-Write a single-paragraph summary (3–4 sentences) in third person, without mentioning the applicant’s name. Follow this order:
-1. Technical capabilities and projects: Start with current skills, technologies, and what the applicant can build.
-2. Certifications: Mention industry credentials or professional certifications.
-3. Work experience impact: Highlight achievements, measurable results, and current or recent roles.
-4. Educational foundation: End with academic background or relevant education.
-Use only information present in the resume. The summary should be professional, concise, and cohesive, matching the style of the provided examples.
+- Keep every entry, in the original order.
+- Where the schema expects a single string but the input has a list, write the items as one cohesive sentence or a comma-separated list.
+- Output only the schema-compliant section in JSON format, with no extra commentary.
 
-**Input Resume:**
-{resume}
+**Input Section:**
+{section_data}
 """
 
 resume_compiler_prompts = {
@@ -0,0 +1,31 @@
+# Prompts for the professional summary, written concurrently with the resume sections
+system_message = """
+You are an expert resume writer. Your task is to write the professional summary that opens a candidate's refined resume.
+
+- Only use the information explicitly present in the provided JSON resume.
+- Emphasize the skills and experience most relevant to the target, if one is given.
+- Do not invent, infer, or extrapolate any data.
+"""
+
+prompt_template = """
+Write the professional summary for the resume below, tailored to the target.
+
+**Instructions:**
+Write a single-paragraph summary (3–4 sentences) in third person, without mentioning the applicant’s name. Follow this order:
+1. Technical capabilities and projects: Start with current skills, technologies, and what the applicant can build.
+2. Certifications: Mention industry credentials or professional certifications.
+3. Work experience impact: Highlight achievements, measurable results, and current or recent roles.
+4. Educational foundation: End with academic background or relevant education.
+Use only information present in the resume. The summary should be professional, concise, and cohesive.
+
+**Target:**
+{target}
+
+**Resume:**
+{resume}
+"""
+
+resume_summary_prompts = {
+    "system_message": system_message,
+    "prompt_template": prompt_template,
+}
@@ -0,0 +1,50 @@
+# Prompts for resume generation (with job profile), revising the section of a similar previous application
+system_message_template = """
+You are an expert HR consultant and advanced ATS-oriented resume writer. Your task is to update the {section_name} section of a candidate's resume, which was already refined for a very similar job, so that it aligns with the new job profile. Work exclusively with the candidate's JSON data.
+
+- Start from the previously refined section; it was reviewed by the candidate.
+- Change only what the differences between the previous and the new job profile require.
+- Do not create, infer, or extrapolate details beyond the candidate's JSON information.
+- Return the revised JSON in a single block, followed by a one-sentence explanation of the changes made.
+"""
+
+warm_start_prompt_template = """
+Update the previously refined {section_name} section for the new job profile below.
+
+**Instructions:**
+- Keep entries, wording and keywords that still fit the new job profile unchanged.
+- Add entries or details from the candidate's data that became relevant through the new requirements.
+- Remove or rephrase content that only served requirements that were removed.
+- Do not create, infer, or extrapolate details beyond the candidate's JSON information.
+
+**Changes to the Job Profile:**
+```json
+{job_profile_diff}
+```
+
+**New Job Profile:**
+```json
+{job_profile}
+```
+
+**Previously Refined Section:**
+```json
+{previous_section}
+```
+
+**Candidate's Data:**
+```json
+{candidate_data}
+```
+"""
+
+resume_writer_prompts = {
+    "system_message": system_message_template,
+    "education": warm_start_prompt_template,
+    "work_experience": warm_start_prompt_template,
+    "projects": warm_start_prompt_template,
+    "achievements": warm_start_prompt_template,
+    "certifications": warm_start_prompt_template,
+    "additional_skills": warm_start_prompt_template,
+    "publications": warm_start_prompt_template,
+}
@@ -1,6 +1,11 @@
 # app/services/gpt_resume.py
 import os
-from typing import Literal, TypeVar, Generic, Annotated, TypedDict
+import json
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, TypeVar, Generic, Annotated, TypedDict, AsyncIterator
 from pydantic import BaseModel, create_model, Field
 from dotenv import load_dotenv
 from rich import print
@@ -9,13 +14,23 @@ from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, AnyMessage
 from langchain.output_parsers import PydanticOutputParser
+from langchain_core.runnables import RunnableLambda
+from langchain_core.output_parsers import StrOutputParser
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import interrupt, Command, Send
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import MessagesState, add_messages
 
 
-from resumetailor.models import Resume, OutputResume, SectionType
+from resumetailor.models import (
+    Resume,
+    OutputResume,
+    PersonalInfo,
+    SectionType,
+    JobProfile,
+    to_output_resume,
+)
+from resumetailor.models.resume_mapping import OUTPUT_SECTION_MODELS, SECTION_MAPPERS
 from resumetailor.models.resume import (
     Degree,
     WorkPosition,
@@ -26,11 +41,35 @@ from resumetailor.models.resume import (
     Publication,
 )
 from resumetailor.llm.prompts import resume_prompts as prompts
-from resumetailor.services.utils import model_to_str
+from resumetailor.services.utils import model_to_str, model_to_prompt, prompt_token_savings
 from resumetailor.services.retry import RetryableChain, retry_with_exponential_backoff
+from resumetailor.services.relevance import filter_section
+from resumetailor.services.resume_index import resume_index_store
+from resumetailor.services.candidate_context import candidate_context_store
+from resumetailor.services.warm_start import WarmStart, job_profile_diff
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Output compilation: "mapping" (deterministic) or "llm" (one LLM call per section)
+RESUME_COMPILE_MODE = os.getenv("RESUME_COMPILE_MODE", "mapping")
+# Compile resumes awaiting review in the background, so completing them is instant
+SPECULATIVE_COMPILE = os.getenv("SPECULATIVE_COMPILE", "true").lower() == "true"
+# Threads with a speculative compilation; the oldest are dropped beyond it
+SPECULATIVE_COMPILE_MAX_THREADS = int(os.getenv("SPECULATIVE_COMPILE_MAX_THREADS", "32"))
+
+
+def _merge_sections(
+    current: dict[str, list] | None, update: dict[str, list] | None
+) -> dict[str, list] | None:
+    """Reducer of sections by section key, later sections replace earlier ones; an empty dict clears them."""
+    if update is None:
+        return current
+    if not update:
+        return {}
+    return {**(current or {}), **update}
+
 
 class ResumeState(TypedDict):
     """
@@ -59,6 +98,15 @@ class ResumeState(TypedDict):
         str | None,
         "A string with a list of focus aspects to adapt the resume to, if applicable.",
     ]
+    # Optional: If "refine_with_job" and a similar application was saved before
+    previous_sections: Annotated[
+        dict[str, list] | None,
+        "The refined sections of the most similar saved application, by section key, if applicable.",
+    ]
+    job_profile_diff: Annotated[
+        dict[str, dict] | None,
+        "The changes from the job profile of that application to the current one, if applicable.",
+    ]
     # filled by AI writers and editors
     education: Annotated[
         list[Degree] | None,
@@ -88,6 +136,20 @@ class ResumeState(TypedDict):
         list[Publication] | None,
         "The refined publications details of the candidate as JSON string.",
     ]
+    # filled by the summary writer, concurrently with the section writers
+    professional_summary: Annotated[
+        str | None,
+        "The professional summary of the candidate for the target, if written.",
+    ]
+    summary_key: Annotated[
+        str | None,
+        "Digest of the inputs the professional summary was written from, to detect a stale summary.",
+    ]
+    user_edited_sections: Annotated[
+        dict[str, list] | None,
+        "The sections the user replaced, by section key; they are candidate data for the summary.",
+        _merge_sections,
+    ]
     done: Annotated[
         bool, "Indicates whether the resume refinement process is complete."
     ] = False
@@ -98,6 +160,65 @@ class ResumeState(TypedDict):
 
 T = TypeVar("T", bound=BaseModel)
 
+
+class ProfessionalSummary(BaseModel):
+    """The professional summary on top of the compiled resume."""
+
+    professional_summary: str = Field(
+        description="Single-paragraph professional summary of the candidate (3-4 sentences)."
+    )
+
+
+def _digest(data) -> str:
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _compile_key(resume: Resume, professional_summary: str | None, summary_inputs: dict) -> str:
+    """
+    Hex SHA-256 digest of the content a compiled resume depends on.
+
+    Personal information is left out: it is copied to the output as it is, and
+    the API replaces it before completing.
+    """
+    data = resume.model_dump(mode="json", exclude={"personal_information"})
+    # Without a summary, the compiler writes one from the summary inputs
+    summary = professional_summary if professional_summary is not None else summary_inputs
+    return _digest([data, summary])
+
+
+def _log_speculative_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Speculative resume compilation failed: {task.exception()}")
+
+
+def _cancel_speculative(task: asyncio.Task):
+    """Cancel a speculative run from any thread (the sync API does not run in its event loop)."""
+    if task.done():
+        return
+    try:
+        task.get_loop().call_soon_threadsafe(task.cancel)
+    except RuntimeError:
+        # The event loop is closed, the task will never run again
+        pass
+
+
+def _relevant_entries(section_key: str, entries: list, job_profile: JobProfile | None) -> list:
+    """The entries of a section relevant to a job, ranked in the resume index if they are indexed."""
+    index = resume_index_store.get()
+    relevant = index.filter_section(section_key, entries, job_profile) if index is not None else None
+    return relevant if relevant is not None else filter_section(entries, job_profile)
+
+
+def _as_job_profile(job_profile: JobProfile | str | None) -> JobProfile | None:
+    """The job profile of the state as model (it may be passed as JSON string)."""
+    if job_profile is None or isinstance(job_profile, JobProfile):
+        return job_profile
+    try:
+        return JobProfile.model_validate_json(job_profile)
+    except ValueError:
+        return None
+
 # class Section(BaseModel, Generic[T]):
 #     section_data: list[T]
 
@@ -109,8 +230,11 @@ class SectionState(TypedDict, Generic[T]):
     editing_suggestions: str | None
     job_titles: str | None
     focus_aspects: str | None
+    previous_sections: dict[str, list] | None
+    job_profile_diff: dict[str, dict] | None
     section_messages: Annotated[list[AnyMessage], add_messages]
     section_data: list[T] | None
+    explanation: str | None
     edit: bool
 
 
@@ -127,7 +251,10 @@ class ResumeWriter:
             "additional_skills",
             "publications",
         ]
+        # Thread ID -> (compile key, task) of the speculative compilation of the resume under review
+        self._speculative_compiles: dict[str, tuple[str, asyncio.Task]] = {}
         self._create_model()
+        self._create_chains()
         self._create_graph()
 
     def generate(
@@ -137,6 +264,7 @@ class ResumeWriter:
         job_profile: str | None = None,
         job_titles: str | None = None,
         focus_aspects: str | None = None,
+        warm_start: WarmStart | None = None,
     ) -> Resume:
         """
         Generates a refined resume based on the provided full resume and either a job profile or a list of job titles/focus aspects.
@@ -147,43 +275,119 @@ class ResumeWriter:
             job_profile (str | None): The job profile to adapt the resume to, if applicable.
             job_titles (str | None): A string with a list of job titles to adapt the resume to, if applicable.
             focus_aspects (str | None): A string with a list of focus aspects to adapt the resume to, if applicable.
+            warm_start (WarmStart | None): The most similar saved application; its refined sections are
+                revised (or taken over if their inputs are unchanged) instead of written from scratch.
 
         Returns:
             Resume: The refined resume in structured format.
         """
-        if job_profile is None:
-            return self._generate_without_job(
-                thread_id, resume, job_titles or "", focus_aspects or ""
-            )
-        else:
-            return self._generate_with_job(thread_id, resume, job_profile)
-
-    def _generate_with_job(self, thread_id: str, resume: Resume, job_profile: str):
         config = {"configurable": {"thread_id": thread_id}}
-        initial_state = ResumeState(
-            full_resume=resume,
-            task="refine_with_job",
-            job_profile=job_profile,
-            done=False,
-            edit=False,
+        initial_state = self._initial_state(
+            resume, job_profile, job_titles, focus_aspects, warm_start
         )
         result = self.graph.invoke(initial_state, config=config)
         return result["__interrupt__"][0].value["refined_resume"]
 
-    def _generate_without_job(
-        self, thread_id: str, resume: Resume, job_titles: str, focus_aspects: str
-    ):
+    async def agenerate(
+        self,
+        thread_id: str,
+        resume: Resume,
+        job_profile: str | None = None,
+        job_titles: str | None = None,
+        focus_aspects: str | None = None,
+        warm_start: WarmStart | None = None,
+    ) -> Resume:
+        """Async variant of `generate`, running the section writers on the event loop."""
+        config = {"configurable": {"thread_id": thread_id}}
+        initial_state = self._initial_state(
+            resume, job_profile, job_titles, focus_aspects, warm_start
+        )
+        result = await self.graph.ainvoke(initial_state, config=config)
+        self._speculate_compile(thread_id, result)
+        return result["__interrupt__"][0].value["refined_resume"]
+
+    async def astream_generate(
+        self,
+        thread_id: str,
+        resume: Resume,
+        job_profile: str | None = None,
+        job_titles: str | None = None,
+        focus_aspects: str | None = None,
+        warm_start: WarmStart | None = None,
+    ) -> AsyncIterator[tuple[str, dict | Resume]]:
+        """
+        Streaming variant of `agenerate` that reports each section as soon as its writer finishes.
+
+        Args:
+            Same as `generate`.
+
+        Yields:
+            tuple[str, dict | Resume]: ("section", {"section_key", "section_data", "explanation"})
+                for every finished section, then ("resume", Resume) with the full refined resume.
+        """
         config = {"configurable": {"thread_id": thread_id}}
-        initial_state = ResumeState(
+        initial_state = self._initial_state(
+            resume, job_profile, job_titles, focus_aspects, warm_start
+        )
+        async for namespace, update in self.graph.astream(
+            initial_state, config=config, stream_mode="updates", subgraphs=True
+        ):
+            if namespace and "writer_node" in update:
+                # Namespace of a section subgraph: ("<section_key>_writer:<task_id>",)
+                section_key = namespace[0].split(":")[0].removesuffix("_writer")
+                yield "section", {
+                    "section_key": section_key,
+                    "section_data": update["writer_node"]["section_data"],
+                    "explanation": update["writer_node"]["explanation"],
+                }
+            elif not namespace and "__interrupt__" in update:
+                state = await self.graph.aget_state(config)
+                self._speculate_compile(thread_id, state.values)
+                yield "resume", update["__interrupt__"][0].value["refined_resume"]
+
+    def _initial_state(
+        self,
+        resume: Resume,
+        job_profile: str | None,
+        job_titles: str | None,
+        focus_aspects: str | None,
+        warm_start: WarmStart | None = None,
+    ) -> ResumeState:
+        if job_profile is None:
+            return ResumeState(
+                full_resume=resume,
+                task="refine_without_job",
+                job_titles=job_titles or "",
+                focus_aspects=focus_aspects or "",
+                **self._fresh_summary_state(),
+                done=False,
+                edit=False,
+            )
+        previous_sections, diff = None, None
+        current_profile = _as_job_profile(job_profile)
+        if warm_start is not None and current_profile is not None:
+            previous_sections = warm_start.previous_sections(resume)
+            diff = job_profile_diff(warm_start.job_profile, current_profile)
+            logger.info(
+                f"Warm start from application {warm_start.application_id}: "
+                f"{len(previous_sections)} reusable sections, "
+                f"{len(diff)} changed job profile fields"
+            )
+        return ResumeState(
             full_resume=resume,
-            task="refine_without_job",
-            job_titles=job_titles,
-            focus_aspects=focus_aspects,
+            task="refine_with_job",
+            job_profile=job_profile,
+            previous_sections=previous_sections,
+            job_profile_diff=diff,
+            **self._fresh_summary_state(),
             done=False,
             edit=False,
         )
-        result = self.graph.invoke(initial_state, config=config)
-        return result["__interrupt__"][0].value["refined_resume"]
+
+    @staticmethod
+    def _fresh_summary_state() -> dict:
+        # A new generation on the same thread starts without the summary and the user's sections of the last one
+        return {"professional_summary": None, "summary_key": None, "user_edited_sections": {}}
 
     def edit_section(
         self,
@@ -207,18 +411,42 @@ class ResumeWriter:
 
         config = {"configurable": {"thread_id": thread_id}}
         result = self.graph.invoke(
-            Command(
-                resume={
-                    "section_key": section_key,
-                    "editing_suggestions": editing_suggestions,
-                    "user_edited_section": user_edited_section,
-                    "done": False,
-                }
-            ),
+            self._edit_command(section_key, editing_suggestions, user_edited_section),
+            config=config,
+        )
+        return result[section_key]
+
+    async def aedit_section(
+        self,
+        thread_id: str,
+        section_key: str,
+        editing_suggestions: str,
+        user_edited_section: SectionType | None = None,
+    ) -> SectionType:
+        """Async variant of `edit_section`."""
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await self.graph.ainvoke(
+            self._edit_command(section_key, editing_suggestions, user_edited_section),
             config=config,
         )
+        self._speculate_compile(thread_id, result)
         return result[section_key]
 
+    @staticmethod
+    def _edit_command(
+        section_key: str,
+        editing_suggestions: str,
+        user_edited_section: SectionType | None,
+    ) -> Command:
+        return Command(
+            resume={
+                "section_key": section_key,
+                "editing_suggestions": editing_suggestions,
+                "user_edited_section": user_edited_section,
+                "done": False,
+            }
+        )
+
     def complete(
         self, thread_id: str, user_edited_resume: Resume | None = None
     ) -> OutputResume:
@@ -233,16 +461,108 @@ class ResumeWriter:
             Resume: The final refined resume in structured format.
         """
         config = {"configurable": {"thread_id": thread_id}}
-        result = self.graph.invoke(
-            Command(
-                resume={
-                    "done": True,
+        result = self.graph.invoke(Command(resume={"done": True}), config=config)
+        # Speculative runs belong to the event loop of the async API, they are not awaited here
+        self.discard_speculative_compile(thread_id)
+        return self._output_compiler(*self._completion(result, user_edited_resume))
+
+    async def acomplete(
+        self, thread_id: str, user_edited_resume: Resume | None = None
+    ) -> OutputResume:
+        """Async variant of `complete`."""
+        config = {"configurable": {"thread_id": thread_id}}
+        result = await self.graph.ainvoke(Command(resume={"done": True}), config=config)
+        return await self._acompile(thread_id, *self._completion(result, user_edited_resume))
+
+    def get_resume(self, thread_id: str) -> Resume:
+        """The refined resume of a thread, as structured sections before compilation."""
+        config = {"configurable": {"thread_id": thread_id}}
+        return Resume(**self.graph.get_state(config).values)
+
+    def _completion(
+        self, state: ResumeState, user_edited_resume: Resume | None = None
+    ) -> tuple[Resume, str | None, dict]:
+        """
+        The resume to compile from a graph state, with its summary if it is still up to date.
+
+        Sections the user changed in `user_edited_resume` are candidate data of
+        the summary too, so they make it stale unless the user kept them.
+
+        Returns:
+            tuple[Resume, str | None, dict]: The resume, its professional summary (None if it
+                has to be written), and the inputs of the summary writer
+        """
+        resume = Resume(**state)
+        user_edited_sections = dict(state.get("user_edited_sections") or {})
+        if user_edited_resume is not None:
+            user_edited_sections.update(
+                {
+                    section_key: getattr(user_edited_resume, section_key)
+                    for section_key in self.sections
+                    if getattr(user_edited_resume, section_key) != getattr(resume, section_key)
                 }
-            ),
-            config=config,
-        )
-        resume = Resume(**result) if user_edited_resume is None else user_edited_resume
-        return self._output_compiler(resume)
+            )
+            resume = user_edited_resume
+        summary_inputs = self._state_summary_inputs(state, user_edited_sections)
+        professional_summary = state.get("professional_summary")
+        if state.get("summary_key") != _digest(summary_inputs):
+            professional_summary = None
+        return resume, professional_summary, summary_inputs
+
+    def _speculate_compile(self, thread_id: str, state: ResumeState):
+        """
+        Start compiling the resume of a graph state awaiting review in the background.
+
+        Most reviews end without further edits, so `acomplete` can usually
+        return the result of this run. A run for a different resume of the
+        same thread is cancelled.
+        """
+        if not SPECULATIVE_COMPILE:
+            return
+        completion = self._completion(state)
+        key = _compile_key(*completion)
+        speculative = self._speculative_compiles.get(thread_id)
+        if speculative is not None:
+            if speculative[0] == key:
+                return
+            self.discard_speculative_compile(thread_id)
+        task = asyncio.create_task(self._aoutput_compiler(*completion))
+        task.add_done_callback(_log_speculative_failure)
+        self._speculative_compiles[thread_id] = (key, task)
+        # Threads abandoned without completing are dropped, oldest first
+        while len(self._speculative_compiles) > max(SPECULATIVE_COMPILE_MAX_THREADS, 1):
+            self.discard_speculative_compile(next(iter(self._speculative_compiles)))
+
+    def discard_speculative_compile(self, thread_id: str):
+        """Cancel and forget the speculative compilation of a thread, e.g. of a deleted session."""
+        speculative = self._speculative_compiles.pop(thread_id, None)
+        if speculative is not None:
+            _cancel_speculative(speculative[1])
+
+    async def _acompile(
+        self,
+        thread_id: str,
+        resume: Resume,
+        professional_summary: str | None,
+        summary_inputs: dict,
+    ) -> OutputResume:
+        """Compile a resume, reusing the speculative run of the thread if it compiled the same content."""
+        speculative = self._speculative_compiles.pop(thread_id, None)
+        if speculative is not None:
+            key, task = speculative
+            if key != _compile_key(resume, professional_summary, summary_inputs):
+                task.cancel()
+            else:
+                try:
+                    output_resume = await task
+                except Exception as e:
+                    logger.warning(f"Recompiling resume after failed speculative compilation: {e}")
+                else:
+                    logger.info(f"Using speculatively compiled resume of thread {thread_id}")
+                    return output_resume.model_copy(
+                        update={"personal_information": resume.personal_information or PersonalInfo()}
+                    )
+        return await self._aoutput_compiler(resume, professional_summary, summary_inputs)
 
     def _create_model(self):
         self.model = ChatOpenAI(
@@ -256,7 +576,8 @@ class ResumeWriter:
             for section in self.sections:
                 if getattr(state["full_resume"], section) is not None:
                     sections_to_write.append(f"{section}_writer")
-            return sections_to_write
+            # The summary only depends on the candidate data and the target, not on the written sections
+            return sections_to_write + ["summary_writer"]
 
         def human_node(state: ResumeState):
             result = interrupt({"refined_resume": Resume(**state)})
@@ -277,7 +598,7 @@ class ResumeWriter:
                     f"**{section_name.capitalize()}:**\n"
                     f"```json\n{model_to_str(result['user_edited_section'])}\n```"
                 )
-                return Send(
+                section_writer = Send(
                     node=f"{result['section_key']}_writer",
                     arg={
                         "section_messages": [user_message],
@@ -285,6 +606,37 @@ class ResumeWriter:
                         "edit": True,
                     },
                 )
+                # The user's section is candidate data, the summary writer checks whether it changed
+                return Command(
+                    update={"user_edited_sections": {result["section_key"]: result["user_edited_section"]}},
+                    goto=[section_writer, "summary_writer"],
+                )
+
+        def summary_writer(state: ResumeState):
+            """Writes the professional summary, unless it is up to date."""
+            summary_inputs = self._state_summary_inputs(state)
+            summary_key = _digest(summary_inputs)
+            if summary_key == state.get("summary_key"):
+                return {}
+            try:
+                summary = self.chains["summary"].invoke(summary_inputs)
+            except Exception as e:
+                # Written again when the resume is compiled
+                logger.warning(f"Writing the professional summary failed: {e}")
+                return {}
+            return {"professional_summary": summary.professional_summary, "summary_key": summary_key}
+
+        async def asummary_writer(state: ResumeState):
+            summary_inputs = self._state_summary_inputs(state)
+            summary_key = _digest(summary_inputs)
+            if summary_key == state.get("summary_key"):
+                return {}
+            try:
+                summary = await self.chains["summary"].ainvoke(summary_inputs)
+            except Exception as e:
+                logger.warning(f"Writing the professional summary failed: {e}")
+                return {}
+            return {"professional_summary": summary.professional_summary, "summary_key": summary_key}
 
         def end_router(state: ResumeState):
             if not state["done"]:
@@ -320,6 +672,7 @@ class ResumeWriter:
             "publications_writer",
             self._create_section_module("publications", Publication),
         )
+        builder.add_node("summary_writer", RunnableLambda(summary_writer, afunc=asummary_writer))
         builder.add_node("human_node", human_node)
         builder.add_node("end_router", end_router)
 
@@ -332,6 +685,7 @@ class ResumeWriter:
         builder.add_edge("certifications_writer", "end_router")
         builder.add_edge("additional_skills_writer", "end_router")
         builder.add_edge("publications_writer", "end_router")
+        builder.add_edge("summary_writer", "end_router")
 
         checkpointer = MemorySaver()
         self.graph = builder.compile(checkpointer=checkpointer)
@@ -359,49 +713,132 @@ class ResumeWriter:
             {"T": SectionModel},
         )
 
-        def writer_node(state: ThisSectionState):
-            """Writes a single section of the resume based on the provided data."""
-            system_message = prompts["writer"][state["task"]]["system_message"]
-            section_prompt = prompts["writer"][state["task"]][section_key]
-            prompt = ChatPromptTemplate.from_messages(
-                [("system", system_message), ("human", section_prompt)]
-            )
-            chain = prompt | self.model.with_structured_output(ThisSection)
-            retryable_chain = RetryableChain(chain)
-            additional_data = {
-                "section_name": section_key,
-                "candidate_data": "\n".join(
+        # Built once per section: one writer chain per task, one editor chain
+        writer_chains = {
+            task: RetryableChain(
+                ChatPromptTemplate.from_messages(
                     [
-                        model_to_str(entry)
-                        for entry in getattr(state["full_resume"], section_key)
+                        ("system", task_prompts["system_message"]),
+                        ("human", task_prompts[section_key]),
                     ]
-                ),
-            }
-            result = retryable_chain.invoke({**state, **additional_data})
-            message = AIMessage(
-                f"```json\n{result.section_data}\n```\n\n**Explanation of Changes:**\n{result.explanation}"
+                )
+                | self.model.with_structured_output(ThisSection),
+                output_schema=ThisSection,
             )
-            return {"section_messages": [message], "section_data": result.section_data}
-
-        def editor_node(state: ThisSectionState):
-            """Edits a single section, based on user edits and suggestions."""
-            prompt = ChatPromptTemplate.from_messages(
+            for task, task_prompts in prompts["writer"].items()
+        }
+        editor_chain = RetryableChain(
+            ChatPromptTemplate.from_messages(
                 [
                     ("system", prompts["section_editor"]["system_message"]),
                     MessagesPlaceholder("section_messages"),
                     ("human", prompts["section_editor"]["prompt"]),
                 ]
             )
-            chain = prompt | self.model.with_structured_output(ThisSection)
-            retryable_chain = RetryableChain(chain)
+            | self.model.with_structured_output(ThisSection),
+            output_schema=ThisSection,
+        )
+        self.chains[("writer", section_key)] = writer_chains
+        self.chains[("editor", section_key)] = editor_chain
+
+        def _previous_section(state: ThisSectionState) -> list | None:
+            """The refined section of the warm-start application, if any."""
+            if state["task"] != "refine_with_job":
+                return None
+            return (state.get("previous_sections") or {}).get(section_key)
+
+        def _writer_task(state: ThisSectionState) -> str:
+            return "warm_start" if _previous_section(state) is not None else state["task"]
+
+        def _reused_section(state: ThisSectionState):
+            """The warm-start section, if neither its resume section nor the job profile changed."""
+            previous = _previous_section(state)
+            if previous is None or state.get("job_profile_diff"):
+                return None
+            logger.info(f"{section_key}: inputs unchanged since the warm-start application, reusing it")
+            return ThisSection(
+                section_data=previous,
+                explanation="Taken over from a previous application to the same job profile.",
+            )
+
+        def _candidate_data(state: ThisSectionState) -> str:
+            entries = getattr(state["full_resume"], section_key)
+            # Precomputed for the stored full resume, serialized here for any other resume
+            context = candidate_context_store.section(section_key, entries)
+            if context is not None:
+                entries = context.entries
+            if state["task"] == "refine_with_job":
+                relevant = _relevant_entries(
+                    section_key, entries, _as_job_profile(state.get("job_profile"))
+                )
+                if len(relevant) < len(entries):
+                    logger.info(
+                        f"{section_key}: kept {len(relevant)} of {len(entries)} entries relevant to the job"
+                    )
+                entries = relevant
+            if context is None:
+                if logger.isEnabledFor(logging.INFO):
+                    tokens, saved = prompt_token_savings(entries)
+                    logger.info(
+                        f"{section_key} candidate data: {tokens} tokens ({saved} saved by compact serialization)"
+                    )
+                return "\n".join([model_to_prompt(entry) for entry in entries])
+            condensed = candidate_context_store.condensed_data(context)
+            if condensed is not None and len(entries) == len(context.entries):
+                logger.info(f"{section_key} candidate data: condensed digest of {context.tokens} tokens")
+                return condensed
+            candidate_data, tokens = context.serialize(entries)
+            logger.info(f"{section_key} candidate data: {tokens} tokens (precomputed)")
+            return candidate_data
+
+        def _writer_inputs(state: ThisSectionState):
             additional_data = {
                 "section_name": section_key,
+                "candidate_data": _candidate_data(state),
+                "job_profile": model_to_prompt(state.get("job_profile")),
             }
-            result = retryable_chain.invoke({**state, **additional_data})
+            previous = _previous_section(state)
+            if previous is not None:
+                additional_data["previous_section"] = model_to_prompt(previous)
+                additional_data["job_profile_diff"] = json.dumps(
+                    state["job_profile_diff"], ensure_ascii=False
+                )
+            return {**state, **additional_data}
+
+        def _editor_inputs(state: ThisSectionState):
+            return {**state, "section_name": section_key}
+
+        def _section_update(result):
             message = AIMessage(
                 f"```json\n{result.section_data}\n```\n\n**Explanation of Changes:**\n{result.explanation}"
             )
-            return {"section_messages": [message], "section_data": result.section_data}
+            return {
+                "section_messages": [message],
+                "section_data": result.section_data,
+                "explanation": result.explanation,
+            }
+
+        def writer_node(state: ThisSectionState):
+            """Writes a single section of the resume based on the provided data."""
+            result = _reused_section(state)
+            if result is None:
+                result = writer_chains[_writer_task(state)].invoke(_writer_inputs(state))
+            return _section_update(result)
+
+        async def awriter_node(state: ThisSectionState):
+            """Async variant of `writer_node`, backing off without holding a thread."""
+            result = _reused_section(state)
+            if result is None:
+                result = await writer_chains[_writer_task(state)].ainvoke(_writer_inputs(state))
+            return _section_update(result)
+
+        def editor_node(state: ThisSectionState):
+            """Edits a single section, based on user edits and suggestions."""
+            return _section_update(editor_chain.invoke(_editor_inputs(state)))
+
+        async def aeditor_node(state: ThisSectionState):
+            """Async variant of `editor_node`."""
+            return _section_update(await editor_chain.ainvoke(_editor_inputs(state)))
 
         def route_to_parent(state: ThisSectionState):
             return Command(
@@ -411,8 +848,8 @@ class ResumeWriter:
             )
 
         builder = StateGraph(ThisSectionState)
-        builder.add_node("writer_node", writer_node)
-        builder.add_node("editor_node", editor_node)
+        builder.add_node("writer_node", RunnableLambda(writer_node, afunc=awriter_node))
+        builder.add_node("editor_node", RunnableLambda(editor_node, afunc=aeditor_node))
         builder.add_node("route_to_parent", route_to_parent)
 
         builder.add_conditional_edges(
@@ -425,16 +862,212 @@ class ResumeWriter:
 
         return graph
 
-    def _output_compiler(self, resume: Resume) -> OutputResume:
-        system_message = prompts["compiler"]["system_message"]
-        prompt_template = prompts["compiler"]["prompt_template"]
-        prompt = ChatPromptTemplate.from_messages(
-            [("system", system_message), ("human", prompt_template)]
+    def _create_chains(self):
+        """Build the chains that do not belong to a section module (compiled once)."""
+        self.chains = {}
+        summary_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", prompts["summary"]["system_message"]),
+                ("human", prompts["summary"]["prompt_template"]),
+            ]
+        )
+        self.chains["summary"] = RetryableChain(
+            summary_prompt | self.model.with_structured_output(ProfessionalSummary),
+            output_schema=ProfessionalSummary,
+        )
+        compiler_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", prompts["compiler"]["system_message"]),
+                ("human", prompts["compiler"]["prompt_template"]),
+            ]
+        )
+        for section_key, OutputModel in OUTPUT_SECTION_MODELS.items():
+            OutputSection = create_model(
+                f"Output{OutputModel.__name__}Section",
+                section_data=Annotated[
+                    list[OutputModel],
+                    Field(description="The compiled section data, one item per input entry."),
+                ],
+            )
+            self.chains[("compiler", section_key)] = RetryableChain(
+                compiler_prompt | self.model.with_structured_output(OutputSection),
+                output_schema=OutputSection,
+            )
+        condenser_prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", prompts["condenser"]["system_message"]),
+                ("human", prompts["condenser"]["prompt_template"]),
+            ]
+        )
+        self.chains["condenser"] = RetryableChain(
+            condenser_prompt | self.model | StrOutputParser()
+        )
+
+    async def acondense_candidate_data(self) -> int:
+        """
+        Condense the full resume sections above CANDIDATE_DIGEST_THRESHOLD_TOKENS with the LLM.
+
+        Only sections without an up-to-date digest are sent, so this is a no-op
+        until a long section of the full resume changes.
+
+        Returns:
+            int: Number of condensed sections
+        """
+        sections = candidate_context_store.to_condense()
+        if not sections:
+            return 0
+        results = await self.chains["condenser"].abatch(
+            [
+                {"section_name": section.section, "candidate_data": section.candidate_data}
+                for section in sections
+            ]
+        )
+        for section, condensed in zip(sections, results):
+            candidate_context_store.set_condensed(section, condensed)
+        return len(sections)
+
+    @staticmethod
+    def _summary_inputs(resume: Resume, target: str = "") -> dict:
+        # The summary never mentions the candidate, so personal information is left out
+        return {
+            "resume": model_to_prompt(resume.model_copy(update={"personal_information": None})),
+            "target": target or "Not specified, write a general summary.",
+        }
+
+    def _state_summary_inputs(
+        self, state: ResumeState, user_edited_sections: dict[str, list] | None = None
+    ) -> dict:
+        """
+        Summary inputs from the candidate data and the target of a graph state.
+
+        The candidate data is the full resume, reduced to the entries relevant to
+        the job like the writers' data, with the sections the user replaced.
+        """
+        if user_edited_sections is None:
+            user_edited_sections = state.get("user_edited_sections") or {}
+        full_resume = state["full_resume"]
+        job_profile = _as_job_profile(state.get("job_profile"))
+        sections = {}
+        for section_key in self.sections:
+            if section_key in user_edited_sections:
+                sections[section_key] = user_edited_sections[section_key]
+            elif (entries := getattr(full_resume, section_key)) is not None:
+                if state["task"] == "refine_with_job":
+                    entries = _relevant_entries(section_key, entries, job_profile)
+                sections[section_key] = entries
+        if state["task"] == "refine_with_job":
+            target = f"Job profile: {model_to_prompt(state.get('job_profile'))}"
+        else:
+            target = "\n".join(
+                f"{label}: {value}"
+                for label, value in (
+                    ("Job titles", state.get("job_titles")),
+                    ("Focus aspects", state.get("focus_aspects")),
+                )
+                if value
+            )
+        return self._summary_inputs(Resume(**sections), target)
+
+    def _summary(self, professional_summary: str | None, summary_inputs: dict) -> str:
+        if professional_summary is not None:
+            return professional_summary
+        return self.chains["summary"].invoke(summary_inputs).professional_summary
+
+    async def _asummary(self, professional_summary: str | None, summary_inputs: dict) -> str:
+        if professional_summary is not None:
+            return professional_summary
+        return (await self.chains["summary"].ainvoke(summary_inputs)).professional_summary
+
+    @staticmethod
+    def _compiler_inputs(resume: Resume) -> dict[str, dict]:
+        """Prompt inputs of the compiler of every non-empty section."""
+        return {
+            section_key: {"section_name": section_key, "section_data": model_to_prompt(entries)}
+            for section_key in SECTION_MAPPERS
+            if (entries := getattr(resume, section_key))
+        }
+
+    @staticmethod
+    def _assemble(
+        resume: Resume, professional_summary: str, compiled: dict[str, BaseModel | BaseException]
+    ) -> OutputResume:
+        """
+        Put the compiled sections into the mapped resume and validate it.
+
+        Sections whose compiler failed (or returned a different number of
+        entries) keep their deterministic mapping.
+        """
+        output_resume = to_output_resume(resume, professional_summary)
+        sections = dict(output_resume)
+        for section_key, result in compiled.items():
+            if isinstance(result, BaseException):
+                logger.warning(f"Compiling {section_key} failed, using its mapping: {result}")
+            elif len(result.section_data) != len(getattr(resume, section_key)):
+                logger.warning(f"Compiling {section_key} changed the number of entries, using its mapping")
+            else:
+                sections[section_key] = result.section_data
+        return OutputResume.model_validate(sections)
+
+    def _output_compiler(
+        self,
+        resume: Resume,
+        professional_summary: str | None = None,
+        summary_inputs: dict | None = None,
+    ) -> OutputResume:
+        """
+        Compile the resume into the output schema.
+
+        In "mapping" mode the sections are mapped deterministically. In "llm"
+        mode every non-empty section is compiled by its own LLM call,
+        concurrently, so the latency is that of the largest section. The
+        professional summary usually comes from the graph's summary writer; it
+        is only written here (from `summary_inputs`, or the resume itself) when
+        it is missing.
+        """
+        summary_inputs = summary_inputs or self._summary_inputs(resume)
+        if RESUME_COMPILE_MODE != "llm":
+            return to_output_resume(resume, self._summary(professional_summary, summary_inputs))
+        inputs = self._compiler_inputs(resume)
+        with ThreadPoolExecutor(max_workers=len(inputs) + 1) as executor:
+            summary = executor.submit(self._summary, professional_summary, summary_inputs)
+            futures = {
+                section_key: executor.submit(self.chains[("compiler", section_key)].invoke, section_inputs)
+                for section_key, section_inputs in inputs.items()
+            }
+            compiled = {}
+            for section_key, future in futures.items():
+                try:
+                    compiled[section_key] = future.result()
+                except Exception as e:
+                    compiled[section_key] = e
+            return self._assemble(resume, summary.result(), compiled)
+
+    async def _aoutput_compiler(
+        self,
+        resume: Resume,
+        professional_summary: str | None = None,
+        summary_inputs: dict | None = None,
+    ) -> OutputResume:
+        """Async variant of `_output_compiler`."""
+        summary_inputs = summary_inputs or self._summary_inputs(resume)
+        if RESUME_COMPILE_MODE != "llm":
+            return to_output_resume(resume, await self._asummary(professional_summary, summary_inputs))
+        inputs = self._compiler_inputs(resume)
+        summary, *results = await asyncio.gather(
+            self._asummary(professional_summary, summary_inputs),
+            *(
+                self.chains[("compiler", section_key)].ainvoke(section_inputs)
+                for section_key, section_inputs in inputs.items()
+            ),
+            return_exceptions=True,
         )
-        chain = prompt | self.model.with_structured_output(OutputResume)
-        retryable_chain = RetryableChain(chain)
-        output_resume = retryable_chain.invoke({"resume": resume})
-        return output_resume
+        # A cancelled call (or any other non-Exception) is not a failed section, it stops the compilation
+        for result in (summary, *results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        if isinstance(summary, Exception):
+            raise summary
+        return self._assemble(resume, summary, dict(zip(inputs, results)))
 
     def _create_resume_editor(self):
         # TODO: create the editor for the whole resume
@@ -1,16 +1,25 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pathlib import Path
 import uvicorn
 
 from resumetailor.api.application import router as application_router
 from resumetailor.api.job_profile import router as job_profile_router
-from resumetailor.api.resume import router as resume_router
+from resumetailor.api.resume import router as resume_router, schedule_candidate_condensing
 from resumetailor.api.cover_letter import router as cover_letter_router
 from resumetailor.api.data import router as data_router
 from resumetailor.core.constants import BASE_DATA_DIR
 from resumetailor.services.convert_resume import convert_resume
+from resumetailor.services.retry import CircuitOpenError, circuit_breakers
+from resumetailor.services.resume_index import resume_index_store
+from resumetailor.services.fit_score import keyword_index_store
+from resumetailor.services.candidate_context import candidate_context_store
+from resumetailor.services.boilerplate import boilerplate_stripper
+from resumetailor.services.job_profile_cache import job_profile_cache
+from resumetailor.services.near_duplicates import near_duplicate_index
+from resumetailor.services.warm_start import warm_start_index
 
 
 @asynccontextmanager
@@ -28,6 +37,43 @@ async def lifespan(app: FastAPI):
     else:
         print(f"⚠️ YAML resume file not found: {yaml_file}")
 
+    # Vectorize the full resume once (rebuilt on access when the file changes)
+    try:
+        resume_index = resume_index_store.get()
+        if resume_index is not None:
+            print(f"✅ Indexed {len(resume_index)} resume entries")
+        keyword_index_store.get()
+        candidate_context = candidate_context_store.get()
+        if candidate_context is not None:
+            print(f"✅ Serialized {len(candidate_context.sections)} resume sections for the writers")
+        schedule_candidate_condensing()
+    except Exception as e:
+        print(f"⚠️ Failed to index resume on startup: {e}")
+
+    # Learn recurring boilerplate lines from saved job descriptions
+    try:
+        boilerplate_stripper.learn_from_history(BASE_DATA_DIR)
+    except Exception as e:
+        print(f"⚠️ Failed to learn boilerplate from saved job descriptions: {e}")
+
+    # Reuse the job profiles of saved applications for repeated postings
+    try:
+        seeded = job_profile_cache.seed_from_history(BASE_DATA_DIR)
+        if seeded:
+            print(f"✅ Seeded job profile cache with {seeded} saved profiles")
+    except Exception as e:
+        print(f"⚠️ Failed to seed job profile cache: {e}")
+    try:
+        near_duplicate_index.build_from_history(BASE_DATA_DIR)
+    except Exception as e:
+        print(f"⚠️ Failed to index saved job descriptions: {e}")
+
+    # Warm-start resume tailoring from the most similar saved application
+    try:
+        warm_start_index.build_from_history(BASE_DATA_DIR)
+    except Exception as e:
+        print(f"⚠️ Failed to index saved job profiles: {e}")
+
     yield
 
     # Shutdown: Add any cleanup logic here if needed
@@ -40,7 +86,27 @@ app = FastAPI(lifespan=lifespan)
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "resumetailor-api"}
+    breakers = {name: cb.snapshot() for name, cb in circuit_breakers.items()}
+    status = (
+        "degraded"
+        if any(b["state"] != "closed" for b in breakers.values())
+        else "healthy"
+    )
+    return {
+        "status": status,
+        "service": "resumetailor-api",
+        "circuit_breakers": breakers,
+    }
+
+
+# Fail fast while a dependency's circuit is open
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
 
 
 # Allow frontend (localhost:3000) to call the API during development
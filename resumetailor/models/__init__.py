@@ -2,5 +2,7 @@
 from .job_profile import JobProfile
 from .resume import Resume, SectionType, PersonalInfo
 from .output_resume import OutputResume
+from .resume_mapping import to_output_resume
 from .cover_letter import CoverLetter
+from .fit_score import FitScore, KeywordCoverage
 from .personal_info import PersonalInfo
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class KeywordCoverage(BaseModel):
+    """Which requirements of one job profile category the full resume covers."""
+
+    covered: list[str] = Field(
+        default_factory=list, description="Requirements found in the resume."
+    )
+    missing: list[str] = Field(
+        default_factory=list, description="Requirements not found in the resume."
+    )
+    coverage: float = Field(
+        0.0, description="Share of covered requirements (0 to 1)."
+    )
+
+
+class FitScore(BaseModel):
+    """Keyword-based fit of the full resume for a job, computed without an LLM."""
+
+    fit_score: float = Field(
+        ..., description="Weighted coverage over all categories (0 to 1)."
+    )
+    required_technologies: KeywordCoverage = Field(default_factory=KeywordCoverage)
+    technical_skills: KeywordCoverage = Field(default_factory=KeywordCoverage)
+    certifications: KeywordCoverage = Field(default_factory=KeywordCoverage)
@@ -0,0 +1,189 @@
+"""
+Deterministic mapping of a refined `Resume` to the `OutputResume` rendered by ResumeGen.
+
+The output schema is a flattened form of the resume: list fields become
+single strings, keywords and grading systems are dropped, and the courses
+and projects of a degree become `EduCourseProject`s. Only the professional
+summary needs to be written, which is left to the caller.
+"""
+import re
+
+from pydantic import BaseModel
+
+from resumetailor.models import output_resume as output
+from resumetailor.models import resume as source
+from resumetailor.models.output_resume import OutputResume
+from resumetailor.models.personal_info import PersonalInfo
+from resumetailor.models.resume import Resume
+
+# List items with more words than this are joined as sentences, shorter ones as a comma-separated list
+MAX_LIST_ITEM_WORDS = 4
+
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+_END_PUNCTUATION = (".", "!", "?", ":", ";")
+
+
+def _sentence(text: str) -> str:
+    return text if text.endswith(_END_PUNCTUATION) else f"{text}."
+
+
+def join_text(value: str | list[str] | None) -> str | None:
+    """
+    A text field of the output schema from a string or a list of strings.
+
+    Lists of short items ("Python", "Docker") are joined with commas, lists
+    of sentences are joined as sentences. Empty values become None.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.strip() or None
+    items = [item.strip() for item in value if item and item.strip()]
+    if not items:
+        return None
+    if all(len(item.split()) <= MAX_LIST_ITEM_WORDS for item in items):
+        return ", ".join(items)
+    return " ".join(_sentence(item) for item in items)
+
+
+def publication_year(date: str | None) -> str | None:
+    """The four-digit year of a publication date (e.g. "March 2023" -> "2023")."""
+    if not date:
+        return None
+    match = _YEAR_PATTERN.search(date)
+    return match.group(0) if match else None
+
+
+def _course_or_project(entry: source.EduCourse | source.EduProject) -> output.EduCourseProject:
+    return output.EduCourseProject(name=entry.name, grade=entry.grade)
+
+
+def _courses_or_projects(entries: list[BaseModel] | None) -> list[output.EduCourseProject] | None:
+    return [_course_or_project(entry) for entry in entries] if entries else None
+
+
+def map_degree(degree: source.Degree) -> output.Degree:
+    return output.Degree(
+        degree=degree.degree,
+        institution=degree.institution,
+        field_of_study=degree.field_of_study,
+        final_evaluation_grade=degree.final_evaluation_grade,
+        honors=degree.honors,
+        start_year=degree.start_year,
+        year_of_completion=degree.year_of_completion,
+        courses=_courses_or_projects(degree.courses),
+        projects=_courses_or_projects(degree.projects),
+    )
+
+
+def map_work_position(position: source.WorkPosition) -> output.WorkPosition:
+    return output.WorkPosition(
+        job_title=position.job_title,
+        company=position.company or "",
+        employment_type=position.employment_type,
+        employment_period=position.employment_period or "",
+        location=position.location,
+        responsibilities=join_text(position.responsibilities),
+        acquired_skills=join_text(position.acquired_skills),
+        achievements=join_text(position.achievements),
+    )
+
+
+def map_project(project: source.Project) -> output.Project:
+    return output.Project(
+        name=project.name,
+        link=project.link,
+        platform=project.platform,
+        description=join_text(project.description),
+        acquired_skills=join_text(project.acquired_skills),
+        achievements=join_text(project.achievements),
+    )
+
+
+def map_achievement(achievement: source.Achievement) -> output.Achievement:
+    return output.Achievement(
+        title=achievement.title,
+        description=join_text(achievement.description) or "",
+        relevance=join_text(achievement.relevance),
+    )
+
+
+def map_certification(certification: source.Certification) -> output.Certification:
+    return output.Certification(
+        name=certification.name,
+        issuing_organization=certification.issuing_organization,
+        link=certification.link,
+        description=join_text(certification.description),
+        acquired_skills=join_text(certification.acquired_skills),
+    )
+
+
+def map_publication(publication: source.Publication) -> output.Publication:
+    return output.Publication(
+        title=publication.title,
+        authors=publication.authors,
+        publisher=publication.publisher,
+        publication_year=publication_year(publication.publication_date),
+        link=publication.link,
+        description=join_text(publication.description),
+        acquired_skills=join_text(publication.acquired_skills),
+    )
+
+
+def map_skill_category(category: source.SkillCategory) -> output.SkillCategory:
+    return output.SkillCategory(
+        category=category.category,
+        specific_skills=[
+            output.Skill(name=skill.name, proficiency=skill.proficiency)
+            for skill in category.specific_skills or []
+        ],
+    )
+
+
+# Resume section -> mapper of one of its entries
+SECTION_MAPPERS = {
+    "education": map_degree,
+    "work_experience": map_work_position,
+    "projects": map_project,
+    "achievements": map_achievement,
+    "certifications": map_certification,
+    "additional_skills": map_skill_category,
+    "publications": map_publication,
+}
+
+
+# Resume section -> output model of one of its entries
+OUTPUT_SECTION_MODELS = {
+    "education": output.Degree,
+    "work_experience": output.WorkPosition,
+    "projects": output.Project,
+    "achievements": output.Achievement,
+    "certifications": output.Certification,
+    "additional_skills": output.SkillCategory,
+    "publications": output.Publication,
+}
+
+
+def to_output_resume(
+    resume: Resume, professional_summary: str | list[str] | None = None
+) -> OutputResume:
+    """
+    Map a refined resume to the output schema, without any LLM call.
+
+    Args:
+        resume: The refined resume
+        professional_summary: The summary to put on top of the resume, if any
+
+    Returns:
+        OutputResume: The resume in the schema rendered by ResumeGen
+    """
+    sections = {}
+    for section, mapper in SECTION_MAPPERS.items():
+        entries = getattr(resume, section)
+        if entries is not None:
+            sections[section] = [mapper(entry) for entry in entries]
+    return OutputResume(
+        personal_information=resume.personal_information or PersonalInfo(),
+        professional_summary=professional_summary,
+        **sections,
+    )
@@ -0,0 +1,216 @@
+"""
+Removal of boilerplate from job descriptions before they are sent to the LLM.
+
+Pasted postings often carry benefits, company history, equal opportunity
+statements and cookie banners that do not help the extraction and only add
+prompt tokens. Lines are dropped when they fall under a boilerplate heading
+("Benefits", "About us", ...), open or contain a boilerplate phrase, or were seen
+verbatim in several previously saved postings (learned phrases). The original
+description is never modified; callers keep it for storage.
+"""
+import os
+import re
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.services.utils import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Boilerplate stripping configuration
+BOILERPLATE_STRIPPING = os.getenv("BOILERPLATE_STRIPPING", "true").lower() == "true"
+# Saved postings a line must appear in before it is learned as boilerplate
+BOILERPLATE_MIN_POSTINGS = int(os.getenv("BOILERPLATE_MIN_POSTINGS", "3"))
+
+# Headings that start a boilerplate section, which lasts until the next heading.
+# "About <company>" is boilerplate, "About the/this/your ..." (role, opportunity, project) is content.
+BOILERPLATE_HEADINGS = re.compile(
+    r"^(benefits|perks|(perks|benefits) (and|&) (benefits|perks)|what we offer|we offer"
+    r"|what('s| is) in it for you|why (join us|work (with|for) us)|our offer"
+    r"|about (us|the (company|organi[sz]ation|employer)|(?!(the|this|your?)\b).{1,40})|who we are|our (story|mission|values|culture)"
+    r"|company (overview|description)|equal (employment )?opportunit(y|ies).*|diversity.*"
+    r"|eeo( statement)?|how to apply|application process|legal notice|privacy.*|cookies?.*)$",
+    re.IGNORECASE,
+)
+# Headings of sections that are never dropped, even if they match the pattern above
+CONTENT_HEADINGS = re.compile(
+    r"^(about (the|this) (role|position|job|team)|about you)$",
+    re.IGNORECASE,
+)
+# Phrases that mark a single line as boilerplate wherever it appears
+BOILERPLATE_PHRASES = (
+    "equal opportunity employer",
+    "equal employment opportunity",
+    "regardless of race",
+    "without regard to race",
+    "sexual orientation",
+    "gender identity",
+    "protected veteran",
+    "reasonable accommodation",
+    "e-verify",
+    "we use cookies",
+    "this website uses cookies",
+    "accept all cookies",
+    "cookie policy",
+    "cookie settings",
+    "privacy policy",
+    "all rights reserved",
+    "share this job",
+    "click here to apply",
+    "apply now",
+    "recruitment agencies",
+)
+# Openings that mark a paragraph as boilerplate, e.g. "We offer private health insurance, ..."
+BOILERPLATE_OPENINGS = re.compile(
+    r"^(we offer|what we offer|in return,? we offer|our benefits|benefits include"
+    r"|you can expect|we provide (you )?with)\b",
+    re.IGNORECASE,
+)
+# Longest line that is treated as a heading
+MAX_HEADING_LENGTH = 60
+# Shortest line that can be learned, so recurring headings are not
+MIN_LEARNED_WORDS = 5
+
+_BULLET_PATTERN = re.compile(r"^[\s\-*•·▪◦–#>]+")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+class StrippedText(NamedTuple):
+    """A job description without boilerplate and what was removed."""
+
+    text: str
+    removed_chars: int
+    removed_tokens: int
+
+
+def _normalize_line(line: str) -> str:
+    return _SPACE_PATTERN.sub(" ", _BULLET_PATTERN.sub("", line)).strip(" :").lower()
+
+
+def _is_heading(line: str, after_blank: bool) -> bool:
+    """Short markdown headings, short lines ending with ":" and short lines after a blank line."""
+    stripped = line.strip()
+    if not 0 < len(stripped) <= MAX_HEADING_LENGTH or len(stripped.split()) > 8:
+        return False
+    if stripped.startswith("#"):
+        return True
+    if _BULLET_PATTERN.match(stripped) or stripped.endswith((".", ",", ";")):
+        return False
+    return after_blank or stripped.endswith(":")
+
+
+class BoilerplateStripper:
+    """
+    Drops boilerplate lines from job descriptions.
+
+    Args:
+        phrases: Phrases marking a line as boilerplate
+        min_postings: Saved postings a line must appear in to be learned as boilerplate
+    """
+
+    def __init__(
+        self,
+        phrases: Iterable[str] = BOILERPLATE_PHRASES,
+        min_postings: int = BOILERPLATE_MIN_POSTINGS,
+    ):
+        self.phrases = tuple(phrase.lower() for phrase in phrases)
+        self.min_postings = min_postings
+        self.learned_lines: frozenset[str] = frozenset()
+        self._lock = threading.Lock()
+
+    def learn(self, job_descriptions: Iterable[str]):
+        """Learn the lines that recur verbatim in at least `min_postings` job descriptions."""
+        counts = Counter()
+        for job_description in job_descriptions:
+            counts.update(
+                {
+                    line
+                    for line in map(_normalize_line, job_description.splitlines())
+                    if len(line.split()) >= MIN_LEARNED_WORDS
+                }
+            )
+        learned = frozenset(
+            line for line, count in counts.items() if count >= self.min_postings
+        )
+        with self._lock:
+            self.learned_lines = learned
+        logger.info(f"Learned {len(learned)} boilerplate lines from saved job descriptions")
+
+    def learn_from_history(self, data_dir: Path = BASE_DATA_DIR):
+        """Learn boilerplate lines from the job descriptions of all saved applications."""
+        job_descriptions = []
+        for path in data_dir.glob("*/job_description.txt"):
+            try:
+                job_descriptions.append(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not read {path}: {e}")
+        self.learn(job_descriptions)
+
+    def _is_boilerplate_line(self, line: str) -> bool:
+        normalized = _normalize_line(line)
+        return (
+            normalized in self.learned_lines
+            or BOILERPLATE_OPENINGS.match(normalized) is not None
+            or any(phrase in normalized for phrase in self.phrases)
+        )
+
+    def strip(self, job_description: str) -> StrippedText:
+        """
+        Remove boilerplate sections and lines from a job description.
+
+        The description is returned unchanged if nothing would be left of it.
+
+        Returns:
+            StrippedText: The remaining text and the number of characters and tokens removed
+        """
+        kept = []
+        in_boilerplate_section = False
+        after_blank = True
+        for line in job_description.splitlines():
+            is_heading = _is_heading(line, after_blank)
+            after_blank = not line.strip()
+            if is_heading:
+                heading = _normalize_line(line)
+                if CONTENT_HEADINGS.match(heading):
+                    in_boilerplate_section = False
+                elif BOILERPLATE_HEADINGS.match(heading):
+                    in_boilerplate_section = True
+                    continue
+                elif not self._is_boilerplate_line(line):
+                    in_boilerplate_section = False
+            if in_boilerplate_section or self._is_boilerplate_line(line):
+                continue
+            kept.append(line)
+        text = re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+        if not text:
+            return StrippedText(job_description, 0, 0)
+        return StrippedText(
+            text,
+            len(job_description) - len(text),
+            max(0, count_tokens(job_description) - count_tokens(text)),
+        )
+
+
+boilerplate_stripper = BoilerplateStripper()
+
+
+def strip_boilerplate(job_description: str | None) -> str | None:
+    """
+    The job description to embed into prompts, without boilerplate.
+
+    Does nothing when BOILERPLATE_STRIPPING is disabled. The removed characters
+    and tokens are logged.
+    """
+    if not BOILERPLATE_STRIPPING or not job_description:
+        return job_description
+    stripped = boilerplate_stripper.strip(job_description)
+    if stripped.removed_chars:
+        logger.info(
+            f"Stripped boilerplate from job description: removed {stripped.removed_chars} "
+            f"of {len(job_description)} characters ({stripped.removed_tokens} tokens)"
+        )
+    return stripped.text
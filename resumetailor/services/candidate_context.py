@@ -0,0 +1,166 @@
+"""
+Serialized candidate data of every full resume section, precomputed once.
+
+The full resume only changes when its YAML is edited, but every section
+writer used to serialize its section again for each session. The store
+below serializes each section (and each of its entries, for the subsets
+kept by the relevance filter) and counts its tokens once, when the full
+resume is loaded or changes. Sections above a token threshold can
+additionally be condensed by the LLM; condensed digests are keyed by a
+content hash of the section, so editing a section invalidates its digest.
+"""
+import hashlib
+import json
+import os
+import logging
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from resumetailor.models import Resume
+from resumetailor.services.resume_index import FULL_RESUME_PATH, ResumeIndexStore
+from resumetailor.services.utils import count_tokens, model_to_prompt
+
+logger = logging.getLogger(__name__)
+
+# Candidate context configuration
+CANDIDATE_DIGEST_THRESHOLD_TOKENS = int(os.getenv("CANDIDATE_DIGEST_THRESHOLD_TOKENS", "0"))  # 0 disables LLM digests
+
+SECTIONS = tuple(section for section in Resume.model_fields if section != "personal_information")
+
+
+def section_digest(entries: list[BaseModel] | None) -> str:
+    """Hex SHA-256 digest of the content of a resume section."""
+    data = [entry.model_dump(mode="json") for entry in entries or []]
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SectionContext:
+    """
+    Serialized entries of one full resume section.
+
+    Args:
+        section: The section key, e.g. "work_experience"
+        entries: The entries of the section
+    """
+
+    def __init__(self, section: str, entries: list[BaseModel]):
+        self.section = section
+        self.entries = entries
+        self.digest = section_digest(entries)
+        self.entry_data = [model_to_prompt(entry) for entry in entries]
+        self.entry_tokens = [count_tokens(data) for data in self.entry_data]
+        self.candidate_data = "\n".join(self.entry_data)
+        self.tokens = count_tokens(self.candidate_data)
+        self._positions = {id(entry): i for i, entry in enumerate(entries)}
+
+    def serialize(self, entries: list[BaseModel]) -> tuple[str, int]:
+        """
+        Candidate data of a subset of the section's entries, e.g. after relevance filtering.
+
+        Entries of this section are taken from the precomputed strings, other
+        entries (such as degrees with filtered courses) are serialized.
+
+        Returns:
+            tuple[str, int]: The candidate data and its approximate token count
+        """
+        parts, tokens = [], 0
+        for entry in entries:
+            position = self._positions.get(id(entry))
+            if position is None:
+                data = model_to_prompt(entry)
+                parts.append(data)
+                tokens += count_tokens(data)
+            else:
+                parts.append(self.entry_data[position])
+                tokens += self.entry_tokens[position]
+        return "\n".join(parts), tokens
+
+
+class CandidateContext:
+    """
+    Serialized sections of the full resume (sections without entries are left out).
+
+    Args:
+        resume: The full resume
+    """
+
+    def __init__(self, resume: Resume):
+        self.sections = {
+            section: SectionContext(section, getattr(resume, section))
+            for section in SECTIONS
+            if getattr(resume, section)
+        }
+
+    def __len__(self) -> int:
+        return sum(len(section.entries) for section in self.sections.values())
+
+
+class CandidateContextStore(ResumeIndexStore[CandidateContext]):
+    """
+    Candidate context of the current full resume, with LLM digests of long sections.
+
+    Args:
+        path: Location of the full resume JSON
+        threshold: Tokens above which a section is condensed by the LLM, 0 disables digests
+    """
+
+    def __init__(
+        self,
+        path: Path = FULL_RESUME_PATH,
+        threshold: int = CANDIDATE_DIGEST_THRESHOLD_TOKENS,
+    ):
+        super().__init__(path, factory=CandidateContext)
+        self.threshold = threshold
+        # Section content hash -> condensed candidate data
+        self.condensed: dict[str, str] = {}
+
+    def section(self, section_key: str, entries: list[BaseModel] | None) -> SectionContext | None:
+        """
+        The precomputed context of a section, if `entries` are the section of the full resume.
+
+        Returns None for resumes that differ from the stored full resume (e.g.
+        edited in the request), whose sections must be serialized by the caller.
+        """
+        context = self.get()
+        if context is None or not entries:
+            return None
+        section = context.sections.get(section_key)
+        if section is None or section.entries != entries:
+            return None
+        return section
+
+    def condensed_data(self, section: SectionContext) -> str | None:
+        """The LLM digest of a section, if digests are enabled and it was condensed."""
+        if self.threshold <= 0:
+            return None
+        return self.condensed.get(section.digest)
+
+    def to_condense(self) -> list[SectionContext]:
+        """Sections above the threshold without an up-to-date digest."""
+        context = self.get()
+        if self.threshold <= 0 or context is None:
+            return []
+        return [
+            section
+            for section in context.sections.values()
+            if section.tokens > self.threshold and section.digest not in self.condensed
+        ]
+
+    def set_condensed(self, section: SectionContext, condensed: str):
+        """Store the digest of a section, dropping the digests of outdated section contents."""
+        context = self.get()
+        current = {s.digest for s in context.sections.values()} if context else set()
+        with self._lock:
+            self.condensed = {
+                digest: data for digest, data in self.condensed.items() if digest in current
+            }
+            self.condensed[section.digest] = condensed
+        logger.info(
+            f"Condensed {section.section} candidate data from {section.tokens} "
+            f"to {count_tokens(condensed)} tokens"
+        )
+
+
+candidate_context_store = CandidateContextStore()
@@ -0,0 +1,192 @@
+"""
+Keyword-coverage fit score of the full resume for a job, without LLM calls.
+
+The full resume is reduced once to a set of normalized terms: its curated
+phrases (keywords, acquired skills, skill, course and certification names)
+and every word n-gram of its text, with synonyms mapped to a canonical form
+("k8s" -> "kubernetes", "postgres" -> "postgresql"). Checking whether a job
+requirement is covered is then a set lookup, so a posting can be scored in
+milliseconds before any tailoring is started.
+"""
+import re
+import logging
+from typing import Iterable
+
+from resumetailor.models import Resume, JobProfile
+from resumetailor.models.fit_score import FitScore, KeywordCoverage
+from resumetailor.services.relevance import tokenize
+from resumetailor.services.resume_index import ResumeIndexStore
+from resumetailor.services.resume_text import collect_entries, flatten_text
+
+logger = logging.getLogger(__name__)
+
+# Job profile categories that are scored, with their weight in the fit score
+CATEGORY_WEIGHTS = {
+    "required_technologies": 0.5,
+    "technical_skills": 0.3,
+    "certifications": 0.2,
+}
+# Categories of names, which are only covered as a whole (not word by word)
+NAME_CATEGORIES = ("certifications",)
+# Entry fields holding single terms rather than prose
+PHRASE_FIELDS = ("keywords", "acquired_skills", "name")
+# Longest phrase indexed as a term, longer requirements match on all their words
+MAX_NGRAM = 4
+
+# Canonical term -> aliases, all in tokenized form
+SYNONYMS = {
+    "javascript": ["js", "ecmascript"],
+    "typescript": ["ts"],
+    "node.js": ["node", "nodejs"],
+    "react": ["react.js", "reactjs"],
+    "vue": ["vue.js", "vuejs"],
+    "angular": ["angularjs", "angular.js"],
+    "go": ["golang"],
+    "c++": ["cpp"],
+    "c#": ["csharp"],
+    "python": ["python3"],
+    "postgresql": ["postgres", "psql"],
+    "mongodb": ["mongo"],
+    "kubernetes": ["k8s"],
+    "aws": ["amazon web services"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "azure": ["microsoft azure"],
+    "ci/cd": ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pytorch": ["torch"],
+    "machine learning": ["ml"],
+    "deep learning": ["deep-learning"],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "computer vision": ["computer-vision"],
+    "large language models": ["llm", "llms", "large language model"],
+    "rest api": ["restful", "rest apis", "restful api", "restful apis"],
+    "sql": ["structured query language"],
+    "nosql": ["no-sql"],
+}
+SYNONYM_LOOKUP = {
+    alias: canonical for canonical, aliases in SYNONYMS.items() for alias in aliases
+}
+# Alternatives within one requirement, e.g. "AWS or GCP", "Python (or Go)"
+_ALTERNATIVES_PATTERN = re.compile(r",|;|\(|\)|\bor\b|\band/or\b", re.IGNORECASE)
+
+
+def normalize(term: str) -> str:
+    """Tokenize a term and map it to its canonical synonym."""
+    normalized = " ".join(tokenize(term))
+    return SYNONYM_LOOKUP.get(normalized, normalized)
+
+
+def _ngrams(tokens: list[str], max_n: int = MAX_NGRAM) -> Iterable[str]:
+    for n in range(1, max_n + 1):
+        for i in range(len(tokens) - n + 1):
+            yield " ".join(tokens[i : i + n])
+
+
+def _phrases(value) -> list[str]:
+    """Single terms of a phrase field (a list, or a comma separated sentence)."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [part for part in re.split(r"[,;]", value) if part.strip()]
+    return [str(v) for v in value]
+
+
+class KeywordIndex:
+    """
+    Set of normalized terms found anywhere in a resume.
+
+    Args:
+        resume: The full resume to index
+    """
+
+    def __init__(self, resume: Resume):
+        self.entries = collect_entries(resume)
+        self.phrases: set[str] = set()
+        self.vocabulary: set[str] = set()
+        # Canonical words of every entry, to match longer requirements within one entry
+        self.entry_words: list[set[str]] = []
+        for entry in self.entries:
+            for field in PHRASE_FIELDS:
+                for phrase in _phrases(getattr(entry.entry, field, None)):
+                    self.phrases.add(normalize(phrase))
+            tokens = tokenize(flatten_text(entry.entry))
+            self.entry_words.append({SYNONYM_LOOKUP.get(token, token) for token in tokens})
+            for ngram in _ngrams(tokens):
+                self.vocabulary.add(ngram)
+                self.vocabulary.add(SYNONYM_LOOKUP.get(ngram, ngram))
+        self.phrases.discard("")
+        self.vocabulary |= self.phrases
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def covers(self, requirement: str, all_words: bool = True) -> bool:
+        """
+        Whether the resume mentions a requirement (or one of its alternatives).
+
+        An alternative is covered when it appears as a term of the resume, or
+        when it has several words and `all_words` is set, and all of them
+        appear in the same entry. Names such as certifications should match
+        as a whole, so they disable `all_words`.
+        """
+        if normalize(requirement) in self.vocabulary:
+            return True
+        for alternative in _ALTERNATIVES_PATTERN.split(requirement):
+            tokens = tokenize(alternative)
+            if not tokens:
+                continue
+            term = normalize(alternative)
+            if term in self.vocabulary:
+                return True
+            if all_words and len(tokens) > 1:
+                words = {SYNONYM_LOOKUP.get(token, token) for token in tokens}
+                if any(words <= entry_words for entry_words in self.entry_words):
+                    return True
+        return False
+
+    def category_coverage(
+        self, requirements: list[str] | None, all_words: bool = True
+    ) -> KeywordCoverage:
+        """Covered and missing requirements of one job profile category."""
+        requirements = list(dict.fromkeys(r for r in requirements or [] if r.strip()))
+        if not requirements:
+            return KeywordCoverage()
+        covered = [r for r in requirements if self.covers(r, all_words)]
+        missing = [r for r in requirements if r not in covered]
+        return KeywordCoverage(
+            covered=covered,
+            missing=missing,
+            coverage=len(covered) / len(requirements),
+        )
+
+    def fit_score(self, job_profile: JobProfile) -> FitScore:
+        """
+        Score the resume against the technologies, skills and certifications of a job profile.
+
+        The fit score is the weighted mean coverage of the categories that list
+        any requirement (0 when none does).
+        """
+        categories = {
+            field: self.category_coverage(
+                getattr(job_profile, field), all_words=field not in NAME_CATEGORIES
+            )
+            for field in CATEGORY_WEIGHTS
+        }
+        weights = {
+            field: weight
+            for field, weight in CATEGORY_WEIGHTS.items()
+            if categories[field].covered or categories[field].missing
+        }
+        total = sum(weights.values())
+        score = (
+            sum(categories[field].coverage * w for field, w in weights.items()) / total
+            if total
+            else 0.0
+        )
+        return FitScore(fit_score=score, **categories)
+
+
+keyword_index_store: ResumeIndexStore[KeywordIndex] = ResumeIndexStore(
+    factory=KeywordIndex
+)
@@ -0,0 +1,118 @@
+"""
+Persistent cache of extracted job profiles, keyed on the job description.
+
+The key is a hash of the description with whitespace, casing and punctuation
+folded, so the same posting pasted again (or copied from another source)
+skips the LLM extraction. At startup the cache is seeded with the job profiles
+of all saved applications, which were reviewed by the user.
+"""
+import hashlib
+import json
+import os
+import re
+import unicodedata
+import logging
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.models import JobProfile
+from resumetailor.services.llm_cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+# Job profile cache configuration
+DEFAULT_JOB_PROFILE_CACHE_ENABLED = os.getenv("JOB_PROFILE_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+DEFAULT_JOB_PROFILE_CACHE_PATH = Path(
+    os.getenv("JOB_PROFILE_CACHE_PATH", BASE_DATA_DIR / "job_profile_cache.sqlite")
+)
+DEFAULT_JOB_PROFILE_CACHE_TTL = float(os.getenv("JOB_PROFILE_CACHE_TTL", "0"))  # 0 never expires
+DEFAULT_JOB_PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("JOB_PROFILE_CACHE_MAX_ENTRIES", "1000"))  # 0 is unbounded
+
+# "+" and "#" right after a word stay attached to it, so C++, C# and C differ
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s+#]|(?<![\w+#])[+#]")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Fold unicode forms, casing, punctuation and whitespace of a job description."""
+    text = unicodedata.normalize("NFKC", job_description).casefold()
+    text = _PUNCTUATION_PATTERN.sub(" ", text)
+    return _SPACE_PATTERN.sub(" ", text).strip()
+
+
+def job_description_key(job_description: str) -> str:
+    """Hex SHA-256 digest of the normalized job description."""
+    normalized = normalize_job_description(job_description)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class JobProfileCache:
+    """
+    Job profiles by normalized job description, stored in an `LLMCache`.
+
+    Args:
+        cache: The SQLite store of the profiles
+    """
+
+    def __init__(self, cache: LLMCache):
+        self.cache = cache
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache.enabled
+
+    def get(self, job_description: str) -> JobProfile | None:
+        """The cached profile of a job description, None on a miss or when disabled."""
+        if not self.enabled or not job_description:
+            return None
+        return self.cache.get(job_description_key(job_description), JobProfile)
+
+    def set(self, job_description: str, job_profile: JobProfile):
+        """Store the profile of a job description."""
+        if self.enabled and job_description and job_profile is not None:
+            self.cache.set(job_description_key(job_description), job_profile)
+
+    def seed_from_history(self, data_dir: Path = BASE_DATA_DIR) -> int:
+        """
+        Store the job profiles of all saved applications.
+
+        Applications are seeded oldest first, so the latest saved profile of a
+        posting wins.
+
+        Returns:
+            int: Number of seeded profiles
+        """
+        if not self.enabled:
+            return 0
+        profile_paths = sorted(
+            data_dir.glob("*/job_profile.json"), key=lambda path: path.stat().st_mtime
+        )
+        seeded = 0
+        for profile_path in profile_paths:
+            description_path = profile_path.with_name("job_description.txt")
+            if not description_path.exists():
+                continue
+            try:
+                job_description = description_path.read_text(encoding="utf-8")
+                with open(profile_path, "r") as f:
+                    job_profile = JobProfile(**json.load(f))
+            except (OSError, ValueError, ValidationError) as e:
+                logger.warning(f"Skipping saved job profile {profile_path}: {e}")
+                continue
+            self.set(job_description, job_profile)
+            seeded += 1
+        logger.info(f"Seeded job profile cache with {seeded} saved profiles")
+        return seeded
+
+
+# Shared by the extractor and the storage of completed applications
+job_profile_cache = JobProfileCache(
+    LLMCache(
+        path=DEFAULT_JOB_PROFILE_CACHE_PATH,
+        ttl=DEFAULT_JOB_PROFILE_CACHE_TTL,
+        max_entries=DEFAULT_JOB_PROFILE_CACHE_MAX_ENTRIES,
+        enabled=DEFAULT_JOB_PROFILE_CACHE_ENABLED,
+    )
+)
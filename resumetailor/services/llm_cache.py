@@ -0,0 +1,195 @@
+"""
+Persistent, content-addressed cache for structured LLM results.
+
+Entries are keyed on the model name, the rendered prompt messages and the
+JSON schema of the requested output, so any change to a prompt, an input
+or a model definition is a cache miss. The cache is opt-in (`LLM_CACHE_ENABLED`)
+and stored in a SQLite file under `BASE_DATA_DIR`.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+from langchain_core.messages import BaseMessage
+
+from resumetailor.core.constants import BASE_DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# Cache configuration
+DEFAULT_LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() in ("true", "1", "yes")
+DEFAULT_LLM_CACHE_PATH = Path(os.getenv("LLM_CACHE_PATH", BASE_DATA_DIR / "llm_cache.sqlite"))
+DEFAULT_LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 3600)))  # 0 never expires
+DEFAULT_LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))  # 0 is unbounded
+
+
+def _serialize(value: Any) -> Any:
+    """Turn prompt messages and inputs into plain JSON data for hashing."""
+    if isinstance(value, BaseMessage):
+        return {"type": value.type, "content": _serialize(value.content)}
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {str(k): _serialize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_serialize(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def make_cache_key(model_name: str, messages: Any, output_schema: type[BaseModel]) -> str:
+    """
+    Build the content address of one structured LLM call.
+
+    Args:
+        model_name: Name of the model the call is sent to
+        messages: The rendered prompt messages (or the raw chain input)
+        output_schema: The pydantic model the output is parsed into
+
+    Returns:
+        str: Hex SHA-256 digest of the call
+    """
+    payload = json.dumps(
+        {
+            "model": model_name,
+            "messages": _serialize(messages),
+            "schema": output_schema.model_json_schema(),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    SQLite-backed cache with a time-to-live and least-recently-used eviction.
+
+    The connection is opened lazily, so a disabled cache never touches the disk.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_LLM_CACHE_PATH,
+        ttl: float = DEFAULT_LLM_CACHE_TTL,
+        max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+        enabled: bool = DEFAULT_LLM_CACHE_ENABLED,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_accessed_at ON llm_cache (accessed_at)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get(self, key: str, output_schema: type[BaseModel]) -> BaseModel | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from `make_cache_key`
+            output_schema: The pydantic model to parse the stored result into
+
+        Returns:
+            BaseModel | None: The cached result, or None on a miss or an expired entry
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self.ttl > 0 and now - created_at > self.ttl:
+                connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                connection.commit()
+                return None
+            connection.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            connection.commit()
+        try:
+            return output_schema.model_validate_json(value)
+        except ValidationError:
+            logger.warning(f"Discarding unreadable LLM cache entry {key[:12]}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: BaseModel):
+        """
+        Store a result and evict expired and least recently used entries.
+
+        Args:
+            key: Key from `make_cache_key`
+            value: The structured result of the call
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value.model_dump_json(), now, now),
+            )
+            if self.ttl > 0:
+                connection.execute(
+                    "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,)
+                )
+            if self.max_entries > 0:
+                connection.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            connection.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            connection.commit()
+
+    def clear(self):
+        with self._lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM llm_cache")
+            connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Shared by every LLM caller in the process
+llm_cache = LLMCache()
@@ -0,0 +1,123 @@
+"""
+Splitting of long job descriptions and merging of the partial job profiles.
+
+Descriptions above a token threshold are extracted chunk by chunk in
+parallel (map) and the partial profiles are merged without an LLM call
+(reduce): list fields are concatenated without duplicates, short scalar
+fields are decided by majority vote and descriptive text fields keep the
+most detailed answer.
+"""
+import os
+import re
+import logging
+from collections import Counter
+from typing import get_args
+
+from resumetailor.models import JobProfile
+from resumetailor.services.utils import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Map-reduce configuration
+MAP_REDUCE_THRESHOLD_TOKENS = int(os.getenv("MAP_REDUCE_THRESHOLD_TOKENS", "6000"))  # 0 disables map-reduce
+MAP_REDUCE_CHUNK_TOKENS = int(os.getenv("MAP_REDUCE_CHUNK_TOKENS", "3000"))
+MAP_REDUCE_MAX_WORKERS = max(1, int(os.getenv("MAP_REDUCE_MAX_WORKERS", "4")))  # Chunks extracted at once
+
+# Scalar fields decided by majority vote, the other text fields keep the longest value
+VOTED_FIELDS = ("company", "position", "job_type")
+
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+def needs_map_reduce(
+    job_description: str, threshold: int = MAP_REDUCE_THRESHOLD_TOKENS
+) -> bool:
+    """Whether a job description is long enough to be extracted chunk by chunk."""
+    return threshold > 0 and count_tokens(job_description) > threshold
+
+
+def _split_unit(text: str, max_tokens: int) -> list[str]:
+    """Split a paragraph that is too long into lines, and lines into sentences."""
+    if count_tokens(text) <= max_tokens:
+        return [text]
+    lines = text.splitlines()
+    if len(lines) > 1:
+        return [unit for line in lines for unit in _split_unit(line, max_tokens)]
+    sentences = _SENTENCE_PATTERN.split(text)
+    if len(sentences) > 1:
+        return [unit for sentence in sentences for unit in _split_unit(sentence, max_tokens)]
+    return [text]  # a single oversized sentence is sent as it is
+
+
+def split_job_description(
+    job_description: str, max_tokens: int = MAP_REDUCE_CHUNK_TOKENS
+) -> list[str]:
+    """
+    Split a job description into chunks of whole paragraphs of at most `max_tokens`.
+
+    Paragraphs are only split further (into lines, then sentences) when they
+    do not fit into a chunk on their own.
+
+    Returns:
+        list[str]: The chunks, in their original order
+    """
+    units = [
+        unit
+        for paragraph in _PARAGRAPH_PATTERN.split(job_description)
+        if paragraph.strip()
+        for unit in _split_unit(paragraph.strip(), max_tokens)
+    ]
+    chunks, current, current_tokens = [], [], 0
+    for unit in units:
+        tokens = count_tokens(unit)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def _is_list_field(name: str) -> bool:
+    annotation = JobProfile.model_fields[name].annotation
+    return any(getattr(arg, "__origin__", None) is list for arg in get_args(annotation))
+
+
+def merge_job_profiles(profiles: list[JobProfile]) -> JobProfile:
+    """
+    Merge partial job profiles deterministically.
+
+    - List fields: all items in chunk order, without (case-insensitive) duplicates
+    - Company, position and job type: the most frequent value, ties go to the earliest chunk
+    - Other text fields: the longest value
+
+    Returns:
+        JobProfile: The merged profile
+    """
+    merged = {}
+    for name in JobProfile.model_fields:
+        values = [getattr(profile, name) for profile in profiles]
+        values = [value for value in values if value]
+        if not values:
+            merged[name] = None
+        elif _is_list_field(name):
+            items = {}
+            for value in values:
+                for item in value:
+                    if item and item.strip():
+                        items.setdefault(_normalize(item), item.strip())
+            merged[name] = list(items.values()) or None
+        elif name in VOTED_FIELDS:
+            counts = Counter(_normalize(value) for value in values)
+            best = max(counts.values())
+            merged[name] = next(v for v in values if counts[_normalize(v)] == best)
+        else:
+            merged[name] = max(values, key=len)
+    return JobProfile(**merged)
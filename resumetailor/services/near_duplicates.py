@@ -0,0 +1,212 @@
+"""
+Near-duplicate detection of job descriptions with MinHash and LSH banding.
+
+Reposted roles differ from the original by a few words, so their hash in the
+job profile cache differs too. Every saved job description is reduced to its
+word shingles and a MinHash signature, whose bands are put into hash buckets.
+A new description is only compared with the saved descriptions it shares a
+bucket with, and matches above a Jaccard threshold reuse the saved profile.
+"""
+import hashlib
+import json
+import os
+import threading
+import logging
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from pydantic import ValidationError
+
+from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.models import JobProfile
+from resumetailor.services.job_profile_cache import normalize_job_description
+
+logger = logging.getLogger(__name__)
+
+# Near-duplicate configuration
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8"))  # 0 disables the lookup
+
+# Words per shingle
+SHINGLE_SIZE = 3
+# LSH banding: BANDS * ROWS hash functions, candidates from a Jaccard of about (1 / BANDS) ** (1 / ROWS) = 0.42
+BANDS = 32
+ROWS = 4
+# Mersenne prime of the hash functions (a * x + b) % p; a, b < 2**31 and x < 2**32 fit in uint64
+_PRIME = (1 << 31) - 1
+
+
+def shingles(job_description: str, size: int = SHINGLE_SIZE) -> frozenset[int]:
+    """32-bit hashes of the word n-grams of a normalized job description."""
+    words = normalize_job_description(job_description).split()
+    grams = (
+        [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+        if len(words) >= size
+        else [" ".join(words)] if words else []
+    )
+    return frozenset(
+        int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest(), "big")
+        for gram in grams
+    )
+
+
+def jaccard(a: frozenset[int], b: frozenset[int]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicate(NamedTuple):
+    """A saved application whose job description is similar to a query."""
+
+    application_id: str
+    similarity: float
+
+
+class MinHashLSH:
+    """
+    MinHash signatures of shingle sets, indexed in LSH band buckets.
+
+    Args:
+        bands: Number of bands of a signature
+        rows: Hash functions per band
+        seed: Seed of the hash functions
+    """
+
+    def __init__(self, bands: int = BANDS, rows: int = ROWS, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, (bands * rows, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, (bands * rows, 1), dtype=np.uint64)
+        self._buckets: dict[tuple[int, bytes], set[str]] = {}
+        self._signatures: dict[str, np.ndarray] = {}
+
+    def signature(self, shingle_set: frozenset[int]) -> np.ndarray:
+        """Minimum of every hash function over the shingles."""
+        if not shingle_set:
+            return np.full(self.bands * self.rows, _PRIME, dtype=np.uint64)
+        values = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+        return ((self._a * values + self._b) % _PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> list[tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: str, shingle_set: frozenset[int]):
+        """Index a shingle set under `key`, replacing a previous one."""
+        self.remove(key)
+        signature = self.signature(shingle_set)
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str):
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def candidates(self, shingle_set: frozenset[int]) -> set[str]:
+        """Keys sharing at least one band bucket with a shingle set."""
+        found = set()
+        for band_key in self._band_keys(self.signature(shingle_set)):
+            found |= self._buckets.get(band_key, set())
+        return found
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+class NearDuplicateIndex:
+    """
+    Job descriptions of saved applications, searchable for near duplicates.
+
+    Args:
+        threshold: Minimum Jaccard similarity of a near duplicate, 0 disables lookups
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self._lsh = MinHashLSH()
+        self._shingles: dict[str, frozenset[int]] = {}
+        self._data_dirs: dict[str, Path] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def add(self, data_dir: Path, job_description: str):
+        """Index (or re-index) the job description of a saved application."""
+        shingle_set = shingles(job_description)
+        with self._lock:
+            self._lsh.add(data_dir.name, shingle_set)
+            self._shingles[data_dir.name] = shingle_set
+            self._data_dirs[data_dir.name] = data_dir
+
+    def remove(self, application_id: str):
+        with self._lock:
+            self._lsh.remove(application_id)
+            self._shingles.pop(application_id, None)
+            self._data_dirs.pop(application_id, None)
+
+    def build_from_history(self, data_dir: Path = BASE_DATA_DIR) -> int:
+        """
+        Index every saved application with a job description and a job profile.
+
+        Returns:
+            int: Number of indexed applications
+        """
+        for description_path in data_dir.glob("*/job_description.txt"):
+            if not description_path.with_name("job_profile.json").exists():
+                continue
+            try:
+                self.add(description_path.parent, description_path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Could not index {description_path}: {e}")
+        logger.info(f"Indexed {len(self)} saved job descriptions for near-duplicate lookup")
+        return len(self)
+
+    def find(self, job_description: str) -> NearDuplicate | None:
+        """The most similar saved application at or above the threshold, if any."""
+        if self.threshold <= 0:
+            return None
+        shingle_set = shingles(job_description)
+        with self._lock:
+            scored = [
+                NearDuplicate(key, jaccard(shingle_set, self._shingles[key]))
+                for key in self._lsh.candidates(shingle_set)
+            ]
+        scored = [match for match in scored if match.similarity >= self.threshold]
+        if not scored:
+            return None
+        return max(scored, key=lambda match: (match.similarity, match.application_id))
+
+    def find_profile(self, job_description: str) -> JobProfile | None:
+        """The saved job profile of the nearest duplicate of a job description, if any."""
+        match = self.find(job_description)
+        if match is None:
+            return None
+        profile_path = self._data_dirs[match.application_id] / "job_profile.json"
+        try:
+            with open(profile_path, "r") as f:
+                job_profile = JobProfile(**json.load(f))
+        except (OSError, ValueError, ValidationError) as e:
+            logger.warning(f"Could not load near-duplicate job profile {profile_path}: {e}")
+            return None
+        logger.info(
+            f"Job description is a near duplicate of application {match.application_id} "
+            f"(Jaccard {match.similarity:.2f}), reusing its job profile"
+        )
+        return job_profile
+
+
+near_duplicate_index = NearDuplicateIndex()
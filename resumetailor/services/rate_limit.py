@@ -0,0 +1,197 @@
+"""
+Process-wide token-bucket rate limiter shared by all LLM callers.
+
+The limiter also holds a global cooldown: when one call is rate limited,
+every pending call waits until the reported reset time.
+"""
+import asyncio
+import contextvars
+import math
+import os
+import threading
+import time
+import logging
+from typing import Any
+
+from pydantic import BaseModel
+from langchain_core.messages import BaseMessage
+
+logger = logging.getLogger(__name__)
+
+# Rate limit configuration (0 disables the corresponding bucket)
+DEFAULT_RATE_LIMIT_RPM = int(os.getenv("RATE_LIMIT_RPM", "0"))
+DEFAULT_RATE_LIMIT_TPM = int(os.getenv("RATE_LIMIT_TPM", "0"))
+# Output tokens reserved per call on top of the estimated prompt size
+DEFAULT_EXPECTED_OUTPUT_TOKENS = int(os.getenv("RATE_LIMIT_OUTPUT_TOKENS", "1000"))
+
+# Rough average for English text with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+# Cooldown deadline the current thread/task set itself (it already backs off on its own)
+_cooldown_exempt_until: contextvars.ContextVar[float] = contextvars.ContextVar(
+    "cooldown_exempt_until", default=0.0
+)
+
+
+def _flatten_text(value: Any) -> str:
+    """Collect the text that would end up in a prompt from an arbitrary input."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, BaseMessage):
+        return _flatten_text(value.content)
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    if isinstance(value, dict):
+        return "\n".join(_flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_flatten_text(v) for v in value)
+    return str(value)
+
+
+def estimate_tokens(value: Any) -> int:
+    """
+    Estimate the number of prompt tokens for a chain input.
+
+    Args:
+        value: A string, message, model, or a (nested) dict/list of those
+
+    Returns:
+        int: Estimated token count (at least 1)
+    """
+    return max(1, math.ceil(len(_flatten_text(value)) / CHARS_PER_TOKEN))
+
+
+class TokenBucketRateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+
+    Callers reserve capacity up front and then wait for their turn, so
+    concurrent callers are queued in arrival order instead of all being
+    sent at once and failing with a 429. A cooldown set with `cooldown`
+    holds back every caller, even when both buckets are disabled.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_RATE_LIMIT_RPM,
+        tokens_per_minute: int = DEFAULT_RATE_LIMIT_TPM,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = threading.Lock()
+        self._updated_at = time.monotonic()
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._cooldown_until = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+    def cooldown(self, seconds: float):
+        """
+        Pause every other caller for `seconds`, e.g. until a reported rate limit reset.
+
+        The calling thread/task is exempt, since it waits for the reset in its own
+        retry backoff anyway.
+
+        Args:
+            seconds: Time from now until calls may be sent again
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._cooldown_until:
+                self._cooldown_until = until
+                logger.warning(f"Rate limit hit, pausing all LLM calls for {seconds:.2f} seconds")
+            _cooldown_exempt_until.set(self._cooldown_until)
+
+    def clear_exemption(self):
+        """Make the calling thread/task respect cooldowns again (when its retries are over)."""
+        _cooldown_exempt_until.set(0.0)
+
+    @property
+    def cooldown_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self._cooldown_until - time.monotonic())
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self.requests_per_minute > 0:
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute > 0:
+            self._tokens = min(
+                self.tokens_per_minute,
+                self._tokens + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Take capacity for one call and return how long the caller has to wait.
+
+        Buckets may go negative; the deficit is what later callers queue behind.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = 0.0
+            if self._cooldown_until > _cooldown_exempt_until.get():
+                wait = max(0.0, self._cooldown_until - now)
+            if self.requests_per_minute > 0:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests * 60.0 / self.requests_per_minute)
+            if self.tokens_per_minute > 0:
+                # A single call larger than the bucket can never fit, so cap it
+                self._tokens -= min(tokens, self.tokens_per_minute)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60.0 / self.tokens_per_minute)
+            return wait
+
+    def _release(self, tokens: int):
+        """Give back a reservation that was not used (e.g. cancelled caller)."""
+        with self._lock:
+            if self.requests_per_minute > 0:
+                self._requests = min(self.requests_per_minute, self._requests + 1)
+            if self.tokens_per_minute > 0:
+                self._tokens = min(
+                    self.tokens_per_minute,
+                    self._tokens + min(tokens, self.tokens_per_minute),
+                )
+
+    def acquire(self, tokens: int = 1):
+        """
+        Block until one request with `tokens` tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens (prompt + expected output) of the call
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.info(f"Rate limiter queued call for {wait:.2f} seconds")
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 1):
+        """
+        Wait until one request with `tokens` tokens may be sent, without blocking the event loop.
+
+        Args:
+            tokens: Estimated tokens (prompt + expected output) of the call
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.info(f"Rate limiter queued call for {wait:.2f} seconds")
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._release(tokens)
+                raise
+
+
+# Shared by every LLM caller in the process
+rate_limiter = TokenBucketRateLimiter()
@@ -0,0 +1,154 @@
+"""
+Local relevance ranking of resume entries against a job profile.
+
+Before a section is sent to the LLM, its entries are scored with BM25 against
+the technical skills, required technologies and responsibilities of the job
+profile, and only the most relevant ones are kept. This cuts prompt size and
+latency for candidates with long histories without any API call.
+"""
+import math
+import os
+import re
+import logging
+from collections import Counter
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from resumetailor.models import JobProfile
+from resumetailor.services.resume_text import flatten_text
+
+logger = logging.getLogger(__name__)
+
+# Relevance filter configuration
+DEFAULT_RELEVANCE_TOP_K = int(os.getenv("RELEVANCE_TOP_K", "10"))  # 0 disables the filter
+DEFAULT_RELEVANCE_MIN_SCORE = float(os.getenv("RELEVANCE_MIN_SCORE", "0.0"))
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Job profile fields the entries are ranked against
+QUERY_FIELDS = ("technical_skills", "required_technologies", "responsibilities")
+# Entry fields with curated terms, counted twice
+KEYWORD_FIELDS = ("keywords", "acquired_skills")
+# Nested lists that are filtered inside an entry (courses and projects of a degree)
+NESTED_LIST_FIELDS = ("courses", "projects")
+
+# Keep "c++", "c#", "node.js", "ci/cd" as single terms
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or our the to we will with you your".split()
+)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase `text` and split it into terms, dropping stopwords."""
+    tokens = (token.rstrip("./-") for token in _TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if token and token not in _STOPWORDS]
+
+
+def entry_terms(entry: BaseModel) -> list[str]:
+    """All terms of a resume entry, with its keyword and skill fields weighted twice."""
+    terms = tokenize(flatten_text(entry))
+    for field in KEYWORD_FIELDS:
+        terms += tokenize(flatten_text(getattr(entry, field, None)))
+    return terms
+
+
+def job_profile_terms(job_profile: JobProfile) -> list[str]:
+    """The query terms of a job profile."""
+    return tokenize(" ".join(flatten_text(getattr(job_profile, field)) for field in QUERY_FIELDS))
+
+
+def bm25_scores(documents: list[list[str]], query: list[str]) -> list[float]:
+    """
+    Score tokenized documents against a tokenized query with Okapi BM25.
+
+    Args:
+        documents: Terms of every document
+        query: Query terms (repeated terms count once)
+
+    Returns:
+        list[float]: One score per document
+    """
+    if not documents:
+        return []
+    average_length = sum(len(doc) for doc in documents) / len(documents) or 1.0
+    document_frequency = Counter(term for doc in documents for term in set(doc))
+    query_terms = set(query)
+    scores = []
+    for doc in documents:
+        term_frequency = Counter(doc)
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / average_length)
+        score = 0.0
+        for term in query_terms:
+            frequency = term_frequency.get(term, 0)
+            if not frequency:
+                continue
+            n = document_frequency[term]
+            idf = math.log(1 + (len(documents) - n + 0.5) / (n + 0.5))
+            score += idf * frequency * (BM25_K1 + 1) / (frequency + length_norm)
+        scores.append(score)
+    return scores
+
+
+def filter_relevant(
+    entries: list[T],
+    query: list[str],
+    top_k: int = DEFAULT_RELEVANCE_TOP_K,
+    min_score: float = DEFAULT_RELEVANCE_MIN_SCORE,
+    scores: list[float] | None = None,
+) -> list[T]:
+    """
+    Keep the `top_k` entries that score at least `min_score`, in their original order.
+
+    The filter is skipped when it is disabled (`top_k` <= 0) or the query is
+    empty, and the best entry is always kept. Entries are scored with BM25
+    unless precomputed `scores` (one per entry) are given.
+    """
+    if top_k <= 0 or not query or not entries:
+        return entries
+    if scores is None:
+        scores = bm25_scores([entry_terms(entry) for entry in entries], query)
+    ranked = sorted(range(len(entries)), key=lambda i: scores[i], reverse=True)
+    keep = [i for i in ranked[:top_k] if scores[i] >= min_score] or ranked[:1]
+    return [entries[i] for i in sorted(keep)]
+
+
+def filter_section(
+    entries: list[T],
+    job_profile: JobProfile | None,
+    top_k: int = DEFAULT_RELEVANCE_TOP_K,
+    min_score: float = DEFAULT_RELEVANCE_MIN_SCORE,
+) -> list[T]:
+    """
+    Reduce the entries of a resume section to the ones relevant for a job profile.
+
+    Entries are ranked against each other, and the courses and projects of a
+    degree are ranked within that degree.
+
+    Args:
+        entries: The entries of one resume section
+        job_profile: The job profile to rank against (None keeps everything)
+        top_k: Maximum number of entries (and nested entries) to keep, 0 disables the filter
+        min_score: Minimum BM25 score of a kept entry
+
+    Returns:
+        list: The kept entries, in their original order
+    """
+    if job_profile is None or not entries or top_k <= 0:
+        return entries
+    query = job_profile_terms(job_profile)
+    kept = filter_relevant(entries, query, top_k, min_score)
+    result = []
+    for entry in kept:
+        update = {
+            field: filter_relevant(getattr(entry, field), query, top_k, min_score)
+            for field in NESTED_LIST_FIELDS
+            if isinstance(getattr(entry, field, None), list)
+        }
+        result.append(entry.model_copy(update=update) if update else entry)
+    return result
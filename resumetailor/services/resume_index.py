@@ -0,0 +1,225 @@
+"""
+Vectorized TF-IDF index over every entry of the full resume.
+
+The full resume only changes when its YAML is edited, so all entries
+(degrees, courses, positions, projects, achievements, certifications,
+skills and publications) are vectorized once into an L2-normalized NumPy
+matrix. Scoring a job profile against all of them is then a single
+matrix-vector product, which supports ranking, coverage scoring and
+pruning without an LLM call.
+"""
+import json
+import math
+import threading
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.models import Resume, JobProfile
+from resumetailor.services.relevance import (
+    DEFAULT_RELEVANCE_MIN_SCORE,
+    DEFAULT_RELEVANCE_TOP_K,
+    NESTED_LIST_FIELDS,
+    entry_terms,
+    filter_relevant,
+    job_profile_terms,
+)
+from resumetailor.services.resume_text import IndexEntry, collect_entries
+
+logger = logging.getLogger(__name__)
+
+FULL_RESUME_PATH = BASE_DATA_DIR / "full_resume.json"
+
+I = TypeVar("I")
+T = TypeVar("T", bound=BaseModel)
+
+class ResumeIndex:
+    """
+    TF-IDF matrix of all resume entries (one L2-normalized row per entry).
+
+    Args:
+        resume: The full resume to index
+    """
+
+    def __init__(self, resume: Resume):
+        self.entries = collect_entries(resume)
+        documents = [Counter(entry_terms(e.entry)) for e in self.entries]
+        self.vocabulary = {
+            term: i
+            for i, term in enumerate(sorted({term for doc in documents for term in doc}))
+        }
+        document_frequency = np.zeros(len(self.vocabulary), dtype=np.float32)
+        term_frequency = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        for row, doc in enumerate(documents):
+            for term, count in doc.items():
+                column = self.vocabulary[term]
+                term_frequency[row, column] = 1 + math.log(count)
+                document_frequency[column] += 1
+        # Smoothed idf, as in scikit-learn
+        self.idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+        self.matrix = self._normalize(term_frequency * self.idf)
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def vectorize(self, terms: list[str]) -> np.ndarray:
+        """TF-IDF vector of a list of query terms (terms unknown to the resume are ignored)."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term, count in Counter(terms).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = 1 + math.log(count)
+        return self._normalize(vector * self.idf)
+
+    def score(self, job_profile: JobProfile) -> np.ndarray:
+        """
+        Cosine similarity of every indexed entry with a job profile.
+
+        Returns:
+            np.ndarray: One score in [0, 1] per entry, aligned with `entries`
+        """
+        return self.matrix @ self.vectorize(job_profile_terms(job_profile))
+
+    def rank(
+        self,
+        job_profile: JobProfile,
+        section: str | None = None,
+        top_k: int | None = None,
+    ) -> list[tuple[IndexEntry, float]]:
+        """
+        Entries ordered by relevance to a job profile.
+
+        Args:
+            job_profile: The job profile to rank against
+            section: Only rank entries of this section (e.g. "work_experience", "education.courses")
+            top_k: Maximum number of entries to return
+
+        Returns:
+            list[tuple[IndexEntry, float]]: (entry, score) pairs, best first
+        """
+        scores = self.score(job_profile)
+        order = np.argsort(-scores, kind="stable")
+        ranked = [
+            (self.entries[i], float(scores[i]))
+            for i in order
+            if section is None or self.entries[i].section == section
+        ]
+        return ranked[:top_k] if top_k is not None else ranked
+
+    def filter_section(
+        self,
+        section: str,
+        entries: list[T],
+        job_profile: JobProfile | None,
+        top_k: int = DEFAULT_RELEVANCE_TOP_K,
+        min_score: float = DEFAULT_RELEVANCE_MIN_SCORE,
+    ) -> list[T] | None:
+        """
+        `relevance.filter_section` with the entries scored by the precomputed matrix.
+
+        Scores are cosine similarities, so `min_score` is one too. Nested lists
+        that are not indexed are still ranked with BM25.
+
+        Returns:
+            list | None: The kept entries in their original order, None if `entries`
+                are not the indexed entries of the section
+        """
+        rows = [row for row, e in enumerate(self.entries) if e.section == section]
+        if [self.entries[row].entry for row in rows] != list(entries):
+            return None
+        if job_profile is None or not entries or top_k <= 0:
+            return entries
+        scores = self.score(job_profile)
+        query = job_profile_terms(job_profile)
+
+        def nested_scores(field: str, i: int, count: int) -> list[float] | None:
+            nested = [
+                float(scores[row])
+                for row, e in enumerate(self.entries)
+                if e.section == f"{section}.{field}" and e.path[0] == i
+            ]
+            return nested if len(nested) == count else None
+
+        kept = filter_relevant(entries, query, top_k, min_score, [float(scores[row]) for row in rows])
+        kept_ids = {id(entry) for entry in kept}
+        result = []
+        for i, entry in enumerate(entries):
+            if id(entry) not in kept_ids:
+                continue
+            update = {
+                field: filter_relevant(
+                    getattr(entry, field),
+                    query,
+                    top_k,
+                    min_score,
+                    nested_scores(field, i, len(getattr(entry, field))),
+                )
+                for field in NESTED_LIST_FIELDS
+                if isinstance(getattr(entry, field, None), list)
+            }
+            result.append(entry.model_copy(update=update) if update else entry)
+        return result
+
+    def coverage(self, job_profile: JobProfile) -> tuple[float, list[str]]:
+        """
+        Share of the job profile's query terms that appear anywhere in the resume.
+
+        Returns:
+            tuple[float, list[str]]: Coverage in [0, 1] and the terms the resume lacks
+        """
+        terms = list(dict.fromkeys(job_profile_terms(job_profile)))
+        if not terms:
+            return 0.0, []
+        missing = [term for term in terms if term not in self.vocabulary]
+        return 1 - len(missing) / len(terms), missing
+
+
+class ResumeIndexStore(Generic[I]):
+    """
+    Holds an index of the full resume and rebuilds it when the file changes.
+
+    Args:
+        path: Location of the full resume JSON
+        factory: Builds the index from the resume (default: ResumeIndex)
+    """
+
+    def __init__(
+        self,
+        path: Path = FULL_RESUME_PATH,
+        factory: Callable[[Resume], I] = ResumeIndex,
+    ):
+        self.path = path
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._index: I | None = None
+        self._mtime: float | None = None
+
+    def get(self) -> I | None:
+        """The index of the current full resume, or None if there is no full resume."""
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if self._index is None or mtime != self._mtime:
+                with open(self.path, "r") as f:
+                    resume = Resume(**json.load(f))
+                self._index = self.factory(resume)
+                self._mtime = mtime
+                logger.info(
+                    f"Built {type(self._index).__name__} of {len(self._index)} resume entries"
+                )
+            return self._index
+
+
+resume_index_store = ResumeIndexStore()
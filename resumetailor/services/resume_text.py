@@ -0,0 +1,53 @@
+"""
+Plain-text views of resume entries, shared by the local scoring services.
+
+The relevance filter, the TF-IDF resume index and the fit score all work on
+the text of individual resume entries, including the courses and projects
+of a degree and the skills of a category.
+"""
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from resumetailor.models import Resume
+
+# Nested lists indexed as entries of their own, per section
+NESTED_ENTRIES = {
+    "education": ("courses", "projects"),
+    "additional_skills": ("specific_skills",),
+}
+
+
+class IndexEntry(NamedTuple):
+    """One resume entry, e.g. ("education.courses", (0, 2), EduCourse(...))."""
+
+    section: str
+    path: tuple[int, ...]
+    entry: BaseModel
+
+
+def flatten_text(value: Any) -> str:
+    """All values of a model, dict or list (recursively) joined into one text."""
+    if value is None:
+        return ""
+    if isinstance(value, BaseModel):
+        return flatten_text(value.model_dump())
+    if isinstance(value, dict):
+        return " ".join(flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(flatten_text(v) for v in value)
+    return str(value)
+
+
+def collect_entries(resume: Resume) -> list[IndexEntry]:
+    """Every entry of a resume, followed by its nested entries, in resume order."""
+    entries = []
+    for section in Resume.model_fields:
+        if section == "personal_information":
+            continue
+        for i, entry in enumerate(getattr(resume, section) or []):
+            entries.append(IndexEntry(section, (i,), entry))
+            for field in NESTED_ENTRIES.get(section, ()):
+                for j, nested in enumerate(getattr(entry, field, None) or []):
+                    entries.append(IndexEntry(f"{section}.{field}", (i, j), nested))
+    return entries
@@ -1,14 +1,37 @@
 """
 Retry utility with exponential backoff for handling rate limits and other transient errors.
 """
+import asyncio
+import threading
 import time
 import logging
 import random
+import re
 import os
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Callable, Any, Type, Union
 from functools import wraps
-from openai import RateLimitError, APIError, APIConnectionError
+from pydantic import BaseModel
+from openai import (
+    RateLimitError,
+    APIError,
+    APIStatusError,
+    APIConnectionError,
+    InternalServerError,
+)
 from langchain_core.exceptions import LangChainException
+from langchain_core.prompts import BasePromptTemplate
+from langchain_core.runnables import Runnable
+
+from resumetailor.services.rate_limit import (
+    TokenBucketRateLimiter,
+    rate_limiter as default_rate_limiter,
+    estimate_tokens,
+    DEFAULT_EXPECTED_OUTPUT_TOKENS,
+)
+from resumetailor.services.llm_cache import LLMCache, llm_cache as default_llm_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +42,11 @@ DEFAULT_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "300.0"))  # 5 minutes
 DEFAULT_BACKOFF_FACTOR = float(os.getenv("RETRY_BACKOFF_FACTOR", "2.0"))
 DEFAULT_JITTER = os.getenv("RETRY_JITTER", "true").lower() in ("true", "1", "yes")
 
-# Retryable exceptions
+# Circuit breaker configuration
+DEFAULT_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+DEFAULT_CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30.0"))
+
+# Retryable exceptions (candidates for a retry, `classify_error` has the final say)
 RETRYABLE_EXCEPTIONS = (
     RateLimitError,
     APIConnectionError,
@@ -27,10 +54,164 @@ RETRYABLE_EXCEPTIONS = (
     LangChainException,
 )
 
+# Error classes
+ERROR_RATE_LIMIT = "rate_limit"  # 429: wait for the limit to reset
+ERROR_TRANSIENT = "transient"  # connection errors, timeouts, 5xx, malformed output
+ERROR_PERMANENT = "permanent"  # 4xx, context length, auth: retrying cannot help
+
+# OpenAI error codes that fail the same way on every attempt
+PERMANENT_ERROR_CODES = {
+    "context_length_exceeded",
+    "insufficient_quota",
+    "invalid_api_key",
+    "invalid_request_error",
+    "model_not_found",
+    "string_above_max_length",
+}
+
+
+class RetryPolicy(BaseModel):
+    """
+    Retry settings for one error class. Unset fields inherit the settings of the decorator.
+    """
+
+    max_retries: int | None = None
+    base_delay: float | None = None
+    max_delay: float | None = None
+
+
+def _env_int(name: str) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def _env_float(name: str) -> float | None:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+DEFAULT_RETRY_POLICIES = {
+    ERROR_RATE_LIMIT: RetryPolicy(
+        max_retries=_env_int("RETRY_RATE_LIMIT_MAX_RETRIES"),
+        base_delay=_env_float("RETRY_RATE_LIMIT_BASE_DELAY"),
+        max_delay=_env_float("RETRY_RATE_LIMIT_MAX_DELAY"),
+    ),
+    ERROR_TRANSIENT: RetryPolicy(
+        max_retries=_env_int("RETRY_TRANSIENT_MAX_RETRIES"),
+        base_delay=_env_float("RETRY_TRANSIENT_BASE_DELAY"),
+        max_delay=_env_float("RETRY_TRANSIENT_MAX_DELAY"),
+    ),
+    ERROR_PERMANENT: RetryPolicy(
+        max_retries=int(os.getenv("RETRY_PERMANENT_MAX_RETRIES", "0")),
+    ),
+}
+
+
+def _error_code(error: Exception) -> str | None:
+    code = getattr(error, "code", None)
+    if code is None:
+        # Bodies that were not unwrapped by the OpenAI client
+        body = getattr(error, "body", None)
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            code = body["error"].get("code")
+    return code if isinstance(code, str) else None
+
+
+def classify_error(error: Exception) -> str | None:
+    """
+    Classify an exception by whether retrying it can succeed.
+
+    Args:
+        error: The exception that was raised
+
+    Returns:
+        str | None: ERROR_RATE_LIMIT, ERROR_TRANSIENT or ERROR_PERMANENT, or None for
+        exceptions this module does not know about
+    """
+    code = _error_code(error)
+    if isinstance(error, RateLimitError):
+        # An exhausted quota is reported as a 429 but never resets by waiting
+        return ERROR_PERMANENT if code == "insufficient_quota" else ERROR_RATE_LIMIT
+    if isinstance(error, APIConnectionError):
+        return ERROR_TRANSIENT
+    if isinstance(error, APIStatusError):
+        if code in PERMANENT_ERROR_CODES:
+            return ERROR_PERMANENT
+        if error.status_code in (408, 409) or error.status_code >= 500:
+            return ERROR_TRANSIENT
+        return ERROR_PERMANENT
+    if isinstance(error, APIError):
+        # No status code, e.g. an interrupted stream
+        return ERROR_TRANSIENT
+    if isinstance(error, LangChainException):
+        # Usually unparseable model output, which a new sample may fix
+        return ERROR_TRANSIENT
+    return None
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse OpenAI reset durations like '1s', '6m0s', '20ms' or '1h2m3.5s'."""
+    value = value.strip()
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header: delay in seconds or an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_after_from_headers(headers: Mapping) -> float | None:
+    """
+    Read the wait time from `retry-after-ms`, `retry-after` or `x-ratelimit-reset-*` headers.
+    """
+    if headers.get("retry-after-ms"):
+        try:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        except ValueError:
+            pass
+    if headers.get("retry-after"):
+        retry_after = _parse_retry_after(headers["retry-after"])
+        if retry_after is not None:
+            return retry_after
+
+    resets = {}
+    for limit in ("requests", "tokens"):
+        reset = headers.get(f"x-ratelimit-reset-{limit}")
+        if reset:
+            seconds = _parse_duration(reset)
+            if seconds is not None:
+                resets[limit] = seconds
+    if not resets:
+        return None
+    # Wait for the limit that is actually exhausted, or the longest one if unknown
+    exhausted = [
+        seconds
+        for limit, seconds in resets.items()
+        if headers.get(f"x-ratelimit-remaining-{limit}") == "0"
+    ]
+    return max(exhausted or resets.values())
+
 
 def extract_retry_after(error: Exception) -> float | None:
     """
-    Extract retry-after value from error message or headers.
+    Extract retry-after value from error headers or message.
     
     Args:
         error: The exception that was raised
@@ -38,13 +219,18 @@ def extract_retry_after(error: Exception) -> float | None:
     Returns:
         float | None: Number of seconds to wait, or None if not found
     """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if isinstance(headers, Mapping):
+        retry_after = _retry_after_from_headers(headers)
+        if retry_after is not None:
+            return retry_after
     if isinstance(error, RateLimitError):
         # OpenAI rate limit errors often include retry-after information
         error_message = str(error)
         if "try again in" in error_message.lower():
             try:
                 # Extract time from messages like "Please try again in 3.234s"
-                import re
                 match = re.search(r'try again in (\d+\.?\d*)s', error_message)
                 if match:
                     return float(match.group(1))
@@ -84,6 +270,97 @@ def exponential_backoff_with_jitter(
     return max(0, delay)
 
 
+def _compute_delay(
+    error: Exception,
+    attempt: int,
+    base_delay: float,
+    backoff_factor: float,
+    max_delay: float,
+    jitter: bool,
+    respect_retry_after: bool,
+) -> float:
+    """
+    Calculate how long to wait before the next attempt.
+
+    Args:
+        error: The exception raised by the failed attempt
+        attempt: Current attempt number (0-indexed)
+        base_delay: Base delay in seconds
+        backoff_factor: Multiplier for exponential backoff
+        max_delay: Maximum delay in seconds
+        jitter: Whether to add random jitter
+        respect_retry_after: Whether to respect retry-after hints from errors
+
+    Returns:
+        float: Delay in seconds
+    """
+    if respect_retry_after:
+        retry_after = extract_retry_after(error)
+        if retry_after:
+            return retry_after + random.uniform(0.1, 0.5)  # Add small jitter to retry-after
+    return exponential_backoff_with_jitter(
+        attempt, base_delay, backoff_factor, max_delay, jitter
+    )
+
+
+def _next_delay(
+    func: Callable,
+    error: Exception,
+    attempts: dict[str, int],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    backoff_factor: float,
+    jitter: bool,
+    respect_retry_after: bool,
+    retry_policies: dict[str, RetryPolicy],
+) -> float | None:
+    """
+    Decide whether to retry after `error`, following the policy of its error class.
+
+    Args:
+        func: The function being retried (for logging)
+        error: The exception raised by the failed attempt
+        attempts: Retries made so far per error class, updated in place
+
+    Returns:
+        float | None: Delay in seconds before the next attempt, or None to give up
+    """
+    func_name = getattr(func, '__name__', 'unknown_function')
+    error_class = classify_error(error) or ERROR_TRANSIENT
+    policy = retry_policies.get(error_class) or RetryPolicy()
+    class_max_retries = max_retries if policy.max_retries is None else policy.max_retries
+    retries = attempts.get(error_class, 0)
+
+    if retries >= class_max_retries:
+        if class_max_retries == 0:
+            logger.error(
+                f"Function {func_name} failed with non-retryable {error_class} error: {error}"
+            )
+        else:
+            logger.error(
+                f"Function {func_name} failed after {retries + 1} attempts. "
+                f"Last error: {error}"
+            )
+        return None
+
+    delay = _compute_delay(
+        error,
+        sum(attempts.values()),
+        base_delay if policy.base_delay is None else policy.base_delay,
+        backoff_factor,
+        max_delay if policy.max_delay is None else policy.max_delay,
+        jitter,
+        respect_retry_after,
+    )
+    attempts[error_class] = retries + 1
+    logger.warning(
+        f"Function {func_name} failed on attempt {retries + 1}/{class_max_retries + 1} "
+        f"({error_class}). Error: {error}. Retrying in {delay:.2f} seconds..."
+    )
+    return delay
+
+
 def retry_with_exponential_backoff(
     max_retries: int = DEFAULT_MAX_RETRIES,
     base_delay: float = DEFAULT_BASE_DELAY,
@@ -92,9 +369,14 @@ def retry_with_exponential_backoff(
     jitter: bool = DEFAULT_JITTER,
     retryable_exceptions: tuple[Type[Exception], ...] = RETRYABLE_EXCEPTIONS,
     respect_retry_after: bool = True,
+    retry_policies: dict[str, RetryPolicy] | None = None,
 ):
     """
     Decorator to retry function calls with exponential backoff.
+
+    Errors are classified with `classify_error`, and each class is retried
+    according to its own policy. Permanent errors (bad requests, context
+    length, auth) are not retried by default.
     
     Args:
         max_retries: Maximum number of retry attempts
@@ -104,66 +386,303 @@ def retry_with_exponential_backoff(
         jitter: Whether to add random jitter to delays
         retryable_exceptions: Tuple of exception types that should trigger retries
         respect_retry_after: Whether to respect retry-after hints from errors
+        retry_policies: Per error class overrides (defaults to `DEFAULT_RETRY_POLICIES`)
         
     Returns:
         Decorated function that will retry on failure
     """
+    policies = DEFAULT_RETRY_POLICIES if retry_policies is None else retry_policies
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
+            attempts: dict[str, int] = {}
             
-            for attempt in range(max_retries + 1):
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except retryable_exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_retries:
-                        func_name = getattr(func, '__name__', 'unknown_function')
-                        logger.error(
-                            f"Function {func_name} failed after {max_retries + 1} attempts. "
-                            f"Last error: {e}"
-                        )
-                        raise e
-                    
-                    # Calculate delay
-                    if respect_retry_after:
-                        retry_after = extract_retry_after(e)
-                        if retry_after:
-                            delay = retry_after + random.uniform(0.1, 0.5)  # Add small jitter to retry-after
-                        else:
-                            delay = exponential_backoff_with_jitter(
-                                attempt, base_delay, backoff_factor, max_delay, jitter
-                            )
-                    else:
-                        delay = exponential_backoff_with_jitter(
-                            attempt, base_delay, backoff_factor, max_delay, jitter
-                        )
-                    
-                    func_name = getattr(func, '__name__', 'unknown_function')
-                    logger.warning(
-                        f"Function {func_name} failed on attempt {attempt + 1}/{max_retries + 1}. "
-                        f"Error: {e}. Retrying in {delay:.2f} seconds..."
+                    delay = _next_delay(
+                        func, e, attempts, max_retries, base_delay, max_delay,
+                        backoff_factor, jitter, respect_retry_after, policies,
                     )
-                    
+                    if delay is None:
+                        raise e
                     time.sleep(delay)
                 except Exception as e:
                     # Non-retryable exception, fail immediately
                     func_name = getattr(func, '__name__', 'unknown_function')
                     logger.error(f"Function {func_name} failed with non-retryable error: {e}")
                     raise e
-            
-            # This should never be reached due to the raise in the loop
-            raise last_exception
         
         return wrapper
     return decorator
 
 
+def async_retry_with_exponential_backoff(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    jitter: bool = DEFAULT_JITTER,
+    retryable_exceptions: tuple[Type[Exception], ...] = RETRYABLE_EXCEPTIONS,
+    respect_retry_after: bool = True,
+    retry_policies: dict[str, RetryPolicy] | None = None,
+):
+    """
+    Decorator to retry coroutine functions with exponential backoff.
+
+    Same semantics as `retry_with_exponential_backoff`, but waits with
+    `asyncio.sleep` so no thread is held while backing off. Cancelling the
+    awaiting task interrupts the wait immediately.
+
+    Args:
+        max_retries: Maximum number of retry attempts
+        base_delay: Base delay in seconds for exponential backoff
+        max_delay: Maximum delay in seconds
+        backoff_factor: Multiplier for exponential backoff
+        jitter: Whether to add random jitter to delays
+        retryable_exceptions: Tuple of exception types that should trigger retries
+        respect_retry_after: Whether to respect retry-after hints from errors
+        retry_policies: Per error class overrides (defaults to `DEFAULT_RETRY_POLICIES`)
+
+    Returns:
+        Decorated coroutine function that will retry on failure
+    """
+    policies = DEFAULT_RETRY_POLICIES if retry_policies is None else retry_policies
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            attempts: dict[str, int] = {}
+
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except retryable_exceptions as e:
+                    delay = _next_delay(
+                        func, e, attempts, max_retries, base_delay, max_delay,
+                        backoff_factor, jitter, respect_retry_after, policies,
+                    )
+                    if delay is None:
+                        raise e
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    # Non-retryable exception, fail immediately
+                    func_name = getattr(func, '__name__', 'unknown_function')
+                    logger.error(f"Function {func_name} failed with non-retryable error: {e}")
+                    raise e
+
+        return wrapper
+    return decorator
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(
+            f"Service '{name}' is unavailable (circuit open). "
+            f"Retry in {retry_after:.1f} seconds."
+        )
+
+
+def _is_openai_outage(error: Exception) -> bool:
+    """Connection problems and 5xx responses mean OpenAI is down, 4xx do not."""
+    return isinstance(error, (APIConnectionError, InternalServerError))
+
+
+# Circuit breakers of the production dependencies, by name (exposed on /health)
+circuit_breakers: dict[str, "CircuitBreaker"] = {}
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for an external dependency.
+
+    Opens after `failure_threshold` consecutive failures, rejects calls with
+    `CircuitOpenError` while open, and after `recovery_timeout` seconds lets a
+    single probe call through (half-open). A successful probe closes the
+    circuit again, a failed one re-opens it.
+
+    Breakers created with `register=True` are listed in `circuit_breakers`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+        register: bool = False,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        if register:
+            circuit_breakers[name] = self
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def _retry_after(self) -> float:
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def raise_if_open(self):
+        """
+        Fail fast if the circuit is open, without claiming the half-open probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            if self._current_state() == self.OPEN:
+                raise CircuitOpenError(self.name, self._retry_after())
+
+    def before_call(self):
+        """
+        Check whether a call may go through.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe already running
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logger.info(f"Circuit '{self.name}' half-open, probing recovery")
+                return
+            raise CircuitOpenError(self.name, self._retry_after())
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.error(
+                        f"Circuit '{self.name}' opened after {self._failures} consecutive failures"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def reset(self):
+        """Close the circuit and forget all failures."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._opened_at = 0.0
+            self._probe_in_flight = False
+
+    def _record(self, error: Exception | None):
+        if error is not None and self.is_failure(error):
+            self.record_failure()
+        else:
+            # Any response, even an error one, proves the dependency is reachable
+            self.record_success()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call `func` through the circuit breaker."""
+        self.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._record(e)
+            raise
+        self._record(None)
+        return result
+
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """Await the coroutine function `func` through the circuit breaker."""
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            with self._lock:
+                self._probe_in_flight = False
+            raise
+        except Exception as e:
+            self._record(e)
+            raise
+        self._record(None)
+        return result
+
+    def snapshot(self) -> dict:
+        """Current state for health reporting."""
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_after": round(self._retry_after(), 1) if state == self.OPEN else None,
+            }
+
+
+openai_circuit_breaker = CircuitBreaker("openai", is_failure=_is_openai_outage, register=True)
+
+
+def _find_model_name(runnable: Any) -> str:
+    """Find the model name of the chat model inside a (structured-output) chain."""
+    model_name = getattr(runnable, "model_name", None)
+    if isinstance(model_name, str):
+        return model_name
+    children = getattr(runnable, "steps", None)
+    children = list(children) if isinstance(children, list) else []
+    children.append(getattr(runnable, "bound", None))
+    for child in children:
+        if not isinstance(child, Runnable):
+            continue
+        model_name = _find_model_name(child)
+        if model_name:
+            return model_name
+    return ""
+
+
 class RetryableChain:
     """
     Wrapper class for LangChain chains that adds retry functionality.
+
+    Every attempt (including retries) first takes capacity from the shared
+    rate limiter, so calls are queued instead of being sent into a 429, and
+    goes through the OpenAI circuit breaker, so an outage fails fast. When a
+    call is rate limited anyway, the reported reset time becomes a cooldown
+    for every other caller of the limiter.
+
+    Chains with an `output_schema` are looked up in the LLM response cache
+    (when it is enabled) before any of that, so a hit costs no API call.
     """
     
     def __init__(
@@ -174,6 +693,12 @@ class RetryableChain:
         max_delay: float = DEFAULT_MAX_DELAY,
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
         jitter: bool = DEFAULT_JITTER,
+        rate_limiter: TokenBucketRateLimiter | None = default_rate_limiter,
+        expected_output_tokens: int = DEFAULT_EXPECTED_OUTPUT_TOKENS,
+        circuit_breaker: CircuitBreaker | None = openai_circuit_breaker,
+        retry_policies: dict[str, RetryPolicy] | None = None,
+        output_schema: type[BaseModel] | None = None,
+        cache: LLMCache | None = default_llm_cache,
     ):
         self.chain = chain
         self.max_retries = max_retries
@@ -181,17 +706,155 @@ class RetryableChain:
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
         self.jitter = jitter
-    
+        self.rate_limiter = rate_limiter
+        self.expected_output_tokens = expected_output_tokens
+        self.circuit_breaker = circuit_breaker
+        self.retry_policies = retry_policies
+        self.output_schema = output_schema
+        self.cache = cache
+        # Decorate once: the wrappers are reused by every call of a long-lived chain
+        retry_config = dict(
+            max_retries=max_retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            backoff_factor=backoff_factor,
+            jitter=jitter,
+            retry_policies=retry_policies,
+        )
+        self._retryable_invoke = retry_with_exponential_backoff(**retry_config)(self._invoke)
+        self._retryable_ainvoke = async_retry_with_exponential_backoff(**retry_config)(
+            self._ainvoke
+        )
+
+    def estimate_tokens(self, input: Any) -> int:
+        """Estimate prompt + output tokens for one invocation of the chain."""
+        prompt = getattr(self.chain, "first", None)
+        if isinstance(prompt, BasePromptTemplate):
+            try:
+                input = prompt.invoke(input).to_string()
+            except Exception:
+                pass  # fall back to estimating from the raw input
+        return estimate_tokens(input) + self.expected_output_tokens
+
     @property
-    def invoke(self):
-        """Return a retryable version of the chain's invoke method."""
-        return retry_with_exponential_backoff(
-            max_retries=self.max_retries,
-            base_delay=self.base_delay,
-            max_delay=self.max_delay,
-            backoff_factor=self.backoff_factor,
-            jitter=self.jitter,
-        )(self.chain.invoke)
+    def _cache_enabled(self) -> bool:
+        return self.output_schema is not None and self.cache is not None and self.cache.enabled
+
+    def cache_key(self, input: Any) -> str:
+        """Content address of one invocation: model, rendered messages and output schema."""
+        messages = input
+        prompt = getattr(self.chain, "first", None)
+        if isinstance(prompt, BasePromptTemplate):
+            messages = prompt.invoke(input).to_messages()
+        return make_cache_key(_find_model_name(self.chain), messages, self.output_schema)
+
+    def _acquire_tokens(self, input: Any) -> int:
+        # Rendering the prompt is only worth it when the buckets are enforced
+        return self.estimate_tokens(input) if self.rate_limiter.enabled else 0
+
+    def _start_cooldown(self, error: Exception):
+        if self.rate_limiter is not None and classify_error(error) == ERROR_RATE_LIMIT:
+            retry_after = extract_retry_after(error)
+            if retry_after:
+                self.rate_limiter.cooldown(retry_after)
+
+    def _call(self, input: Any, *args, **kwargs) -> Any:
+        if self.circuit_breaker is None:
+            return self.chain.invoke(input, *args, **kwargs)
+        return self.circuit_breaker.call(self.chain.invoke, input, *args, **kwargs)
+
+    async def _acall(self, input: Any, *args, **kwargs) -> Any:
+        if self.circuit_breaker is None:
+            return await self.chain.ainvoke(input, *args, **kwargs)
+        return await self.circuit_breaker.acall(self.chain.ainvoke, input, *args, **kwargs)
+
+    def _invoke(self, input: Any, *args, **kwargs) -> Any:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.raise_if_open()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._acquire_tokens(input))
+        try:
+            result = self._call(input, *args, **kwargs)
+        except RateLimitError as e:
+            self._start_cooldown(e)
+            raise
+        return result
+
+    async def _ainvoke(self, input: Any, *args, **kwargs) -> Any:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.raise_if_open()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(self._acquire_tokens(input))
+        try:
+            result = await self._acall(input, *args, **kwargs)
+        except RateLimitError as e:
+            self._start_cooldown(e)
+            raise
+        return result
+
+    def _retry(self, input: Any, *args, **kwargs) -> Any:
+        try:
+            return self._retryable_invoke(input, *args, **kwargs)
+        finally:
+            # The exemption only covers the retries of this call, even if they all failed
+            if self.rate_limiter is not None:
+                self.rate_limiter.clear_exemption()
+
+    async def _aretry(self, input: Any, *args, **kwargs) -> Any:
+        try:
+            return await self._retryable_ainvoke(input, *args, **kwargs)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.clear_exemption()
+    
+    def invoke(self, input: Any, *args, **kwargs) -> Any:
+        """Invoke the chain with retries (answered from the cache when possible)."""
+        if not self._cache_enabled:
+            return self._retry(input, *args, **kwargs)
+        key = self.cache_key(input)
+        cached = self.cache.get(key, self.output_schema)
+        if cached is not None:
+            logger.info(f"LLM cache hit for {self.output_schema.__name__}")
+            return cached
+        result = self._retry(input, *args, **kwargs)
+        if isinstance(result, BaseModel):
+            self.cache.set(key, result)
+        return result
+
+    async def ainvoke(self, input: Any, *args, **kwargs) -> Any:
+        """Async variant of `invoke`."""
+        if not self._cache_enabled:
+            return await self._aretry(input, *args, **kwargs)
+        key = self.cache_key(input)
+        cached = await asyncio.to_thread(self.cache.get, key, self.output_schema)
+        if cached is not None:
+            logger.info(f"LLM cache hit for {self.output_schema.__name__}")
+            return cached
+        result = await self._aretry(input, *args, **kwargs)
+        if isinstance(result, BaseModel):
+            await asyncio.to_thread(self.cache.set, key, result)
+        return result
+
+    async def abatch(self, inputs: list[Any], config: Any = None, **kwargs) -> list[Any]:
+        """
+        Invoke the chain concurrently on a list of inputs.
+
+        Each input is retried on its own, so one rate-limited item does not
+        re-send the whole batch. `max_concurrency` in the config caps the
+        number of inputs in flight, as in LangChain.
+        """
+        max_concurrency = config.get("max_concurrency") if isinstance(config, dict) else None
+        if not max_concurrency:
+            return await asyncio.gather(
+                *(self.ainvoke(item, config, **kwargs) for item in inputs)
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def ainvoke(item):
+            async with semaphore:
+                return await self.ainvoke(item, config, **kwargs)
+
+        return await asyncio.gather(*(ainvoke(item) for item in inputs))
     
     def __getattr__(self, name):
         """Delegate other attributes to the wrapped chain."""
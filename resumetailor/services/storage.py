@@ -5,6 +5,9 @@ from datetime import datetime
 from resumetailor.models import JobProfile, Resume, CoverLetter, PersonalInfo
 from resumetailor.core.session import session_manager, Info
 from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.services.job_profile_cache import job_profile_cache
+from resumetailor.services.near_duplicates import near_duplicate_index
+from resumetailor.services.warm_start import save_warm_start, warm_start_index
 
 
 def load_anon_info() -> PersonalInfo:
@@ -66,6 +69,9 @@ def save_job_profile(session_id: str):
     job_profile = session_manager.get_session_data(session_id, "job_profile")
     with open(data_dir / "job_profile.json", "w") as f:
         json.dump(job_profile.model_dump(), f, indent=2)
+    # The reviewed profile replaces the raw extraction for this posting
+    job_profile_cache.set(job_description, job_profile)
+    near_duplicate_index.add(data_dir, job_description)
 
 
 def load_job_profile(session_id: str) -> JobProfile:
@@ -107,6 +113,13 @@ def save_refined_resume(session_id: str):
     refined_resume = session_manager.get_session_data(session_id, "refined_resume")
     with open(data_dir / "resume.json", "w") as f:
         json.dump(refined_resume.model_dump(), f, indent=2)
+    # Tailored resumes warm-start later applications to similar jobs
+    job_profile = session_manager.get_session_data(session_id, "job_profile")
+    tailored_resume = session_manager.get_session_data(session_id, "tailored_resume")
+    digests = session_manager.get_session_data(session_id, "section_digests")
+    if job_profile is not None and tailored_resume is not None and digests:
+        save_warm_start(data_dir, tailored_resume, digests)
+        warm_start_index.add(data_dir, job_profile)
 
 
 def load_refined_resume(session_id: str) -> Resume:
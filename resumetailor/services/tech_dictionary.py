@@ -0,0 +1,328 @@
+"""
+Dictionary scan of job descriptions for a draft job profile without LLM calls.
+
+A curated dictionary of technologies, certifications and languages is compiled
+once into an Aho-Corasick automaton, which finds every alias in a job
+description in a single pass over the text. The matches give a draft
+`JobProfile` in milliseconds, while the LLM extraction refines it.
+"""
+import logging
+from collections import deque
+from typing import Iterator, NamedTuple
+
+from resumetailor.models import JobProfile
+
+logger = logging.getLogger(__name__)
+
+# Job profile field -> canonical name -> aliases (matched case-insensitively)
+TECHNOLOGIES = {
+    "Python": ["python3"],
+    "Java": [],
+    "JavaScript": ["js", "ecmascript"],
+    "TypeScript": [],
+    "C++": ["cpp"],
+    "C#": ["csharp"],
+    "Kotlin": [],
+    "Scala": [],
+    "Ruby": [],
+    "PHP": [],
+    "Golang": [],
+    "Rust": [],
+    "MATLAB": [],
+    "Bash": ["shell scripting"],
+    "SQL": [],
+    "NoSQL": ["no-sql"],
+    "PostgreSQL": ["postgres", "psql"],
+    "MySQL": [],
+    "SQLite": [],
+    "MongoDB": ["mongo"],
+    "Redis": [],
+    "Elasticsearch": ["elastic search"],
+    "Cassandra": [],
+    "BigQuery": [],
+    "Databricks": [],
+    "Apache Kafka": ["kafka"],
+    "Apache Airflow": ["airflow"],
+    "dbt": [],
+    "Hadoop": [],
+    "Pandas": [],
+    "NumPy": [],
+    "SciPy": [],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "PyTorch": [],
+    "TensorFlow": [],
+    "Keras": [],
+    "JAX": [],
+    "Hugging Face": ["huggingface", "hugging face transformers"],
+    "LangChain": [],
+    "LangGraph": [],
+    "OpenAI API": [],
+    "MLflow": [],
+    "Kubeflow": [],
+    "SageMaker": ["aws sagemaker", "amazon sagemaker"],
+    "OpenCV": [],
+    "spaCy": [],
+    "React": ["react.js", "reactjs"],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Next.js": ["nextjs"],
+    "Node.js": ["nodejs"],
+    "Express.js": ["expressjs"],
+    "Django": [],
+    "Flask": [],
+    "FastAPI": [],
+    "Spring Boot": [],
+    ".NET": ["dotnet", "asp.net"],
+    "GraphQL": [],
+    "REST API": ["rest apis", "restful", "restful api", "restful apis"],
+    "gRPC": [],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "Tailwind CSS": ["tailwind"],
+    "AWS": ["amazon web services"],
+    "Azure": ["microsoft azure"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Docker": [],
+    "Kubernetes": ["k8s"],
+    "Terraform": [],
+    "Ansible": [],
+    "CloudFormation": ["aws cloudformation"],
+    "Linux": [],
+    "Git": [],
+    "GitHub": [],
+    "GitHub Actions": [],
+    "GitLab": [],
+    "GitLab CI": [],
+    "Jenkins": [],
+    "CI/CD": ["cicd", "ci / cd"],
+    "Prometheus": [],
+    "Grafana": [],
+    "Tableau": [],
+    "Power BI": ["powerbi"],
+    "Microsoft Excel": [],
+    "Jira": [],
+    "Confluence": [],
+    "SAP": [],
+    "Salesforce": [],
+    "Figma": [],
+}
+CERTIFICATIONS = {
+    "AWS Certified Cloud Practitioner": [],
+    "AWS Certified Solutions Architect": [],
+    "AWS Certified Developer": [],
+    "AWS Certified DevOps Engineer": [],
+    "AWS Certified Machine Learning": [],
+    "AWS Certified Data Engineer": [],
+    "Azure Fundamentals": ["az-900"],
+    "Azure Administrator": ["az-104"],
+    "Azure Solutions Architect": ["az-305"],
+    "Azure Data Engineer": ["dp-203"],
+    "Azure AI Engineer": ["ai-102"],
+    "Google Cloud Professional Data Engineer": ["professional data engineer"],
+    "Google Cloud Professional Cloud Architect": ["professional cloud architect"],
+    "Google Cloud Professional Machine Learning Engineer": ["professional machine learning engineer"],
+    "Certified Kubernetes Administrator": ["cka"],
+    "Certified Kubernetes Application Developer": ["ckad"],
+    "HashiCorp Certified Terraform Associate": ["terraform associate"],
+    "CISSP": [],
+    "CISM": [],
+    "CompTIA Security+": ["security+"],
+    "PMP": ["project management professional"],
+    "PRINCE2": [],
+    "Certified ScrumMaster": ["certified scrum master"],
+    "Professional Scrum Master": [],
+    "ITIL": [],
+    "TOGAF": [],
+}
+LANGUAGES = {
+    "English": [],
+    "German": ["deutsch"],
+    "French": ["français", "francais"],
+    "Spanish": ["español", "espanol"],
+    "Italian": ["italiano"],
+    "Portuguese": [],
+    "Dutch": [],
+    "Polish": [],
+    "Swedish": [],
+    "Danish": [],
+    "Norwegian": [],
+    "Finnish": [],
+    "Czech": [],
+    "Russian": [],
+    "Ukrainian": [],
+    "Turkish": [],
+    "Arabic": [],
+    "Hebrew": [],
+    "Hindi": [],
+    "Chinese": ["mandarin", "cantonese"],
+    "Japanese": [],
+    "Korean": [],
+}
+DICTIONARY = {
+    "required_technologies": TECHNOLOGIES,
+    "certifications": CERTIFICATIONS,
+    "languages": LANGUAGES,
+}
+# Aliases that are also common words, matched only with exactly this casing.
+# Single letters ("C", "R") and "Go" are left out, they match "C-level", "R&D", "Go-to-market".
+CASE_SENSITIVE_ALIASES = {
+    "required_technologies": {
+        "Swift": "Swift",
+        "Spark": "Apache Spark",
+        "Apache Spark": "Apache Spark",
+        "PySpark": "Apache Spark",
+        "Dart": "Dart",
+        "Flutter": "Flutter",
+        "Rails": "Ruby on Rails",
+        "Ruby on Rails": "Ruby on Rails",
+        "Snowflake": "Snowflake",
+        "Express": "Express.js",
+        "Spring": "Spring Boot",
+        "Helm": "Helm",
+        "Julia": "Julia",
+        "Excel": "Microsoft Excel",
+    },
+}
+# Characters that continue a term, e.g. "C++" is not "C" and "Javascript" is not "Java"
+_WORD_CHARS = set("abcdefghijklmnopqrstuvwxyz0123456789+#_")
+
+
+class Match(NamedTuple):
+    """A dictionary term found in a text, e.g. Match(12, 22, ("required_technologies", "Kubernetes"))."""
+
+    start: int
+    end: int
+    value: tuple[str, str]
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher finding all patterns in one pass over a text.
+
+    Args:
+        patterns: Pattern -> value reported for each occurrence
+    """
+
+    def __init__(self, patterns: dict[str, tuple[str, str]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, tuple[str, str]]]] = [[]]
+        for pattern, value in patterns.items():
+            self._add(pattern, value)
+        self._build_failure_links()
+
+    def _add(self, pattern: str, value: tuple[str, str]):
+        state = 0
+        for char in pattern:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].append((len(pattern), value))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def iter(self, text: str) -> Iterator[Match]:
+        """All (possibly overlapping) occurrences of the patterns in `text`."""
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, value in self._output[state]:
+                yield Match(i + 1 - length, i + 1, value)
+
+
+def _lower(text: str) -> str:
+    """Lowercase `text` without changing character positions."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char.lower()[0] for char in text)
+
+
+def _is_word(text: str, start: int, end: int) -> bool:
+    before = text[start - 1].lower() if start > 0 else " "
+    after = text[end].lower() if end < len(text) else " "
+    return before not in _WORD_CHARS and after not in _WORD_CHARS
+
+
+def _longest_matches(text: str, matches: list[Match]) -> list[Match]:
+    """Leftmost-longest non-overlapping whole-word matches, in order of appearance."""
+    matches = sorted(
+        (m for m in matches if _is_word(text, m.start, m.end)),
+        key=lambda m: (m.start, m.start - m.end),
+    )
+    selected, position = [], 0
+    for match in matches:
+        if match.start >= position:
+            selected.append(match)
+            position = match.end
+    return selected
+
+
+class TechDictionary:
+    """
+    Compiled dictionary of technologies, certifications and languages.
+
+    Args:
+        dictionary: Job profile field -> canonical name -> aliases
+        case_sensitive: Job profile field -> alias -> canonical name, matched with exact casing
+    """
+
+    def __init__(
+        self,
+        dictionary: dict[str, dict[str, list[str]]] = DICTIONARY,
+        case_sensitive: dict[str, dict[str, str]] = CASE_SENSITIVE_ALIASES,
+    ):
+        patterns = {}
+        for field, terms in dictionary.items():
+            for canonical, aliases in terms.items():
+                for alias in [canonical, *aliases]:
+                    patterns.setdefault(alias.lower(), (field, canonical))
+        self._automaton = AhoCorasick(patterns)
+        exact = {
+            alias: (field, canonical)
+            for field, aliases in case_sensitive.items()
+            for alias, canonical in aliases.items()
+        }
+        self._exact_automaton = AhoCorasick(exact)
+        logger.info(f"Compiled dictionary of {len(patterns) + len(exact)} terms")
+
+    def find(self, text: str) -> list[Match]:
+        """Dictionary terms in a text, in order of appearance."""
+        matches = list(self._automaton.iter(_lower(text)))
+        matches += self._exact_automaton.iter(text)
+        return _longest_matches(text, matches)
+
+    def draft_job_profile(self, job_description: str) -> JobProfile:
+        """
+        Draft job profile with the technologies, certifications and languages of a job description.
+
+        Every term is listed once under its canonical name; fields without any
+        match are None, as in an LLM extraction that found nothing.
+        """
+        found: dict[str, list[str]] = {field: [] for field in DICTIONARY}
+        for match in self.find(job_description):
+            field, canonical = match.value
+            if canonical not in found.setdefault(field, []):
+                found[field].append(canonical)
+        return JobProfile(**{field: terms or None for field, terms in found.items()})
+
+
+tech_dictionary = TechDictionary()
@@ -1,8 +1,17 @@
 from pydantic import BaseModel
+from functools import lru_cache
+from typing import Any
+import os
 import yaml
 import json
 from rich import print
 
+from resumetailor.services.rate_limit import estimate_tokens
+
+# How models are embedded into prompts: "compact" (minified JSON without empty
+# fields) or "pretty" (indented JSON of all fields, as `model_to_str`)
+PROMPT_FORMAT = os.getenv("PROMPT_FORMAT", "compact").lower()
+
 
 def str_to_model(data_str: str, model: BaseModel, format: str = "json") -> BaseModel:
     """
@@ -29,3 +38,72 @@ def model_to_str(model: BaseModel | list[BaseModel], format: str = "json") -> st
         return yaml.dump(data, sort_keys=False)
     else:
         return json.dumps(data, indent=2)
+
+
+def _prune_empty(data: Any) -> Any:
+    """Recursively drop None values and empty strings, lists and dicts."""
+    if isinstance(data, dict):
+        pruned = {key: _prune_empty(value) for key, value in data.items()}
+        return {key: value for key, value in pruned.items() if value not in (None, "", [], {})}
+    if isinstance(data, list):
+        pruned = [_prune_empty(value) for value in data]
+        return [value for value in pruned if value not in (None, "", [], {})]
+    return data
+
+
+def model_to_prompt(model: Any, format: str | None = None) -> str:
+    """
+    Serialize a BaseModel (or a list of them) for embedding into a prompt.
+
+    In the default "compact" format null and empty fields are dropped and JSON is
+    written without indentation, which saves tokens on every call without losing
+    information. Values that are not models are passed through `str`.
+    format: 'compact' (default, see PROMPT_FORMAT) or 'pretty'
+    """
+    format = format or PROMPT_FORMAT
+    if format == "pretty":
+        if isinstance(model, (BaseModel, list)):
+            return model_to_str(model)
+        return str(model)
+    if isinstance(model, list):
+        data = [m.model_dump(mode="json") if isinstance(m, BaseModel) else m for m in model]
+    elif isinstance(model, BaseModel):
+        data = model.model_dump(mode="json")
+    else:
+        return "" if model is None else str(model)
+    return json.dumps(_prune_empty(data), separators=(",", ":"), ensure_ascii=False)
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    """The o200k tokenizer if tiktoken and its encoding file are available, else None."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a prompt text.
+
+    Uses tiktoken when it is installed and falls back to the character
+    based estimate of the rate limiter otherwise.
+    """
+    encoding = _token_encoding()
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text))
+
+
+def prompt_token_savings(model: BaseModel | list[BaseModel]) -> tuple[int, int]:
+    """
+    Compare the prompt serialization of a model with indented JSON of all fields.
+
+    Returns:
+        tuple[int, int]: Tokens of `model_to_prompt` and tokens saved against `model_to_str`
+    """
+    tokens = count_tokens(model_to_prompt(model))
+    return tokens, count_tokens(model_to_str(model)) - tokens
@@ -0,0 +1,246 @@
+"""
+Warm start of resume tailoring from the most similar saved application.
+
+Applications are often made for nearly identical roles, whose refined resume
+is already saved. The job profiles of all saved applications are vectorized
+into an L2-normalized TF-IDF matrix, so the nearest one to a new job profile
+is a single matrix-vector product. Its refined sections are then reused: a
+section whose inputs (the full resume section and the job profile) are
+unchanged is taken over as it is, any other section is revised from the
+previous version and the difference between the two job profiles instead of
+being written from scratch.
+"""
+import json
+import math
+import os
+import threading
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+from pydantic import BaseModel, ValidationError
+
+from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.models import JobProfile, Resume
+from resumetailor.services.candidate_context import SECTIONS, section_digest
+from resumetailor.services.relevance import job_profile_terms, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Warm start configuration
+WARM_START_THRESHOLD = float(os.getenv("WARM_START_THRESHOLD", "0.6"))  # 0 disables warm starts
+
+# Saved next to resume.json, which holds the compiled (flattened) output resume:
+# the refined resume before compilation, and the digests of the full resume
+# sections it was tailored from
+TAILORED_RESUME_FILE = "tailored_resume.json"
+SECTION_DIGESTS_FILE = "section_digests.json"
+
+
+def section_digests(resume: Resume) -> dict[str, str]:
+    """Hex SHA-256 digest of every section of a resume, to detect changed sections."""
+    return {section: section_digest(getattr(resume, section)) for section in SECTIONS}
+
+
+def save_warm_start(data_dir: Path, tailored_resume: Resume, digests: dict[str, str]):
+    """Record the refined resume of a saved application and the full resume sections it was tailored from."""
+    with open(data_dir / TAILORED_RESUME_FILE, "w") as f:
+        json.dump(tailored_resume.model_dump(mode="json"), f, indent=2)
+    with open(data_dir / SECTION_DIGESTS_FILE, "w") as f:
+        json.dump(digests, f, indent=2)
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def job_profile_diff(previous: JobProfile, current: JobProfile) -> dict[str, dict]:
+    """
+    Fields in which two job profiles differ.
+
+    List fields report the items that were added and removed (compared
+    case-insensitively), other fields their value before and after.
+
+    Returns:
+        dict[str, dict]: Field -> {"added", "removed"} or {"before", "after"}, empty if equal
+    """
+    diff = {}
+    for name in JobProfile.model_fields:
+        before, after = getattr(previous, name), getattr(current, name)
+        if isinstance(before, list) or isinstance(after, list):
+            before_items = {_normalize(item) for item in before or []}
+            after_items = {_normalize(item) for item in after or []}
+            changes = {
+                "added": [item for item in after or [] if _normalize(item) not in before_items],
+                "removed": [item for item in before or [] if _normalize(item) not in after_items],
+            }
+            changes = {key: items for key, items in changes.items() if items}
+            if changes:
+                diff[name] = changes
+        elif _normalize(before or "") != _normalize(after or ""):
+            diff[name] = {"before": before, "after": after}
+    return diff
+
+
+def _profile_terms(job_profile: JobProfile) -> list[str]:
+    return job_profile_terms(job_profile) + tokenize(job_profile.position or "")
+
+
+class WarmStart(NamedTuple):
+    """The saved application nearest to a job profile, with its refined resume."""
+
+    application_id: str
+    similarity: float
+    job_profile: JobProfile
+    resume: Resume
+    section_digests: dict[str, str]
+
+    def previous_sections(self, full_resume: Resume) -> dict[str, list[BaseModel]]:
+        """
+        Refined sections that were tailored from the same full resume sections.
+
+        Sections of the full resume that were edited since the application was
+        saved are left out, they are written from scratch.
+        """
+        current = section_digests(full_resume)
+        return {
+            section: getattr(self.resume, section)
+            for section in SECTIONS
+            if getattr(self.resume, section)
+            and self.section_digests.get(section) == current[section]
+        }
+
+
+class WarmStartIndex:
+    """
+    TF-IDF matrix of the job profiles of saved applications (one L2-normalized row each).
+
+    Args:
+        threshold: Minimum cosine similarity of a warm start, 0 disables lookups
+    """
+
+    def __init__(self, threshold: float = WARM_START_THRESHOLD):
+        self.threshold = threshold
+        self._terms: dict[str, Counter] = {}
+        self._data_dirs: dict[str, Path] = {}
+        self._lock = threading.Lock()
+        # Rebuilt lazily after additions and removals
+        self._keys: list[str] = []
+        self._vocabulary: dict[str, int] = {}
+        self._idf = np.zeros(0, dtype=np.float32)
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._stale = False
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, data_dir: Path, job_profile: JobProfile):
+        """Index (or re-index) the job profile of a saved application."""
+        with self._lock:
+            self._terms[data_dir.name] = Counter(_profile_terms(job_profile))
+            self._data_dirs[data_dir.name] = data_dir
+            self._stale = True
+
+    def remove(self, application_id: str):
+        with self._lock:
+            if self._terms.pop(application_id, None) is not None:
+                self._stale = True
+            self._data_dirs.pop(application_id, None)
+
+    def build_from_history(self, data_dir: Path = BASE_DATA_DIR) -> int:
+        """
+        Index every saved application with a job profile, a refined resume and section digests.
+
+        Returns:
+            int: Number of indexed applications
+        """
+        for digests_path in data_dir.glob(f"*/{SECTION_DIGESTS_FILE}"):
+            profile_path = digests_path.with_name("job_profile.json")
+            if not profile_path.exists() or not digests_path.with_name(TAILORED_RESUME_FILE).exists():
+                continue
+            try:
+                with open(profile_path, "r") as f:
+                    self.add(digests_path.parent, JobProfile(**json.load(f)))
+            except (OSError, ValueError, ValidationError) as e:
+                logger.warning(f"Could not index {profile_path}: {e}")
+        logger.info(f"Indexed {len(self)} saved job profiles for warm starts")
+        return len(self)
+
+    @staticmethod
+    def _tf(counts: Counter) -> dict[str, float]:
+        return {term: 1 + math.log(count) for term, count in counts.items()}
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+    def _rebuild(self):
+        """Vectorize all indexed job profiles (called with the lock held)."""
+        self._keys = sorted(self._terms)
+        self._vocabulary = {
+            term: i
+            for i, term in enumerate(sorted({term for key in self._keys for term in self._terms[key]}))
+        }
+        document_frequency = np.zeros(len(self._vocabulary), dtype=np.float32)
+        term_frequency = np.zeros((len(self._keys), len(self._vocabulary)), dtype=np.float32)
+        for row, key in enumerate(self._keys):
+            for term, weight in self._tf(self._terms[key]).items():
+                column = self._vocabulary[term]
+                term_frequency[row, column] = weight
+                document_frequency[column] += 1
+        # Smoothed idf, as in the resume index
+        self._idf = np.log((1 + len(self._keys)) / (1 + document_frequency)) + 1
+        self._matrix = self._normalize(term_frequency * self._idf)
+        self._stale = False
+
+    def similarities(self, job_profile: JobProfile) -> list[tuple[str, float]]:
+        """
+        Cosine similarity of every indexed job profile with a job profile.
+
+        Returns:
+            list[tuple[str, float]]: (application_id, similarity) pairs, most similar first
+        """
+        with self._lock:
+            if self._stale:
+                self._rebuild()
+            vector = np.zeros(len(self._vocabulary), dtype=np.float32)
+            for term, weight in self._tf(Counter(_profile_terms(job_profile))).items():
+                column = self._vocabulary.get(term)
+                if column is not None:
+                    vector[column] = weight
+            scores = self._matrix @ self._normalize(vector * self._idf) if self._keys else np.zeros(0)
+            keys = list(self._keys)
+        order = np.argsort(-scores, kind="stable")
+        return [(keys[i], float(scores[i])) for i in order]
+
+    def find(self, job_profile: JobProfile | None) -> WarmStart | None:
+        """The most similar saved application at or above the threshold, if any."""
+        if self.threshold <= 0 or job_profile is None:
+            return None
+        for application_id, similarity in self.similarities(job_profile):
+            if similarity < self.threshold:
+                return None
+            data_dir = self._data_dirs.get(application_id)
+            if data_dir is None:
+                continue
+            try:
+                with open(data_dir / "job_profile.json", "r") as f:
+                    previous_profile = JobProfile(**json.load(f))
+                with open(data_dir / TAILORED_RESUME_FILE, "r") as f:
+                    resume = Resume(**json.load(f))
+                with open(data_dir / SECTION_DIGESTS_FILE, "r") as f:
+                    digests = json.load(f)
+            except (OSError, ValueError, ValidationError) as e:
+                logger.warning(f"Could not load saved application {data_dir} for a warm start: {e}")
+                continue
+            logger.info(
+                f"Warm-starting from application {application_id} (similarity {similarity:.2f})"
+            )
+            return WarmStart(application_id, similarity, previous_profile, resume, digests)
+        return None
+
+
+warm_start_index = WarmStartIndex()
@@ -7,6 +7,27 @@ from pathlib import Path
 import shutil
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter_cooldown():
+    """Keep a cooldown set by one test (with mocked sleeps) from delaying the next."""
+    from resumetailor.services.rate_limit import rate_limiter
+
+    yield
+    rate_limiter._cooldown_until = 0.0
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Keep connection errors of one test from opening the shared circuit breakers for the next."""
+    from resumetailor.services.retry import circuit_breakers
+
+    for breaker in circuit_breakers.values():
+        breaker.reset()
+    yield
+    for breaker in circuit_breakers.values():
+        breaker.reset()
+
+
 @pytest.fixture
 def test_data_with_job_dir():
     """Fixture providing path to test data with job directory."""
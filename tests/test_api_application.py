@@ -61,3 +61,20 @@ class TestSessionAPI:
         response = mock_client.post(f"/application/complete", json=payload)
         assert response.status_code == 200
         assert response.json()["detail"].startswith("Session discarded")
+
+    def test_complete_application_circuit_open(self, mock_client, mock_session_id):
+        from resumetailor.api.application import resumegen_circuit_breaker
+
+        for _ in range(resumegen_circuit_breaker.failure_threshold):
+            resumegen_circuit_breaker.record_failure()
+        try:
+            health = mock_client.get("/health").json()
+            assert health["status"] == "degraded"
+            assert health["circuit_breakers"]["resumegen"]["state"] == "open"
+
+            payload = {"session_id": mock_session_id, "action": "save"}
+            response = mock_client.post(f"/application/complete", json=payload)
+            assert response.status_code == 503
+            assert "Retry-After" in response.headers
+        finally:
+            resumegen_circuit_breaker.record_success()
@@ -32,6 +32,25 @@ class TestResumeAPI:
         assert response.status_code == 200
         resume = Resume(**response.json())
 
+    def test_generate_resume_stream(
+        self, mock_client, mock_session_id, preload_session_data
+    ):
+        payload = {
+            "session_id": mock_session_id,
+        }
+        with mock_client.stream("POST", "/resume/generate/stream", json=payload) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                (event.split("\n")[0].removeprefix("event: "), event.split("\n")[1])
+                for event in response.read().decode().strip().split("\n\n")
+            ]
+        section_events = [json.loads(data.removeprefix("data: ")) for name, data in events[:-1]]
+        assert all(name == "section" for name, _ in events[:-1])
+        assert {"section_key", "section_data", "explanation"} <= set(section_events[0])
+        assert events[-1][0] == "resume"
+        resume = Resume(**json.loads(events[-1][1].removeprefix("data: ")))
+
     def test_edit_resume(self, mock_client, mock_session_id, preload_session_data):
         # First, generate a resume
         self.test_generate_resume_without_job(
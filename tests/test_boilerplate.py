@@ -0,0 +1,87 @@
+"""
+Tests for job description boilerplate stripping.
+"""
+import pytest
+
+from resumetailor.services.boilerplate import BoilerplateStripper, strip_boilerplate
+
+JOB_DESCRIPTION = """We use cookies to improve your experience. Accept all cookies
+
+## About Acme
+Acme was founded in 1901 and builds rockets.
+
+## About the role
+You will build ML pipelines.
+
+Requirements:
+- Python and Kubernetes
+- 3+ years of MLOps experience
+
+Benefits:
+- 30 days of vacation
+- Free lunch
+
+Acme is an equal opportunity employer and values diversity.
+"""
+
+
+@pytest.fixture
+def stripper():
+    return BoilerplateStripper()
+
+
+class TestBoilerplateStripper:
+    def test_strips_sections_and_phrases(self, stripper):
+        stripped = stripper.strip(JOB_DESCRIPTION)
+        assert stripped.text == (
+            "## About the role\nYou will build ML pipelines.\n\n"
+            "Requirements:\n- Python and Kubernetes\n- 3+ years of MLOps experience"
+        )
+        assert stripped.removed_chars == len(JOB_DESCRIPTION) - len(stripped.text)
+        assert stripped.removed_tokens > 0
+
+    @pytest.mark.parametrize("heading", ["About the Opportunity", "About the Project", "About your team"])
+    def test_keeps_about_the_job_sections(self, stripper, heading):
+        text = (
+            f"## About us\nWe build rockets.\n\n## {heading}\n"
+            "- Build streaming pipelines with Kafka and Spark\n- Model data in Snowflake"
+        )
+        assert stripper.strip(text).text == (
+            f"## {heading}\n- Build streaming pipelines with Kafka and Spark\n- Model data in Snowflake"
+        )
+
+    def test_strips_about_the_company(self, stripper):
+        stripped = stripper.strip("## About the company\nFounded in 1901.\n\n## Requirements\n- Python")
+        assert stripped.text == "## Requirements\n- Python"
+
+    def test_strips_benefit_paragraphs(self, stripper):
+        stripped = stripper.strip(
+            "You know Python.\n\nWe offer private health insurance and a stock plan."
+        )
+        assert stripped.text == "You know Python."
+
+    def test_keeps_clean_description(self, stripper):
+        text = "You know Python.\n\nResponsibilities:\n- Deploy models"
+        assert stripper.strip(text) == (text, 0, 0)
+
+    def test_never_strips_everything(self, stripper):
+        text = "We use cookies."
+        assert stripper.strip(text).text == text
+
+    def test_learns_recurring_lines(self):
+        stripper = BoilerplateStripper(phrases=(), min_postings=2)
+        footer = "Join the Example Corp talent community for updates"
+        stripper.learn(
+            [f"Python developer\n{footer}", f"Java developer\n- {footer}", "Go developer"]
+        )
+        assert stripper.strip(f"Rust developer\n{footer}").text == "Rust developer"
+
+    def test_does_not_learn_short_lines(self):
+        stripper = BoilerplateStripper(phrases=(), min_postings=2)
+        stripper.learn(["Requirements:\n- Python", "Requirements:\n- Python"])
+        assert stripper.learned_lines == frozenset()
+
+
+def test_strip_boilerplate_passes_empty_descriptions():
+    assert strip_boilerplate(None) is None
+    assert strip_boilerplate("") == ""
@@ -0,0 +1,192 @@
+"""
+Tests for the precomputed candidate data of the full resume sections.
+"""
+import asyncio
+import json
+import os
+import pytest
+from types import SimpleNamespace
+
+from resumetailor.models import JobProfile, Resume
+from resumetailor.models.resume import Project, WorkPosition
+from resumetailor.services.candidate_context import (
+    CandidateContext,
+    CandidateContextStore,
+    SectionContext,
+    section_digest,
+)
+from resumetailor.services.utils import count_tokens, model_to_prompt
+
+FULL_RESUME = Resume(
+    work_experience=[
+        WorkPosition(job_title="ML Engineer", company="Acme", keywords=["Python", "AWS"]),
+        WorkPosition(job_title="Barista", company="Cafe", responsibilities="Coffee and cakes"),
+    ],
+    projects=[Project(name="Model server", keywords=["Docker", "Kubernetes"])],
+)
+
+
+def write_resume(path, resume, mtime=None):
+    path.write_text(json.dumps(resume.model_dump()))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+class TestSectionContext:
+    def test_serializes_once(self):
+        entries = FULL_RESUME.work_experience
+        section = SectionContext("work_experience", entries)
+        expected = "\n".join(model_to_prompt(entry) for entry in entries)
+        assert section.candidate_data == expected
+        assert section.tokens == count_tokens(expected)
+        assert section.digest == section_digest(list(entries))
+
+    def test_serializes_subsets(self):
+        entries = FULL_RESUME.work_experience
+        section = SectionContext("work_experience", entries)
+        edited = entries[1].model_copy(update={"responsibilities": "Latte art"})
+        data, tokens = section.serialize([entries[0], edited])
+        assert data == "\n".join([model_to_prompt(entries[0]), model_to_prompt(edited)])
+        assert tokens == count_tokens(model_to_prompt(entries[0])) + count_tokens(model_to_prompt(edited))
+
+    def test_skips_empty_sections(self):
+        context = CandidateContext(FULL_RESUME)
+        assert set(context.sections) == {"work_experience", "projects"}
+        assert len(context) == 3
+
+
+class TestCandidateContextStore:
+    def test_section_lookup(self, tmp_path):
+        path = tmp_path / "full_resume.json"
+        write_resume(path, FULL_RESUME)
+        store = CandidateContextStore(path)
+        entries = Resume(**json.loads(path.read_text())).work_experience
+        assert store.section("work_experience", entries).entries == entries
+        assert store.section("work_experience", entries[:1]) is None
+        assert store.section("education", None) is None
+        assert CandidateContextStore(tmp_path / "missing.json").section("projects", entries) is None
+
+    def test_condensed_digests_are_invalidated(self, tmp_path):
+        path = tmp_path / "full_resume.json"
+        write_resume(path, FULL_RESUME, mtime=1_000_000)
+        store = CandidateContextStore(path, threshold=1)
+        assert {section.section for section in store.to_condense()} == {"work_experience", "projects"}
+        work = store.get().sections["work_experience"]
+        store.set_condensed(work, "condensed work")
+        assert store.condensed_data(work) == "condensed work"
+        assert [section.section for section in store.to_condense()] == ["projects"]
+
+        edited = FULL_RESUME.model_copy(update={"work_experience": FULL_RESUME.work_experience[:1]})
+        write_resume(path, edited, mtime=2_000_000)
+        edited_work = store.get().sections["work_experience"]
+        assert store.condensed_data(edited_work) is None
+        assert {section.section for section in store.to_condense()} == {"work_experience", "projects"}
+
+    def test_disabled(self, tmp_path):
+        path = tmp_path / "full_resume.json"
+        write_resume(path, FULL_RESUME)
+        store = CandidateContextStore(path, threshold=0)
+        assert store.to_condense() == []
+        work = store.get().sections["work_experience"]
+        store.condensed[work.digest] = "condensed work"
+        assert store.condensed_data(work) is None
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    """The candidate context of a temporary full resume, read by the resume writer."""
+    path = tmp_path / "full_resume.json"
+    write_resume(path, FULL_RESUME)
+    store = CandidateContextStore(path, threshold=1)
+    monkeypatch.setattr("resumetailor.llm.resume.candidate_context_store", store)
+    return store
+
+
+@pytest.fixture
+def resume_writer(monkeypatch, store):
+    """A fresh ResumeWriter; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_RESUME", "gpt-5-mini")
+    from resumetailor.llm.resume import ResumeWriter
+
+    return ResumeWriter()
+
+
+class FakeChain:
+    def __init__(self, section_key, calls):
+        self.section_key = section_key
+        self.calls = calls
+
+    def _write(self, input):
+        self.calls[self.section_key] = input["candidate_data"]
+        return SimpleNamespace(
+            section_data=getattr(FULL_RESUME, self.section_key), explanation="rewritten"
+        )
+
+    def invoke(self, input, *args, **kwargs):
+        return self._write(input)
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self._write(input)
+
+    async def abatch(self, inputs, *args, **kwargs):
+        return [f"condensed {input['section_name']}" for input in inputs]
+
+
+class FakeSummaryChain:
+    def invoke(self, input, *args, **kwargs):
+        return SimpleNamespace(professional_summary="An ML engineer.")
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self.invoke(input)
+
+
+def fake_chains(resume_writer):
+    calls = {}
+    for section in resume_writer.sections:
+        writer_chains = resume_writer.chains[("writer", section)]
+        for task in writer_chains:
+            writer_chains[task] = FakeChain(section, calls)
+    resume_writer.chains["condenser"] = FakeChain(None, calls)
+    resume_writer.chains["summary"] = FakeSummaryChain()
+    return calls
+
+
+def test_writer_reads_precomputed_candidate_data(resume_writer, store):
+    calls = fake_chains(resume_writer)
+    resume_writer.generate(
+        thread_id="candidate-context-raw",
+        resume=FULL_RESUME,
+        job_titles="ML Engineer",
+    )
+    assert calls["work_experience"] == store.get().sections["work_experience"].candidate_data
+
+
+def test_writer_uses_condensed_digests(resume_writer):
+    calls = fake_chains(resume_writer)
+    assert asyncio.run(resume_writer.acondense_candidate_data()) == 2
+    assert asyncio.run(resume_writer.acondense_candidate_data()) == 0
+    resume_writer.generate(
+        thread_id="candidate-context-condensed",
+        resume=FULL_RESUME,
+        job_titles="ML Engineer",
+    )
+    assert calls == {
+        "work_experience": "condensed work_experience",
+        "projects": "condensed projects",
+    }
+
+
+def test_writer_serializes_filtered_entries(resume_writer, monkeypatch):
+    monkeypatch.setattr(
+        "resumetailor.llm.resume.filter_section", lambda entries, job_profile: entries[:1]
+    )
+    calls = fake_chains(resume_writer)
+    asyncio.run(resume_writer.acondense_candidate_data())
+    resume_writer.generate(
+        thread_id="candidate-context-filtered",
+        resume=FULL_RESUME,
+        job_profile=JobProfile(required_technologies=["Python"]),
+    )
+    # The digest covers the whole section, so a filtered section is sent as it is
+    assert calls["work_experience"] == model_to_prompt(FULL_RESUME.work_experience[0])
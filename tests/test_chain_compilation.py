@@ -0,0 +1,66 @@
+"""
+Tests that LLM chains are built once at graph build time and reused.
+"""
+import pytest
+import time
+from langchain_core.prompts import ChatPromptTemplate
+
+from resumetailor.services.retry import RetryableChain
+
+
+@pytest.fixture
+def resume_writer(monkeypatch):
+    """A fresh ResumeWriter; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    for model_type in ("LLM_MODEL_RESUME", "LLM_MODEL_SUMMARY", "LLM_MODEL_COVER_LETTER"):
+        monkeypatch.setenv(model_type, "gpt-5-mini")
+    from resumetailor.llm.resume import ResumeWriter
+
+    return ResumeWriter()
+
+
+def test_section_chains_are_prebuilt(resume_writer):
+    assert isinstance(resume_writer.chains["summary"], RetryableChain)
+    for section in resume_writer.sections:
+        writer_chains = resume_writer.chains[("writer", section)]
+        assert set(writer_chains) == {"refine_with_job", "refine_without_job", "warm_start"}
+        assert isinstance(resume_writer.chains[("editor", section)], RetryableChain)
+
+
+def test_retry_wrapper_is_built_once():
+    chain = RetryableChain(object())
+    assert chain._retryable_invoke is chain._retryable_invoke
+    assert chain.invoke.__func__ is RetryableChain.invoke
+
+
+@pytest.mark.performance
+def test_per_call_overhead(resume_writer):
+    """Compare building a section chain per call (as before) with reusing the prebuilt one."""
+    from resumetailor.llm.prompts import resume_prompts as prompts
+
+    prebuilt = resume_writer.chains[("writer", "work_experience")]["refine_with_job"]
+    task_prompts = prompts["writer"]["refine_with_job"]
+    iterations = 50
+
+    def build_per_call():
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", task_prompts["system_message"]),
+                ("human", task_prompts["work_experience"]),
+            ]
+        )
+        chain = prompt | resume_writer.model.with_structured_output(prebuilt.output_schema)
+        return RetryableChain(chain, output_schema=prebuilt.output_schema).invoke
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build_per_call()
+    before = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        prebuilt.invoke
+    after = (time.perf_counter() - start) / iterations
+
+    print(f"\nchain setup per call: before {before * 1000:.3f} ms, after {after * 1000:.4f} ms")
+    assert after < before
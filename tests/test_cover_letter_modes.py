@@ -0,0 +1,220 @@
+"""
+Tests for the single-call and two-step cover letter generation modes.
+"""
+import hashlib
+import json
+import os
+import pytest
+import time
+from langchain_core.callbacks import get_usage_metadata_callback
+from langchain_core.messages import AIMessage
+
+from resumetailor.core.constants import BASE_DATA_DIR
+from resumetailor.models import CoverLetter, PersonalInfo
+from resumetailor.services.utils import count_tokens, model_to_str
+
+COVER_LETTER = CoverLetter(
+    personal_information=PersonalInfo(name="Jane"),
+    company="Acme",
+    position="ML Engineer",
+    opening_paragraph="I am applying for the ML Engineer position.",
+    body_paragraphs=["I deployed ML models to production."],
+    closing_paragraph="Thank you for your consideration.",
+)
+
+
+@pytest.fixture
+def cover_letter_writer(monkeypatch):
+    """A fresh CoverLetterWriter; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_COVER_LETTER", "gpt-5-mini")
+    from resumetailor.llm.cover_letter import CoverLetterWriter
+
+    return CoverLetterWriter()
+
+
+class FakeChain:
+    """Answers with a fixed result and records its inputs."""
+
+    def __init__(self, name, calls, result):
+        self.name = name
+        self.calls = calls
+        self.result = result
+
+    def invoke(self, input, *args, **kwargs):
+        self.calls.append((self.name, input))
+        return self.result
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self.invoke(input)
+
+
+def fake_chains(cover_letter_writer, cover_letter=COVER_LETTER, explanation="Matched the job profile."):
+    from resumetailor.llm.cover_letter import CoverLetterDraft
+
+    calls = []
+    # The prose of the two-step writer: the letter as JSON, followed by the explanation
+    prose = AIMessage(f"```json\n{model_to_str(cover_letter)}\n```\n\n{explanation}")
+    draft = CoverLetterDraft(**cover_letter.model_dump(), explanation=explanation)
+    cover_letter_writer.chains.update(
+        {
+            "writer": FakeChain("writer", calls, prose),
+            "editor": FakeChain("editor", calls, prose),
+            "structured": FakeChain("structured", calls, cover_letter),
+            "draft_writer": FakeChain("draft_writer", calls, draft),
+            "draft_editor": FakeChain("draft_editor", calls, draft),
+        }
+    )
+    return calls
+
+
+def generate_and_edit(cover_letter_writer, thread_id):
+    cover_letter = cover_letter_writer.generate(
+        thread_id=thread_id, job_profile="{}", candidate_resume="{}"
+    )
+    edited = cover_letter_writer.edit(thread_id=thread_id, editing_suggestions="Shorter")
+    return cover_letter, edited
+
+
+def test_single_call_mode(cover_letter_writer, monkeypatch):
+    monkeypatch.setattr("resumetailor.llm.cover_letter.COVER_LETTER_MODE", "single_call")
+    calls = fake_chains(cover_letter_writer)
+    cover_letter, edited = generate_and_edit(cover_letter_writer, "single-call")
+    assert cover_letter == COVER_LETTER
+    assert type(cover_letter) is CoverLetter
+    assert edited == COVER_LETTER
+    assert [name for name, _ in calls] == ["draft_writer", "draft_editor"]
+    # The editor sees the letter and the reasoning of the writer
+    history = calls[1][1]["messages"]
+    assert "I deployed ML models to production." in history[-1].content
+    assert "Matched the job profile." in history[-1].content
+
+
+def test_two_step_mode(cover_letter_writer, monkeypatch):
+    monkeypatch.setattr("resumetailor.llm.cover_letter.COVER_LETTER_MODE", "two_step")
+    calls = fake_chains(cover_letter_writer)
+    cover_letter, edited = generate_and_edit(cover_letter_writer, "two-step")
+    assert cover_letter == edited == COVER_LETTER
+    assert [name for name, _ in calls] == ["writer", "structured", "editor", "structured"]
+
+
+# SHA-256 of the two-step prompts as they were before COVER_LETTER_MODE existed
+TWO_STEP_PROMPT_DIGESTS = {
+    ("writer", "system_message"): "e16748ee01fd79e159248f13436a52e3c6a4d4eda921ed81c7469ec1ca4c1391",
+    ("writer", "prompt"): "14e63bb7cb88cd4f0e0472a6e91f52ab4ca0949411729758cb11cd9b2d608fe3",
+    ("editor", "system_message"): "3ef325f49c9d2c4785f306d61f48d46db4187524f687d1a328b5e09b56256cc3",
+    ("editor", "prompt"): "c232a6a373ac7878fa3068ff8d551c54285eda1d91fc7c9f99541ff66867b3bd",
+}
+
+
+@pytest.mark.parametrize("name, part", TWO_STEP_PROMPT_DIGESTS)
+def test_two_step_prompts_are_unchanged(name, part):
+    from resumetailor.llm.prompts import cover_letter_prompts as prompts
+
+    digest = hashlib.sha256(prompts[name][part].encode("utf-8")).hexdigest()
+    assert digest == TWO_STEP_PROMPT_DIGESTS[(name, part)]
+
+
+def test_single_call_prompts_ask_for_the_explanation_field():
+    from resumetailor.llm.prompts import cover_letter_prompts as prompts
+
+    for name in ("draft_writer", "draft_editor"):
+        for prompt in prompts[name].values():
+            assert "`explanation` field" in prompt
+            assert "After the JSON object" not in prompt
+    for name in ("writer", "editor"):
+        assert "After the JSON object" in prompts[name]["prompt"]
+
+
+def _text(value) -> str:
+    if isinstance(value, list):
+        return "\n".join(_text(item) for item in value)
+    if isinstance(value, CoverLetter):
+        return model_to_str(value)
+    return str(getattr(value, "content", value))
+
+
+def call_tokens(chains, name, input, output) -> tuple[int, int]:
+    """Prompt and completion tokens of a recorded call, with the prompt rendered by the real chain."""
+    from resumetailor.llm.cover_letter import CoverLetterDraft
+
+    chain = chains[name].chain
+    messages = chain.first.invoke(input).to_messages() if name != "structured" else input
+    schema = {"structured": CoverLetter, "draft_writer": CoverLetterDraft, "draft_editor": CoverLetterDraft}
+    prompt = _text(messages)
+    if name in schema:
+        prompt += json.dumps(schema[name].model_json_schema())
+    return count_tokens(prompt), count_tokens(_text(output))
+
+
+@pytest.mark.performance
+def test_mode_tokens(cover_letter_writer, monkeypatch):
+    """
+    Compare the tokens of generating and editing a cover letter in both modes.
+
+    The calls are answered with the cover letter recorded in data/test_with_job,
+    and their prompts are rendered by the real chains, so the counts are those
+    the model would be billed for (schemas of structured output included).
+    """
+    with open(BASE_DATA_DIR / "test_with_job" / "cover_letter.json") as f:
+        recorded_letter = CoverLetter(**json.load(f))
+    with open(BASE_DATA_DIR / "test_with_job" / "job_profile.json") as f:
+        job_profile = f.read()
+    with open(BASE_DATA_DIR / "test_with_job" / "resume.json") as f:
+        resume = f.read()
+    explanation = (
+        "The opening states the position, the body paragraphs map the candidate's "
+        "MLOps experience and AWS skills to the responsibilities of the job profile, "
+        "and the closing keeps the formal tone of the job description."
+    )
+    chains = dict(cover_letter_writer.chains)
+    tokens = {}
+    for mode in ("two_step", "single_call"):
+        monkeypatch.setattr("resumetailor.llm.cover_letter.COVER_LETTER_MODE", mode)
+        calls = fake_chains(cover_letter_writer, recorded_letter, explanation)
+        cover_letter_writer.generate(
+            thread_id=f"tokens-{mode}", job_profile=job_profile, candidate_resume=resume
+        )
+        cover_letter_writer.edit(thread_id=f"tokens-{mode}", editing_suggestions="Shorter")
+        prompt_tokens = completion_tokens = 0
+        for name, input in calls:
+            prompt, completion = call_tokens(
+                chains, name, input, cover_letter_writer.chains[name].result
+            )
+            prompt_tokens += prompt
+            completion_tokens += completion
+        tokens[mode] = prompt_tokens + completion_tokens
+        print(
+            f"\n{mode}: {len(calls)} LLM calls, {prompt_tokens} prompt + "
+            f"{completion_tokens} completion tokens"
+        )
+    assert tokens["single_call"] < tokens["two_step"]
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    os.getenv("COVER_LETTER_BENCHMARK_LIVE", "false").lower() != "true",
+    reason="Sends real LLM requests, set COVER_LETTER_BENCHMARK_LIVE=true to run",
+)
+def test_mode_live(monkeypatch):
+    """Generate and edit a cover letter in both modes against the configured model."""
+    from resumetailor.llm.cover_letter import CoverLetterWriter
+
+    with open(BASE_DATA_DIR / "test_with_job" / "job_profile.json") as f:
+        job_profile = f.read()
+    with open(BASE_DATA_DIR / "test_with_job" / "resume.json") as f:
+        resume = f.read()
+    cover_letter_writer = CoverLetterWriter()
+    tokens = {}
+    for mode in ("two_step", "single_call"):
+        monkeypatch.setattr("resumetailor.llm.cover_letter.COVER_LETTER_MODE", mode)
+        with get_usage_metadata_callback() as usage:
+            start = time.perf_counter()
+            cover_letter_writer.generate(
+                thread_id=f"live-{mode}", job_profile=job_profile, candidate_resume=resume
+            )
+            cover_letter_writer.edit(thread_id=f"live-{mode}", editing_suggestions="Shorter")
+            elapsed = time.perf_counter() - start
+        tokens[mode] = sum(model_usage["total_tokens"] for model_usage in usage.usage_metadata.values())
+        print(f"\n{mode}: {elapsed:.1f} s, {tokens[mode]} tokens")
+    assert tokens["single_call"] < tokens["two_step"]
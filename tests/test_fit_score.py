@@ -0,0 +1,126 @@
+"""
+Tests for the keyword-coverage fit score.
+"""
+import pytest
+
+from resumetailor.models import Resume, JobProfile
+from resumetailor.models.resume import (
+    Certification,
+    Degree,
+    EduCourse,
+    Skill,
+    SkillCategory,
+    WorkPosition,
+)
+from resumetailor.services.fit_score import KeywordIndex, normalize
+
+
+@pytest.fixture
+def resume():
+    return Resume(
+        education=[
+            Degree(
+                degree="MSc",
+                institution="ETH",
+                field_of_study="Computer Science",
+                courses=[EduCourse(name="Machine Learning", acquired_skills="PyTorch, NLP")],
+            )
+        ],
+        work_experience=[
+            WorkPosition(
+                job_title="ML Engineer",
+                responsibilities=["Deployed models on k8s with GitLab CI/CD"],
+                acquired_skills=["Python", "Postgres"],
+                keywords=["MLOps"],
+            )
+        ],
+        certifications=[
+            Certification(name="AWS Certified Developer", issuing_organization="Amazon")
+        ],
+        additional_skills=[
+            SkillCategory(category="Tools", specific_skills=[Skill(name="Docker")])
+        ],
+    )
+
+
+@pytest.fixture
+def index(resume):
+    return KeywordIndex(resume)
+
+
+class TestNormalize:
+    def test_synonyms(self):
+        assert normalize("K8s") == "kubernetes"
+        assert normalize("Amazon Web Services") == "aws"
+        assert normalize("PostgreSQL") == "postgresql"
+
+    def test_punctuation(self):
+        assert normalize("  Node.js ") == "node.js"
+        assert normalize("C++") == "c++"
+
+
+class TestKeywordIndex:
+    def test_covers_keywords_and_skills(self, index):
+        assert index.covers("python")
+        assert index.covers("MLOps")
+        assert index.covers("Docker")
+        assert not index.covers("Terraform")
+
+    def test_covers_synonyms(self, index):
+        assert index.covers("Kubernetes")
+        assert index.covers("PostgreSQL")
+        assert index.covers("natural language processing")
+        assert index.covers("Continuous Integration")
+
+    def test_covers_all_words(self, index):
+        assert index.covers("Deployed models with GitLab")
+        assert not index.covers("Deployed models with Terraform")
+
+    def test_all_words_must_share_an_entry(self, index):
+        # "Deployed" and "models" are in a work position, "Docker" is a skill
+        assert not index.covers("Deployed models with Docker")
+
+    def test_certifications_match_as_a_whole(self):
+        index = KeywordIndex(
+            Resume(
+                work_experience=[WorkPosition(job_title="Solutions Architect", company="Acme")],
+                certifications=[Certification(name="AWS Certified Developer", issuing_organization="Amazon")],
+            )
+        )
+        result = index.fit_score(
+            JobProfile(certifications=["AWS Certified Solutions Architect", "AWS Certified Developer"])
+        )
+        assert result.certifications.covered == ["AWS Certified Developer"]
+        assert result.certifications.missing == ["AWS Certified Solutions Architect"]
+
+    def test_covers_alternatives(self, index):
+        assert index.covers("Terraform or Docker")
+        assert index.covers("Rust (Python)")
+        assert not index.covers("Terraform, Ansible")
+
+    def test_fit_score(self, index):
+        job_profile = JobProfile(
+            required_technologies=["Python", "Kubernetes", "Terraform", "Python"],
+            technical_skills=["Machine learning"],
+            certifications=["AWS Certified Developer", "CKA"],
+        )
+        result = index.fit_score(job_profile)
+        assert result.required_technologies.covered == ["Python", "Kubernetes"]
+        assert result.required_technologies.missing == ["Terraform"]
+        assert result.technical_skills.coverage == 1.0
+        assert result.certifications.missing == ["CKA"]
+        assert result.fit_score == pytest.approx(0.5 * 2 / 3 + 0.3 * 1.0 + 0.2 * 0.5)
+
+    def test_fit_score_skips_empty_categories(self, index):
+        result = index.fit_score(JobProfile(required_technologies=["Python", "Go"]))
+        assert result.fit_score == pytest.approx(0.5)
+        assert result.certifications.coverage == 0.0
+
+    def test_empty_job_profile(self, index):
+        assert index.fit_score(JobProfile()).fit_score == 0.0
+
+    def test_empty_resume(self):
+        result = KeywordIndex(Resume()).fit_score(JobProfile(required_technologies=["Python"]))
+        assert result.required_technologies.missing == ["Python"]
+        assert result.fit_score == 0.0
+
@@ -0,0 +1,99 @@
+"""
+Tests for the job profile cache keyed on the normalized job description.
+"""
+import asyncio
+import json
+import os
+import pytest
+
+from resumetailor.models import JobProfile
+from resumetailor.services.llm_cache import LLMCache
+from resumetailor.services.job_profile_cache import (
+    JobProfileCache,
+    job_description_key,
+    normalize_job_description,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = LLMCache(tmp_path / "job_profile_cache.sqlite", ttl=0, max_entries=10, enabled=True)
+    yield JobProfileCache(store)
+    store.close()
+
+
+def save_application(data_dir, name, job_description, job_profile, mtime):
+    app_dir = data_dir / name
+    app_dir.mkdir()
+    (app_dir / "job_description.txt").write_text(job_description)
+    profile_path = app_dir / "job_profile.json"
+    profile_path.write_text(json.dumps(job_profile.model_dump()))
+    os.utime(profile_path, (mtime, mtime))
+
+
+class TestNormalization:
+    def test_folds_whitespace_casing_and_punctuation(self):
+        assert normalize_job_description("  ML   Engineer!\n\nPython, AWS.") == "ml engineer python aws"
+        assert job_description_key("ML Engineer: Python") == job_description_key("ml engineer  python")
+
+    def test_different_postings_differ(self):
+        assert job_description_key("ML Engineer") != job_description_key("Data Engineer")
+
+    def test_keeps_plus_and_hash_of_languages(self):
+        assert normalize_job_description("(C++, C#) + Go; #hiring!") == "c++ c# go hiring"
+        keys = {job_description_key(f"Senior {language} developer") for language in ("C++", "C#", "C")}
+        assert len(keys) == 3
+
+
+class TestJobProfileCache:
+    def test_roundtrip(self, cache):
+        profile = JobProfile(position="ML Engineer")
+        cache.set("ML Engineer, Berlin", profile)
+        assert cache.get("ml engineer berlin") == profile
+        assert cache.get("Data Engineer") is None
+
+    def test_disabled(self, tmp_path):
+        cache = JobProfileCache(LLMCache(tmp_path / "cache.sqlite", enabled=False))
+        cache.set("ML Engineer", JobProfile(position="ML Engineer"))
+        assert cache.get("ML Engineer") is None
+        assert not (tmp_path / "cache.sqlite").exists()
+
+    def test_seed_from_history(self, cache, tmp_path):
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        save_application(data_dir, "new", "ML Engineer", JobProfile(position="new"), 2000)
+        save_application(data_dir, "old", "ML engineer.", JobProfile(position="old"), 1000)
+        save_application(data_dir, "other", "Barista", JobProfile(position="Barista"), 1000)
+        (data_dir / "broken").mkdir()
+        (data_dir / "broken" / "job_profile.json").write_text("{")
+        (data_dir / "broken" / "job_description.txt").write_text("Broken")
+
+        assert cache.seed_from_history(data_dir) == 3
+        assert cache.get("ML Engineer").position == "new"
+        assert cache.get("Barista").position == "Barista"
+
+
+def test_extractor_skips_llm_on_cache_hit(cache, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_SUMMARY", "gpt-5-mini")
+    from resumetailor.llm.job_profile import JobProfileExtractor
+
+    extractor = JobProfileExtractor()
+    calls = []
+
+    class FakeChain:
+        def invoke(self, input, *args, **kwargs):
+            calls.append(input["job_description"])
+            return JobProfile(position="ML Engineer")
+
+        async def ainvoke(self, input, *args, **kwargs):
+            return self.invoke(input)
+
+    extractor.chains["extractor"] = FakeChain()
+    monkeypatch.setattr("resumetailor.llm.job_profile.job_profile_cache", cache)
+
+    assert extractor.extract("ML Engineer, Python", thread_id="cache-1").position == "ML Engineer"
+    assert asyncio.run(extractor.aextract("ml engineer python", thread_id="cache-2")).position == "ML Engineer"
+    # A new posting on a thread with a previous profile is still extracted
+    extractor.extract("Data Engineer", thread_id="cache-1")
+    assert calls == ["ML Engineer, Python", "Data Engineer"]
@@ -0,0 +1,132 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+import pytest
+import asyncio
+from unittest.mock import Mock, patch, AsyncMock
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import AIMessage
+
+from resumetailor.models import JobProfile, CoverLetter
+from resumetailor.services.llm_cache import LLMCache, make_cache_key
+from resumetailor.services.retry import RetryableChain
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm_cache.sqlite", ttl=3600, max_entries=10, enabled=True)
+    yield cache
+    cache.close()
+
+
+class TestCacheKey:
+    """Test that the key covers model, messages and output schema."""
+
+    def test_same_call_same_key(self):
+        messages = [AIMessage("hello")]
+        assert make_cache_key("gpt-5-mini", messages, JobProfile) == make_cache_key(
+            "gpt-5-mini", [AIMessage("hello")], JobProfile
+        )
+
+    @pytest.mark.parametrize(
+        "model_name, messages, schema",
+        [
+            ("gpt-5", [AIMessage("hello")], JobProfile),
+            ("gpt-5-mini", [AIMessage("hello!")], JobProfile),
+            ("gpt-5-mini", [AIMessage("hello")], CoverLetter),
+        ],
+    )
+    def test_any_change_is_a_new_key(self, model_name, messages, schema):
+        key = make_cache_key("gpt-5-mini", [AIMessage("hello")], JobProfile)
+        assert make_cache_key(model_name, messages, schema) != key
+
+
+class TestLLMCache:
+    """Test storage, expiry and eviction."""
+
+    def test_round_trip(self, cache):
+        profile = JobProfile(company="ACME")
+        cache.set("key", profile)
+        assert cache.get("key", JobProfile) == profile
+        assert cache.get("other", JobProfile) is None
+
+    def test_persists_across_instances(self, cache):
+        cache.set("key", JobProfile(company="ACME"))
+        reopened = LLMCache(cache.path, enabled=True)
+        assert reopened.get("key", JobProfile).company == "ACME"
+        reopened.close()
+
+    def test_expired_entries_are_misses(self, cache):
+        with patch("resumetailor.services.llm_cache.time.time", return_value=1000.0):
+            cache.set("key", JobProfile(company="ACME"))
+        with patch("resumetailor.services.llm_cache.time.time", return_value=1000.0 + 3601):
+            assert cache.get("key", JobProfile) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, cache):
+        now = {"t": 1000.0}
+        with patch("resumetailor.services.llm_cache.time.time", side_effect=lambda: now["t"]):
+            for i in range(10):
+                now["t"] += 1
+                cache.set(f"key-{i}", JobProfile(company=str(i)))
+            now["t"] += 1
+            cache.get("key-0", JobProfile)  # refresh the oldest entry
+            now["t"] += 1
+            cache.set("key-10", JobProfile(company="10"))
+            assert len(cache) == 10
+            assert cache.get("key-0", JobProfile) is not None
+            assert cache.get("key-1", JobProfile) is None
+
+    def test_unreadable_entry_is_discarded(self, cache):
+        cache.set("key", JobProfile(company="ACME"))
+        assert cache.get("key", CoverLetter) is None
+        assert len(cache) == 0
+
+
+class TestRetryableChainCache:
+    """Test that RetryableChain answers repeated calls from the cache."""
+
+    @staticmethod
+    def make_chain(result):
+        chain = Mock()
+        chain.first = ChatPromptTemplate.from_messages([("human", "{text}")])
+        chain.invoke = Mock(return_value=result)
+        chain.ainvoke = AsyncMock(return_value=result)
+        return chain
+
+    def test_second_invoke_is_served_from_cache(self, cache):
+        chain = self.make_chain(JobProfile(company="ACME"))
+        retryable_chain = RetryableChain(chain, output_schema=JobProfile, cache=cache)
+        assert retryable_chain.invoke({"text": "job"}).company == "ACME"
+        assert retryable_chain.invoke({"text": "job"}).company == "ACME"
+        assert chain.invoke.call_count == 1
+
+        retryable_chain.invoke({"text": "another job"})
+        assert chain.invoke.call_count == 2
+
+    def test_ainvoke_shares_the_cache(self, cache):
+        chain = self.make_chain(JobProfile(company="ACME"))
+        RetryableChain(chain, output_schema=JobProfile, cache=cache).invoke({"text": "job"})
+        retryable_chain = RetryableChain(chain, output_schema=JobProfile, cache=cache)
+        assert asyncio.run(retryable_chain.ainvoke({"text": "job"})).company == "ACME"
+        chain.ainvoke.assert_not_awaited()
+
+    def test_cache_hit_skips_rate_limiter(self, cache):
+        chain = self.make_chain(JobProfile(company="ACME"))
+        limiter = Mock(enabled=True)
+        retryable_chain = RetryableChain(
+            chain, output_schema=JobProfile, cache=cache, rate_limiter=limiter
+        )
+        retryable_chain.invoke({"text": "job"})
+        retryable_chain.invoke({"text": "job"})
+        limiter.acquire.assert_called_once()
+
+    @pytest.mark.parametrize("enabled, output_schema", [(False, JobProfile), (True, None)])
+    def test_cache_not_used(self, cache, enabled, output_schema):
+        """Test that a disabled cache or an unstructured chain always calls the API."""
+        cache.enabled = enabled
+        chain = self.make_chain(JobProfile(company="ACME"))
+        retryable_chain = RetryableChain(chain, output_schema=output_schema, cache=cache)
+        retryable_chain.invoke({"text": "job"})
+        retryable_chain.invoke({"text": "job"})
+        assert chain.invoke.call_count == 2
@@ -0,0 +1,150 @@
+"""
+Tests for map-reduce extraction of long job descriptions.
+"""
+import asyncio
+import pytest
+import threading
+import time
+
+from resumetailor.models import JobProfile
+from resumetailor.services.llm_cache import LLMCache
+from resumetailor.services.job_profile_cache import JobProfileCache
+from resumetailor.services.map_reduce import (
+    merge_job_profiles,
+    needs_map_reduce,
+    split_job_description,
+)
+
+
+class TestSplitJobDescription:
+    def test_packs_whole_paragraphs(self):
+        paragraphs = [f"Paragraph {i} " + "word " * 40 for i in range(6)]
+        chunks = split_job_description("\n\n".join(paragraphs), max_tokens=100)
+        assert len(chunks) > 1
+        assert "\n\n".join(chunks).split("\n\n") == [p.strip() for p in paragraphs]
+
+    def test_splits_oversized_paragraphs(self):
+        paragraph = " ".join(f"Sentence number {i} is here." for i in range(100))
+        chunks = split_job_description(paragraph, max_tokens=50)
+        assert len(chunks) > 1
+        assert " ".join(" ".join(chunks).split()) == paragraph
+
+    def test_short_description(self):
+        assert split_job_description("Python developer\n\n\nin Berlin") == [
+            "Python developer\n\nin Berlin"
+        ]
+
+    def test_threshold(self):
+        assert needs_map_reduce("word " * 1000, threshold=100)
+        assert not needs_map_reduce("word " * 10, threshold=100)
+        assert not needs_map_reduce("word " * 1000, threshold=0)
+
+
+class TestMergeJobProfiles:
+    def test_deduplicates_list_fields(self):
+        merged = merge_job_profiles(
+            [
+                JobProfile(required_technologies=["Python", "AWS"]),
+                JobProfile(required_technologies=["python ", "Docker"], languages=["English"]),
+                JobProfile(),
+            ]
+        )
+        assert merged.required_technologies == ["Python", "AWS", "Docker"]
+        assert merged.languages == ["English"]
+        assert merged.certifications is None
+
+    def test_votes_scalar_fields(self):
+        merged = merge_job_profiles(
+            [
+                JobProfile(company="Acme GmbH", position="ML Engineer"),
+                JobProfile(company="Acme", position="Data Engineer"),
+                JobProfile(company="acme"),
+            ]
+        )
+        assert merged.company == "Acme"
+        assert merged.position == "ML Engineer"
+
+    def test_keeps_longest_text(self):
+        merged = merge_job_profiles(
+            [
+                JobProfile(professional_experience="3 years"),
+                JobProfile(professional_experience="3 years of MLOps in production"),
+            ]
+        )
+        assert merged.professional_experience == "3 years of MLOps in production"
+
+    def test_is_deterministic(self):
+        profiles = [
+            JobProfile(company="A", technical_skills=["ML"]),
+            JobProfile(company="B", technical_skills=["NLP"]),
+        ]
+        assert merge_job_profiles(profiles) == merge_job_profiles(profiles)
+        assert merge_job_profiles(profiles).company == "A"
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """A fresh JobProfileExtractor; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_SUMMARY", "gpt-5-mini")
+    from resumetailor.llm.job_profile import JobProfileExtractor
+
+    return JobProfileExtractor()
+
+
+class FakeChain:
+    def __init__(self):
+        self.inputs = []
+        self.threads = set()
+        self.batch_configs = []
+
+    def _extract(self, input):
+        self.inputs.append(input["job_description"])
+        return JobProfile(required_technologies=input["job_description"].split()[:1])
+
+    def invoke(self, input, *args, **kwargs):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return self._extract(input)
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self._extract(input)
+
+    async def abatch(self, inputs, config=None, **kwargs):
+        self.batch_configs.append(config)
+        return [self._extract(input) for input in inputs]
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_extractor_maps_long_descriptions(extractor, monkeypatch, use_async):
+    import resumetailor.services.map_reduce as map_reduce
+
+    monkeypatch.setattr(
+        "resumetailor.llm.job_profile.needs_map_reduce",
+        lambda text: map_reduce.needs_map_reduce(text, threshold=100),
+    )
+    monkeypatch.setattr(
+        "resumetailor.llm.job_profile.split_job_description",
+        lambda text: map_reduce.split_job_description(text, max_tokens=100),
+    )
+    monkeypatch.setattr(
+        "resumetailor.llm.job_profile.job_profile_cache",
+        JobProfileCache(LLMCache(enabled=False)),
+    )
+    monkeypatch.setattr("resumetailor.llm.job_profile.MAP_REDUCE_MAX_WORKERS", 2)
+    chain = FakeChain()
+    extractor.chains["extractor"] = chain
+    job_description = "\n\n".join(f"Tech{i} " + "word " * 60 for i in range(4))
+    if use_async:
+        profile = asyncio.run(
+            extractor.aextract(job_description, thread_id=f"map-reduce-{use_async}")
+        )
+    else:
+        profile = extractor.extract(job_description, thread_id=f"map-reduce-{use_async}")
+    assert len(chain.inputs) == 4
+    assert profile.required_technologies == ["Tech0", "Tech1", "Tech2", "Tech3"]
+    # Chunks are extracted by at most MAP_REDUCE_MAX_WORKERS workers
+    if use_async:
+        assert chain.batch_configs == [{"max_concurrency": 2}]
+    else:
+        assert len(chain.threads) <= 2
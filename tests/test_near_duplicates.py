@@ -0,0 +1,97 @@
+"""
+Tests for near-duplicate job description detection.
+"""
+import json
+import pytest
+
+from resumetailor.models import JobProfile
+from resumetailor.services.near_duplicates import (
+    MinHashLSH,
+    NearDuplicateIndex,
+    jaccard,
+    shingles,
+)
+
+POSTING = (
+    "We are seeking an MLOps Engineer to join our AI platform team. You will build and "
+    "maintain systems for deploying machine learning solutions in production on AWS, "
+    "collaborate with data science teams and deploy ML pipelines and models. The ideal "
+    "candidate has strong Python, Docker, Kubernetes and Terraform skills and experience "
+    "with CI/CD pipelines, monitoring and infrastructure as code."
+)
+REPOST = POSTING.replace("We are seeking", "We are looking for").replace("strong", "solid")
+OTHER = (
+    "Our bakery in Paris is hiring a pastry chef to prepare croissants, tarts and bread "
+    "every morning. You love early hours, butter and working in a small friendly team."
+)
+
+
+def save_application(data_dir, name, job_description, position):
+    app_dir = data_dir / name
+    app_dir.mkdir(parents=True)
+    (app_dir / "job_description.txt").write_text(job_description)
+    (app_dir / "job_profile.json").write_text(json.dumps(JobProfile(position=position).model_dump()))
+    return app_dir
+
+
+class TestMinHashLSH:
+    def test_shingles_are_normalized(self):
+        assert shingles("ML Engineer, Python!") == shingles("ml engineer python")
+        assert len(shingles("one two")) == 1
+        assert shingles("") == frozenset()
+
+    def test_signature_is_deterministic(self):
+        shingle_set = shingles(POSTING)
+        assert (MinHashLSH().signature(shingle_set) == MinHashLSH().signature(shingle_set)).all()
+
+    def test_signature_estimates_jaccard(self):
+        lsh = MinHashLSH(bands=64, rows=4)
+        a, b = shingles(POSTING), shingles(REPOST)
+        estimate = (lsh.signature(a) == lsh.signature(b)).mean()
+        assert estimate == pytest.approx(jaccard(a, b), abs=0.15)
+
+    def test_candidates(self):
+        lsh = MinHashLSH()
+        lsh.add("posting", shingles(POSTING))
+        lsh.add("other", shingles(OTHER))
+        assert lsh.candidates(shingles(REPOST)) == {"posting"}
+        lsh.remove("posting")
+        assert lsh.candidates(shingles(REPOST)) == set()
+        assert len(lsh) == 1
+
+
+class TestNearDuplicateIndex:
+    def test_finds_reposted_role(self, tmp_path):
+        index = NearDuplicateIndex(threshold=0.6)
+        save_application(tmp_path, "mlops", POSTING, "MLOps Engineer")
+        save_application(tmp_path, "bakery", OTHER, "Pastry Chef")
+        assert index.build_from_history(tmp_path) == 2
+
+        match = index.find(REPOST)
+        assert match.application_id == "mlops"
+        assert 0.6 <= match.similarity < 1.0
+        assert index.find_profile(REPOST).position == "MLOps Engineer"
+
+    def test_threshold(self, tmp_path):
+        index = NearDuplicateIndex(threshold=0.99)
+        index.add(save_application(tmp_path, "mlops", POSTING, "MLOps Engineer"), POSTING)
+        assert index.find(REPOST) is None
+        assert index.find(POSTING).similarity == 1.0
+
+    def test_disabled(self, tmp_path):
+        index = NearDuplicateIndex(threshold=0)
+        index.add(save_application(tmp_path, "mlops", POSTING, "MLOps Engineer"), POSTING)
+        assert index.find(POSTING) is None
+
+    def test_incremental_updates(self, tmp_path):
+        index = NearDuplicateIndex(threshold=0.6)
+        assert index.find_profile(REPOST) is None
+        index.add(save_application(tmp_path, "mlops", POSTING, "MLOps Engineer"), POSTING)
+        assert index.find_profile(REPOST).position == "MLOps Engineer"
+        index.remove("mlops")
+        assert index.find_profile(REPOST) is None
+
+    def test_skips_applications_without_profile(self, tmp_path):
+        (tmp_path / "draft").mkdir()
+        (tmp_path / "draft" / "job_description.txt").write_text(POSTING)
+        assert NearDuplicateIndex().build_from_history(tmp_path) == 0
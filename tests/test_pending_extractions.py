@@ -0,0 +1,77 @@
+"""
+Tests for the background extractions started by /job-profile/draft.
+"""
+import asyncio
+import pytest
+
+from resumetailor.core.session import session_manager
+from resumetailor.models import JobProfile
+
+JOB_DESCRIPTION = "We are hiring an ML Engineer with Python and Kubernetes experience."
+
+
+@pytest.fixture
+def job_profile_api(monkeypatch):
+    """The job profile router with a fake background extraction."""
+    from resumetailor.api import job_profile
+
+    async def aextract(job_description, thread_id, job_profile=None):
+        await asyncio.sleep(0.01)
+        if "fail" in job_description:
+            raise RuntimeError("LLM unavailable")
+        return JobProfile(position="ML Engineer")
+
+    monkeypatch.setattr(job_profile.extractor, "aextract", aextract)
+    return job_profile
+
+
+@pytest.fixture
+def session_id():
+    session_id = session_manager.create_session("job_application", ["job_profile"])
+    yield session_id
+    session_manager.sessions.pop(session_id, None)
+
+
+def draft(job_profile_api, session_id, job_description=JOB_DESCRIPTION):
+    request = job_profile_api.GenerateJobProfileRequest(
+        session_id=session_id, job_description=job_description
+    )
+    return job_profile_api.draft_job_profile(request)
+
+
+def test_finished_extraction_is_stored(job_profile_api, session_id):
+    async def run():
+        await draft(job_profile_api, session_id)
+        assert session_id in job_profile_api._pending_extractions
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert session_id not in job_profile_api._pending_extractions
+    session = session_manager.get_session(session_id)
+    assert session.job_profile_extracted
+    assert session.job_profile.position == "ML Engineer"
+
+
+def test_failed_extraction_is_logged(job_profile_api, session_id, caplog):
+    async def run():
+        await draft(job_profile_api, session_id, "Extraction will fail")
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert session_id not in job_profile_api._pending_extractions
+    assert not session_manager.get_session(session_id).job_profile_extracted
+    assert "LLM unavailable" in caplog.text
+
+
+def test_discarded_session_cancels_extraction(job_profile_api, session_id):
+    async def run():
+        await draft(job_profile_api, session_id)
+        _, task = job_profile_api._pending_extractions[session_id]
+        job_profile_api.discard_pending_extraction(session_id)
+        session_manager.delete_session(session_id)
+        await asyncio.sleep(0.05)
+        return task
+
+    task = asyncio.run(run())
+    assert task.cancelled()
+    assert session_id not in job_profile_api._pending_extractions
@@ -0,0 +1,53 @@
+"""
+Tests for the token-efficient prompt serialization.
+"""
+import json
+import pytest
+
+from resumetailor.models import JobProfile
+from resumetailor.models.resume import WorkPosition
+from resumetailor.services.utils import (
+    model_to_prompt,
+    model_to_str,
+    count_tokens,
+    prompt_token_savings,
+    _prune_empty,
+)
+
+
+@pytest.fixture
+def job_profile():
+    return JobProfile(company="ACME", position="Backend Developer")
+
+
+class TestModelToPrompt:
+    def test_drops_null_and_empty_fields(self, job_profile):
+        data = json.loads(model_to_prompt(job_profile))
+        assert data == {"company": "ACME", "position": "Backend Developer"}
+
+    def test_compact_separators(self, job_profile):
+        text = model_to_prompt(job_profile)
+        assert "\n" not in text
+        assert ": " not in text and ", " not in text
+
+    def test_list_of_models(self):
+        positions = [WorkPosition.model_construct(job_title="Engineer", company="ACME")]
+        data = json.loads(model_to_prompt(positions))
+        assert data == [{"job_title": "Engineer", "company": "ACME"}]
+
+    def test_keeps_falsy_values_with_information(self):
+        data = {"grade": 0, "current": False, "note": None, "tags": [""], "nested": {"a": []}}
+        assert _prune_empty(data) == {"grade": 0, "current": False}
+
+    def test_pretty_format_matches_model_to_str(self, job_profile):
+        assert model_to_prompt(job_profile, format="pretty") == model_to_str(job_profile)
+
+    @pytest.mark.parametrize("value, expected", [(None, ""), ("already text", "already text")])
+    def test_non_models_pass_through(self, value, expected):
+        assert model_to_prompt(value) == expected
+
+
+def test_prompt_token_savings(job_profile):
+    tokens, saved = prompt_token_savings(job_profile)
+    assert tokens == count_tokens(model_to_prompt(job_profile))
+    assert saved > tokens
@@ -0,0 +1,126 @@
+"""
+Tests for the process-wide token-bucket rate limiter.
+"""
+import pytest
+import asyncio
+from unittest.mock import Mock, patch, AsyncMock
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import HumanMessage
+
+from resumetailor.models import JobProfile
+from resumetailor.services.rate_limit import TokenBucketRateLimiter, estimate_tokens
+from resumetailor.services.retry import RetryableChain
+
+
+@pytest.fixture
+def frozen_clock():
+    """Patch the limiter clock so refills are fully deterministic."""
+    clock = {"now": 1000.0}
+    with patch(
+        "resumetailor.services.rate_limit.time.monotonic",
+        side_effect=lambda: clock["now"],
+    ):
+        yield clock
+
+
+class TestEstimateTokens:
+    """Test the prompt size heuristic."""
+
+    def test_estimate_tokens_string(self):
+        assert estimate_tokens("a" * 400) == 100
+
+    def test_estimate_tokens_nested_input(self):
+        """Test that models, messages and nested containers are all counted."""
+        value = {
+            "job_profile": JobProfile(company="ACME"),
+            "messages": [HumanMessage("b" * 40)],
+            "task": "c" * 40,
+        }
+        assert estimate_tokens(value) > 20
+
+    def test_estimate_tokens_minimum(self):
+        assert estimate_tokens(None) == 1
+
+
+class TestTokenBucketRateLimiter:
+    """Test the token-bucket accounting."""
+
+    def test_disabled_limiter_never_waits(self):
+        limiter = TokenBucketRateLimiter(requests_per_minute=0, tokens_per_minute=0)
+        assert not limiter.enabled
+        with patch("resumetailor.services.rate_limit.time.sleep") as mock_sleep:
+            for _ in range(100):
+                limiter.acquire(10_000)
+        assert mock_sleep.call_count == 0
+
+    def test_request_bucket_allows_burst_then_queues(self, frozen_clock):
+        """Test that a full bucket admits RPM calls at once and queues the rest."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, tokens_per_minute=0)
+        waits = [limiter._reserve(1) for _ in range(62)]
+        assert waits[:60] == [0.0] * 60
+        assert waits[60] == pytest.approx(1.0)
+        assert waits[61] == pytest.approx(2.0)
+
+    def test_token_bucket_queues_large_calls(self, frozen_clock):
+        """Test that the token budget, not only the request count, is enforced."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=0, tokens_per_minute=6000)
+        assert limiter._reserve(6000) == 0.0
+        assert limiter._reserve(3000) == pytest.approx(30.0)
+
+    def test_bucket_refills_over_time(self, frozen_clock):
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, tokens_per_minute=0)
+        for _ in range(60):
+            limiter._reserve(1)
+        frozen_clock["now"] += 5.0
+        for _ in range(5):
+            assert limiter._reserve(1) == 0.0
+        assert limiter._reserve(1) == pytest.approx(1.0)
+
+    def test_oversized_call_is_capped(self, frozen_clock):
+        """Test that a call larger than the bucket waits for one refill, not forever."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=0, tokens_per_minute=1000)
+        assert limiter._reserve(50_000) == 0.0
+        assert limiter._reserve(50_000) == pytest.approx(60.0)
+
+    def test_cancelled_async_caller_releases_capacity(self, frozen_clock):
+        """Test that cancelling a queued caller gives back its reservation."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=1, tokens_per_minute=0)
+        limiter._reserve(1)
+
+        async def run():
+            task = asyncio.create_task(limiter.aacquire(1))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        assert limiter._requests == pytest.approx(0.0)
+
+
+class TestRetryableChainRateLimiting:
+    """Test that RetryableChain takes capacity before every attempt."""
+
+    def test_invoke_acquires_estimated_tokens(self):
+        prompt = ChatPromptTemplate.from_messages([("human", "{text}")])
+        chain = Mock()
+        chain.first = prompt
+        chain.invoke = Mock(return_value="result")
+        limiter = Mock(enabled=True)
+
+        retryable_chain = RetryableChain(chain, rate_limiter=limiter, expected_output_tokens=10)
+        assert retryable_chain.invoke({"text": "a" * 400}) == "result"
+        limiter.acquire.assert_called_once()
+        tokens = limiter.acquire.call_args[0][0]
+        assert 110 <= tokens <= 120
+
+    def test_ainvoke_acquires_async(self):
+        chain = Mock()
+        chain.ainvoke = AsyncMock(return_value="result")
+        limiter = Mock(enabled=True)
+        limiter.aacquire = AsyncMock()
+
+        retryable_chain = RetryableChain(chain, rate_limiter=limiter)
+        assert asyncio.run(retryable_chain.ainvoke({"text": "a"})) == "result"
+        limiter.aacquire.assert_awaited_once()
+        limiter.acquire.assert_not_called()
@@ -0,0 +1,103 @@
+"""
+Tests for the local BM25 relevance filter.
+"""
+import pytest
+
+from resumetailor.models import JobProfile
+from resumetailor.models.resume import Degree, EduCourse, WorkPosition
+from resumetailor.services.relevance import (
+    tokenize,
+    bm25_scores,
+    filter_relevant,
+    filter_section,
+    job_profile_terms,
+)
+
+
+@pytest.fixture
+def job_profile():
+    return JobProfile(
+        technical_skills=["Machine learning", "CI/CD pipelines"],
+        required_technologies=["Python", "Kubernetes", "C++"],
+        responsibilities=["Deploy models to production"],
+    )
+
+
+def position(title, skills, period):
+    return WorkPosition(job_title=title, acquired_skills=skills, employment_period=period)
+
+
+@pytest.fixture
+def positions():
+    return [
+        position("Barista", ["Latte art", "Customer service"], "2014"),
+        position("ML Engineer", ["Python", "Kubernetes", "machine learning"], "2020"),
+        position("Waiter", ["Customer service"], "2015"),
+        position("C++ Developer", ["C++", "CI/CD"], "2018"),
+    ]
+
+
+class TestTokenize:
+    def test_keeps_technical_terms(self):
+        assert tokenize("C++, C# and Node.js with CI/CD.") == ["c++", "c#", "node.js", "ci/cd"]
+
+    def test_drops_stopwords(self):
+        assert tokenize("Deploy the models to production") == ["deploy", "models", "production"]
+
+
+class TestBM25:
+    def test_matching_document_scores_higher(self):
+        scores = bm25_scores([["python", "kubernetes"], ["latte", "art"]], ["python"])
+        assert scores[0] > 0
+        assert scores[1] == 0
+
+    def test_rare_terms_weigh_more(self):
+        documents = [["python", "rust"], ["python", "java"], ["python", "go"]]
+        scores = bm25_scores(documents, ["python", "rust"])
+        assert scores[0] > scores[1] == scores[2]
+
+    def test_empty(self):
+        assert bm25_scores([], ["python"]) == []
+
+
+class TestFilterSection:
+    def test_keeps_top_k_in_original_order(self, positions, job_profile):
+        kept = filter_section(positions, job_profile, top_k=2)
+        assert [p.job_title for p in kept] == ["ML Engineer", "C++ Developer"]
+
+    def test_min_score(self, positions, job_profile):
+        kept = filter_section(positions, job_profile, top_k=10, min_score=0.1)
+        assert [p.job_title for p in kept] == ["ML Engineer", "C++ Developer"]
+
+    def test_always_keeps_best_entry(self, positions, job_profile):
+        assert len(filter_section(positions, job_profile, top_k=10, min_score=100)) == 1
+
+    @pytest.mark.parametrize("top_k", [0, -1])
+    def test_disabled(self, positions, job_profile, top_k):
+        assert filter_section(positions, job_profile, top_k=top_k) == positions
+
+    def test_without_job_profile(self, positions):
+        assert filter_section(positions, None, top_k=1) == positions
+
+    def test_empty_query_keeps_everything(self, positions):
+        assert job_profile_terms(JobProfile(company="ACME")) == []
+        assert filter_section(positions, JobProfile(company="ACME"), top_k=1) == positions
+
+    def test_filters_courses_within_degree(self, job_profile):
+        degree = Degree(
+            degree="MSc",
+            institution="ETH",
+            field_of_study="Computer Science",
+            courses=[
+                EduCourse(name="Art History"),
+                EduCourse(name="Machine Learning", acquired_skills=["Python"]),
+                EduCourse(name="Medieval Poetry"),
+            ],
+        )
+        (kept,) = filter_section([degree], job_profile, top_k=1)
+        assert [course.name for course in kept.courses] == ["Machine Learning"]
+        assert len(degree.courses) == 3  # the full resume is not modified
+
+
+def test_filter_relevant_empty_query(positions):
+    assert filter_relevant(positions, [], top_k=1) == positions
@@ -0,0 +1,140 @@
+"""
+Tests for the vectorized TF-IDF resume index.
+"""
+import os
+import time
+import pytest
+import numpy as np
+
+from resumetailor.models import Resume, JobProfile
+from resumetailor.models.resume import Degree, EduCourse, WorkPosition, SkillCategory, Skill
+from resumetailor.services.resume_index import ResumeIndex, ResumeIndexStore
+
+
+@pytest.fixture
+def resume():
+    return Resume(
+        education=[
+            Degree(
+                degree="MSc",
+                institution="ETH",
+                field_of_study="Computer Science",
+                courses=[
+                    EduCourse(name="Machine Learning", acquired_skills=["Python"]),
+                    EduCourse(name="Art History"),
+                ],
+            )
+        ],
+        work_experience=[
+            WorkPosition(job_title="Barista", acquired_skills=["Latte art"]),
+            WorkPosition(job_title="ML Engineer", acquired_skills=["Python", "Kubernetes"]),
+        ],
+        additional_skills=[
+            SkillCategory(category="Tools", specific_skills=[Skill(name="Docker")])
+        ],
+    )
+
+
+@pytest.fixture
+def job_profile():
+    return JobProfile(
+        required_technologies=["Python", "Kubernetes", "Terraform"],
+        technical_skills=["Machine learning"],
+    )
+
+
+class TestResumeIndex:
+    def test_indexes_nested_entries(self, resume):
+        index = ResumeIndex(resume)
+        sections = [entry.section for entry in index.entries]
+        assert sections == [
+            "education",
+            "education.courses",
+            "education.courses",
+            "work_experience",
+            "work_experience",
+            "additional_skills",
+            "additional_skills.specific_skills",
+        ]
+        assert index.matrix.shape == (7, len(index.vocabulary))
+        assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0)
+
+    def test_rank_section(self, resume, job_profile):
+        ranked = ResumeIndex(resume).rank(job_profile, section="work_experience")
+        assert [entry.entry.job_title for entry, _ in ranked] == ["ML Engineer", "Barista"]
+        assert ranked[0][1] > 0 and ranked[1][1] == 0
+
+    def test_rank_top_k(self, resume, job_profile):
+        ranked = ResumeIndex(resume).rank(job_profile, top_k=2)
+        assert len(ranked) == 2
+        assert ranked[0][1] >= ranked[1][1]
+
+    def test_filter_section(self, resume, job_profile):
+        index = ResumeIndex(resume)
+        kept = index.filter_section("work_experience", resume.work_experience, job_profile, top_k=1)
+        assert [position.job_title for position in kept] == ["ML Engineer"]
+        education = index.filter_section("education", resume.education, job_profile, top_k=1)
+        assert [course.name for course in education[0].courses] == ["Machine Learning"]
+
+    def test_filter_section_of_other_entries(self, resume, job_profile):
+        other = [WorkPosition(job_title="Data Engineer")]
+        assert ResumeIndex(resume).filter_section("work_experience", other, job_profile) is None
+
+    def test_writer_ranks_indexed_entries(self, tmp_path, resume, job_profile, monkeypatch):
+        from resumetailor.llm import resume as resume_module
+
+        path = tmp_path / "full_resume.json"
+        path.write_text(resume.model_dump_json())
+        store = ResumeIndexStore(path)
+        monkeypatch.setattr(resume_module, "resume_index_store", store)
+        monkeypatch.setattr(
+            resume_module, "filter_section", lambda *args: pytest.fail("ranked with BM25")
+        )
+        kept = resume_module._relevant_entries("work_experience", resume.work_experience, job_profile)
+        assert [position.job_title for position in kept] == ["Barista", "ML Engineer"]
+
+    def test_coverage(self, resume, job_profile):
+        coverage, missing = ResumeIndex(resume).coverage(job_profile)
+        assert missing == ["terraform"]
+        assert coverage == pytest.approx(4 / 5)
+
+    def test_empty_resume(self, job_profile):
+        index = ResumeIndex(Resume())
+        assert len(index) == 0
+        assert index.rank(job_profile) == []
+
+
+class TestResumeIndexStore:
+    def test_rebuilds_when_file_changes(self, tmp_path, resume):
+        path = tmp_path / "full_resume.json"
+        store = ResumeIndexStore(path)
+        assert store.get() is None
+
+        path.write_text(resume.model_dump_json())
+        index = store.get()
+        assert store.get() is index
+
+        path.write_text(Resume(work_experience=resume.work_experience).model_dump_json())
+        mtime = path.stat().st_mtime + 1
+        os.utime(path, (mtime, mtime))
+        assert len(store.get()) == 2
+
+
+@pytest.mark.performance
+def test_scoring_is_fast(job_profile):
+    """Score a job profile against a resume with hundreds of entries in milliseconds."""
+    positions = [
+        WorkPosition(
+            job_title=f"Engineer {i}",
+            responsibilities=[f"Built service {i} with Python and technology{i % 50}"],
+            acquired_skills=["Kubernetes" if i % 3 else "Java", f"tool{i}"],
+        )
+        for i in range(500)
+    ]
+    index = ResumeIndex(Resume(work_experience=positions))
+    start = time.perf_counter()
+    for _ in range(100):
+        index.score(job_profile)
+    elapsed = (time.perf_counter() - start) / 100
+    print(f"\nscoring {len(index)} entries: {elapsed * 1000:.3f} ms")
+    assert elapsed < 0.05
@@ -0,0 +1,313 @@
+"""
+Tests for the deterministic mapping of a refined resume to the output schema.
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from resumetailor.models import OutputResume, PersonalInfo, Resume, to_output_resume
+from resumetailor.models import output_resume as output
+from resumetailor.models.resume import (
+    Achievement,
+    Certification,
+    Degree,
+    EduCourse,
+    EduGradingSystem,
+    EduProject,
+    Project,
+    Publication,
+    Skill,
+    SkillCategory,
+    WorkPosition,
+)
+from resumetailor.models.resume_mapping import SECTION_MAPPERS, join_text, publication_year
+
+RESUME = Resume(
+    personal_information=PersonalInfo(name="Jane"),
+    education=[
+        Degree(
+            degree="MSc",
+            institution="ETH Zurich",
+            field_of_study="Computer Science",
+            final_evaluation_grade="5.5",
+            honors="With distinction",
+            start_year="2018",
+            year_of_completion="2020",
+            grading_system=EduGradingSystem(country="CH", high="6", low="1", passing_grade="4"),
+            courses=[EduCourse(name="Machine Learning", grade="6", acquired_skills=["PyTorch"])],
+            projects=[EduProject(name="Thesis", description="Graph networks")],
+            keywords=["ML"],
+        )
+    ],
+    work_experience=[
+        WorkPosition(
+            job_title="ML Engineer",
+            company="Acme",
+            employment_type="Full-time",
+            employment_period="2020 - 2023",
+            location="Berlin",
+            industry="Software",
+            responsibilities=["Deployed ML models to production", "Built CI/CD pipelines for training"],
+            acquired_skills=["Python", "Docker", "Kubernetes"],
+            achievements="Cut inference latency by 40%",
+            keywords=["MLOps"],
+        ),
+        WorkPosition(job_title="Intern"),
+    ],
+    projects=[
+        Project(
+            name="Model server",
+            link="https://github.com/jane/server",
+            platform="GitHub",
+            description=["Serves models over gRPC"],
+            acquired_skills="gRPC, Rust",
+            achievements=None,
+            keywords=["serving"],
+        )
+    ],
+    achievements=[
+        Achievement(title="Kaggle Gold", description=["Top 1% of 2,000 teams"], relevance="Applied ML"),
+        Achievement(title="Hackathon"),
+    ],
+    certifications=[
+        Certification(
+            name="CKA",
+            issuing_organization="CNCF",
+            link="https://cncf.io",
+            description="Kubernetes administration",
+            acquired_skills=["Kubernetes", "Helm"],
+            keywords=["k8s"],
+        )
+    ],
+    additional_skills=[
+        SkillCategory(
+            category="Languages",
+            specific_skills=[Skill(name="English", proficiency="C2"), Skill(name="German")],
+        ),
+        SkillCategory(category="Interests", specific_skills=None),
+    ],
+    publications=[
+        Publication(
+            title="Fast inference",
+            authors="J. Doe",
+            publisher="NeurIPS",
+            publication_date="December 2022",
+            link="https://arxiv.org/abs/1",
+            description=["Quantized transformers", "Benchmarked on GPUs and CPUs"],
+            acquired_skills="CUDA",
+            keywords=["inference"],
+        )
+    ],
+)
+
+
+class TestJoinText:
+    def test_strings(self):
+        assert join_text(" Built a model ") == "Built a model"
+        assert join_text("") is None
+        assert join_text(None) is None
+
+    def test_short_items_are_listed(self):
+        assert join_text(["Python", "Docker", "", "CI/CD pipelines"]) == "Python, Docker, CI/CD pipelines"
+
+    def test_long_items_are_sentences(self):
+        assert join_text(["Deployed models to production", "Led a team of five!"]) == (
+            "Deployed models to production. Led a team of five!"
+        )
+
+    def test_empty_lists(self):
+        assert join_text([]) is None
+        assert join_text([" "]) is None
+
+
+@pytest.mark.parametrize(
+    "date, year",
+    [("December 2022", "2022"), ("2019-05-01", "2019"), ("05/1999", "1999"), ("forthcoming", None), (None, None)],
+)
+def test_publication_year(date, year):
+    assert publication_year(date) == year
+
+
+class TestToOutputResume:
+    def test_maps_every_section(self):
+        result = to_output_resume(RESUME, "Summary.")
+        assert result.personal_information == PersonalInfo(name="Jane")
+        assert result.professional_summary == "Summary."
+        assert result.education == [
+            output.Degree(
+                degree="MSc",
+                institution="ETH Zurich",
+                field_of_study="Computer Science",
+                final_evaluation_grade="5.5",
+                honors="With distinction",
+                start_year="2018",
+                year_of_completion="2020",
+                courses=[output.EduCourseProject(name="Machine Learning", grade="6")],
+                projects=[output.EduCourseProject(name="Thesis")],
+            )
+        ]
+        assert result.work_experience == [
+            output.WorkPosition(
+                job_title="ML Engineer",
+                company="Acme",
+                employment_type="Full-time",
+                employment_period="2020 - 2023",
+                location="Berlin",
+                responsibilities="Deployed ML models to production. Built CI/CD pipelines for training.",
+                acquired_skills="Python, Docker, Kubernetes",
+                achievements="Cut inference latency by 40%",
+            ),
+            output.WorkPosition(job_title="Intern", company="", employment_period=""),
+        ]
+        assert result.projects == [
+            output.Project(
+                name="Model server",
+                link="https://github.com/jane/server",
+                platform="GitHub",
+                description="Serves models over gRPC",
+                acquired_skills="gRPC, Rust",
+            )
+        ]
+        assert result.achievements == [
+            output.Achievement(title="Kaggle Gold", description="Top 1% of 2,000 teams.", relevance="Applied ML"),
+            output.Achievement(title="Hackathon", description=""),
+        ]
+        assert result.certifications == [
+            output.Certification(
+                name="CKA",
+                issuing_organization="CNCF",
+                link="https://cncf.io",
+                description="Kubernetes administration",
+                acquired_skills="Kubernetes, Helm",
+            )
+        ]
+        assert result.additional_skills == [
+            output.SkillCategory(
+                category="Languages",
+                specific_skills=[output.Skill(name="English", proficiency="C2"), output.Skill(name="German")],
+            ),
+            output.SkillCategory(category="Interests", specific_skills=[]),
+        ]
+        assert result.publications == [
+            output.Publication(
+                title="Fast inference",
+                authors="J. Doe",
+                publisher="NeurIPS",
+                publication_year="2022",
+                link="https://arxiv.org/abs/1",
+                description="Quantized transformers. Benchmarked on GPUs and CPUs.",
+                acquired_skills="CUDA",
+            )
+        ]
+
+    def test_covers_every_output_field(self):
+        dumped = to_output_resume(RESUME, "Summary.").model_dump(exclude_none=True)
+        for section in Resume.model_fields:
+            assert section in dumped
+        assert set(dumped) == set(OutputResume.model_fields)
+
+    def test_empty_resume(self):
+        result = to_output_resume(Resume())
+        assert result.personal_information == PersonalInfo()
+        assert result.education is None
+        assert result.work_experience is None
+        assert result.professional_summary is None
+
+
+@pytest.fixture
+def resume_writer(monkeypatch):
+    """A fresh ResumeWriter; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_RESUME", "gpt-5-mini")
+    from resumetailor.llm.resume import ResumeWriter
+
+    return ResumeWriter()
+
+
+class FakeSummaryChain:
+    def __init__(self):
+        self.inputs = []
+
+    def invoke(self, input, *args, **kwargs):
+        self.inputs.append(input)
+        return SimpleNamespace(professional_summary="An ML engineer.")
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self.invoke(input)
+
+
+def test_compiler_only_asks_for_the_summary(resume_writer):
+    chain = FakeSummaryChain()
+    resume_writer.chains["summary"] = chain
+    result = resume_writer._output_compiler(RESUME)
+    assert result == to_output_resume(RESUME, "An ML engineer.")
+    assert len(chain.inputs) == 1
+    assert "Jane" not in chain.inputs[0]["resume"]
+    assert "ETH Zurich" in chain.inputs[0]["resume"]
+
+
+class FakeCompilerChain:
+    """Compiles a section with its mapper, or fails."""
+
+    def __init__(self, section_key, calls, fail=False):
+        self.section_key = section_key
+        self.calls = calls
+        self.fail = fail
+
+    def invoke(self, input, *args, **kwargs):
+        self.calls.append(input["section_name"])
+        if self.fail:
+            raise RuntimeError("invalid output")
+        mapper = SECTION_MAPPERS[self.section_key]
+        entries = getattr(RESUME, self.section_key)
+        section_data = [mapper(entry) for entry in entries]
+        if self.section_key == "projects":
+            section_data = [section_data[0].model_copy(update={"description": "Compiled by the LLM"})]
+        return SimpleNamespace(section_data=section_data)
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self.invoke(input)
+
+
+@pytest.fixture
+def llm_compile_mode(resume_writer, monkeypatch):
+    monkeypatch.setattr("resumetailor.llm.resume.RESUME_COMPILE_MODE", "llm")
+    calls = []
+    for section_key in SECTION_MAPPERS:
+        resume_writer.chains[("compiler", section_key)] = FakeCompilerChain(
+            section_key, calls, fail=section_key == "publications"
+        )
+    resume_writer.chains["summary"] = FakeSummaryChain()
+    return calls
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_llm_compiler_fans_out_per_section(resume_writer, llm_compile_mode, use_async):
+    if use_async:
+        result = asyncio.run(resume_writer._aoutput_compiler(RESUME))
+    else:
+        result = resume_writer._output_compiler(RESUME)
+    assert sorted(llm_compile_mode) == sorted(SECTION_MAPPERS)
+    mapped = to_output_resume(RESUME, "An ML engineer.")
+    assert result.projects[0].description == "Compiled by the LLM"
+    # The failed section keeps its mapping
+    assert result.publications == mapped.publications
+    assert result.model_copy(update={"projects": mapped.projects}) == mapped
+
+
+def test_llm_compiler_propagates_cancellation(resume_writer, llm_compile_mode):
+    async def cancelled(*args, **kwargs):
+        raise asyncio.CancelledError()
+
+    resume_writer.chains[("compiler", "projects")].ainvoke = cancelled
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(resume_writer._aoutput_compiler(RESUME))
+
+
+def test_llm_compiler_skips_empty_sections(resume_writer, llm_compile_mode):
+    resume = RESUME.model_copy(update={"publications": None, "achievements": []})
+    result = resume_writer._output_compiler(resume)
+    assert "publications" not in llm_compile_mode
+    assert "achievements" not in llm_compile_mode
+    assert result.publications is None
+    assert result.achievements == []
@@ -2,19 +2,38 @@
 Tests for the retry mechanism with exponential backoff for rate limits and other transient errors.
 """
 import pytest
+import asyncio
 import time
 import re
-from unittest.mock import Mock, patch, MagicMock
-from openai import RateLimitError, APIConnectionError, APIError
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+import httpx
+from openai import (
+    RateLimitError,
+    APIConnectionError,
+    APIError,
+    BadRequestError,
+    AuthenticationError,
+    InternalServerError,
+)
 from langchain_core.exceptions import LangChainException
 
 from resumetailor.services.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
     RetryableChain,
+    RetryPolicy,
+    classify_error,
+    ERROR_RATE_LIMIT,
+    ERROR_TRANSIENT,
+    ERROR_PERMANENT,
     retry_with_exponential_backoff,
+    async_retry_with_exponential_backoff,
     exponential_backoff_with_jitter,
     extract_retry_after,
     retry_llm_call,
     DEFAULT_MAX_RETRIES,
+    circuit_breakers,
+    openai_circuit_breaker,
 )
 
 
@@ -52,6 +71,20 @@ def mock_langchain_error():
     return LangChainException("LangChain error")
 
 
+def make_status_error(error_class, status_code, code=None, headers=None):
+    """Create an OpenAI status error as raised by the client."""
+    response = httpx.Response(
+        status_code,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.openai.com/v1/responses"),
+    )
+    return error_class(
+        message=f"Error code: {status_code}",
+        response=response,
+        body={"code": code, "message": "error", "type": "error", "param": None},
+    )
+
+
 @pytest.fixture
 def mock_failing_function():
     """Create a mock function that fails with rate limits before succeeding."""
@@ -96,6 +129,45 @@ class TestRetryUtilities:
         retry_after = extract_retry_after(mock_connection_error)
         assert retry_after is None
     
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({"retry-after-ms": "1500"}, 1.5),
+            ({"retry-after": "7"}, 7.0),
+            ({"x-ratelimit-reset-tokens": "6m0s", "x-ratelimit-reset-requests": "20ms"}, 360.0),
+            (
+                {
+                    "x-ratelimit-reset-tokens": "6m0s",
+                    "x-ratelimit-remaining-tokens": "1200",
+                    "x-ratelimit-reset-requests": "1.5s",
+                    "x-ratelimit-remaining-requests": "0",
+                },
+                1.5,
+            ),
+            ({"x-ratelimit-reset-requests": "1h2m3.5s"}, 3723.5),
+        ],
+    )
+    def test_extract_retry_after_from_headers(self, headers, expected):
+        """Test that response headers take precedence over the error message."""
+        error = make_status_error(RateLimitError, 429, headers=headers)
+        assert extract_retry_after(error) == pytest.approx(expected)
+
+    def test_extract_retry_after_http_date(self):
+        from email.utils import format_datetime
+        from datetime import datetime, timedelta, timezone
+
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        error = make_status_error(
+            InternalServerError, 503, headers={"retry-after": format_datetime(retry_at)}
+        )
+        assert 25 <= extract_retry_after(error) <= 30
+
+    def test_extract_retry_after_invalid_headers_fall_back(self):
+        error = make_status_error(
+            RateLimitError, 429, headers={"x-ratelimit-reset-tokens": "soon"}
+        )
+        assert extract_retry_after(error) is None
+
     def test_exponential_backoff_calculation(self):
         """Test exponential backoff delay calculation."""
         # Test basic exponential backoff
@@ -228,6 +300,85 @@ class TestRetryDecorator:
             assert call_count["count"] == 2
 
 
+class TestErrorClassification:
+    """Test that transient and permanent errors are told apart."""
+
+    def test_rate_limit(self, mock_rate_limit_error):
+        assert classify_error(mock_rate_limit_error) == ERROR_RATE_LIMIT
+
+    def test_insufficient_quota_is_permanent(self):
+        error = make_status_error(RateLimitError, 429, code="insufficient_quota")
+        assert classify_error(error) == ERROR_PERMANENT
+
+    @pytest.mark.parametrize(
+        "error_class, status_code, code",
+        [
+            (BadRequestError, 400, None),
+            (BadRequestError, 400, "context_length_exceeded"),
+            (AuthenticationError, 401, "invalid_api_key"),
+            (InternalServerError, 500, "context_length_exceeded"),
+        ],
+    )
+    def test_permanent_errors(self, error_class, status_code, code):
+        assert classify_error(make_status_error(error_class, status_code, code)) == ERROR_PERMANENT
+
+    def test_transient_errors(self, mock_connection_error, mock_api_error, mock_langchain_error):
+        assert classify_error(mock_connection_error) == ERROR_TRANSIENT
+        assert classify_error(mock_api_error) == ERROR_TRANSIENT
+        assert classify_error(mock_langchain_error) == ERROR_TRANSIENT
+        assert classify_error(make_status_error(InternalServerError, 503)) == ERROR_TRANSIENT
+
+    def test_unknown_errors(self):
+        assert classify_error(ValueError("boom")) is None
+
+    @patch('time.sleep')
+    def test_permanent_error_is_not_retried(self, mock_sleep):
+        """Test that a 400 fails on the first attempt instead of backing off."""
+        calls = {"count": 0}
+
+        @retry_with_exponential_backoff(max_retries=5)
+        def bad_request():
+            calls["count"] += 1
+            raise make_status_error(BadRequestError, 400, "context_length_exceeded")
+
+        with pytest.raises(BadRequestError):
+            bad_request()
+        assert calls["count"] == 1
+        assert mock_sleep.call_count == 0
+
+    @patch('time.sleep')
+    def test_per_class_policies(self, mock_sleep):
+        """Test that each error class has its own retry budget and delays."""
+        errors = [
+            APIConnectionError(request=Mock()),
+            RateLimitError(
+                message="Rate limit reached",
+                response=Mock(status_code=429),
+                body={"error": {"code": "rate_limit_exceeded"}},
+            ),
+            APIConnectionError(request=Mock()),
+        ]
+        calls = {"count": 0}
+
+        @retry_with_exponential_backoff(
+            max_retries=5,
+            jitter=False,
+            retry_policies={
+                ERROR_TRANSIENT: RetryPolicy(max_retries=1, base_delay=0.5),
+                ERROR_RATE_LIMIT: RetryPolicy(base_delay=10.0),
+            },
+        )
+        def flaky():
+            calls["count"] += 1
+            raise errors[calls["count"] - 1]
+
+        with pytest.raises(APIConnectionError):
+            flaky()
+        # transient retried once, rate limit once, second transient exhausts its budget
+        assert calls["count"] == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.5, 20.0]
+
+
 class TestRetryableChain:
     """Test the RetryableChain wrapper class."""
     
@@ -275,6 +426,252 @@ class TestRetryableChain:
         mock_chain.some_method.assert_called_once_with("arg")
 
 
+class TestAsyncRetry:
+    """Test the asyncio-based retry path."""
+
+    @patch('resumetailor.services.retry.asyncio.sleep', new_callable=AsyncMock)
+    def test_async_function_succeeds_after_retries(self, mock_sleep, mock_failing_function):
+        """Test that coroutines are retried and back off with asyncio.sleep."""
+        failing_func = mock_failing_function(fail_count=2)
+
+        @async_retry_with_exponential_backoff(max_retries=5, base_delay=0.1)
+        async def decorated_function():
+            return failing_func()
+
+        result = asyncio.run(decorated_function())
+        assert result == "success"
+        assert failing_func.call_count["count"] == 3
+        assert mock_sleep.await_count == 2
+
+    @patch('time.sleep')
+    @patch('resumetailor.services.retry.asyncio.sleep', new_callable=AsyncMock)
+    def test_async_retry_does_not_block(self, mock_async_sleep, mock_sleep, mock_failing_function):
+        """Test that the async path never calls the blocking time.sleep."""
+        failing_func = mock_failing_function(fail_count=1)
+
+        @async_retry_with_exponential_backoff(max_retries=2, base_delay=0.1)
+        async def decorated_function():
+            return failing_func()
+
+        asyncio.run(decorated_function())
+        assert mock_sleep.call_count == 0
+        assert mock_async_sleep.await_count == 1
+
+    def test_async_backoff_is_cancellable(self):
+        """Test that cancelling the task interrupts a pending backoff."""
+        @async_retry_with_exponential_backoff(max_retries=3, base_delay=60.0, jitter=False)
+        async def always_failing_function():
+            raise APIConnectionError(request=Mock())
+
+        async def run():
+            task = asyncio.create_task(always_failing_function())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start < 5
+
+    @patch('resumetailor.services.retry.asyncio.sleep', new_callable=AsyncMock)
+    def test_retryable_chain_ainvoke(self, mock_sleep):
+        """Test that RetryableChain.ainvoke retries the chain's ainvoke."""
+        chain = Mock()
+        chain.ainvoke = AsyncMock(side_effect=[
+            RateLimitError(
+                message="Rate limit reached. Please try again in 1s.",
+                response=Mock(status_code=429),
+                body={"error": {"code": "rate_limit_exceeded"}}
+            ),
+            "async result",
+        ])
+
+        retryable_chain = RetryableChain(chain, max_retries=2, base_delay=0.1)
+        result = asyncio.run(retryable_chain.ainvoke({"input": "test"}))
+
+        assert result == "async result"
+        assert chain.ainvoke.await_count == 2
+        assert mock_sleep.await_count == 1
+
+    def test_retryable_chain_abatch(self):
+        """Test that RetryableChain.abatch returns results in input order."""
+        chain = Mock()
+
+        async def echo(value, config=None, **kwargs):
+            await asyncio.sleep(0.01 * (3 - value))
+            return value * 10
+
+        chain.ainvoke = echo
+        retryable_chain = RetryableChain(chain)
+        results = asyncio.run(retryable_chain.abatch([1, 2, 3]))
+        assert results == [10, 20, 30]
+
+    def test_retryable_chain_abatch_max_concurrency(self):
+        """Test that RetryableChain.abatch keeps at most max_concurrency inputs in flight."""
+        chain = Mock()
+        in_flight = []
+
+        async def echo(value, config=None, **kwargs):
+            in_flight.append(value)
+            await asyncio.sleep(0.01)
+            result = len(in_flight)
+            in_flight.remove(value)
+            return result
+
+        chain.ainvoke = echo
+        retryable_chain = RetryableChain(chain)
+        results = asyncio.run(retryable_chain.abatch([1, 2, 3, 4, 5], {"max_concurrency": 2}))
+        assert max(results) == 2
+
+
+@pytest.fixture
+def breaker():
+    """Create a circuit breaker that trips after 2 failures."""
+    return CircuitBreaker(
+        "test",
+        failure_threshold=2,
+        recovery_timeout=30.0,
+        is_failure=lambda e: isinstance(e, APIConnectionError),
+    )
+
+
+class TestCircuitBreaker:
+    """Test the circuit breaker state machine."""
+
+    def test_reset_closes_the_circuit(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        breaker.reset()
+        assert breaker.snapshot()["state"] == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_only_registered_breakers_are_listed(self, breaker):
+        assert circuit_breakers.get("test") is not breaker
+        assert circuit_breakers["openai"] is openai_circuit_breaker
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        failing = Mock(side_effect=APIConnectionError(request=Mock()))
+        for _ in range(2):
+            with pytest.raises(APIConnectionError):
+                breaker.call(failing)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.call(failing)
+        assert failing.call_count == 2  # rejected without calling
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure()
+        breaker.call(lambda: "ok")
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_non_outage_errors_do_not_open(self, breaker):
+        """Test that errors proving the service is reachable count as success."""
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                breaker.call(Mock(side_effect=ValueError("bad request")))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        with patch('resumetailor.services.retry.time.monotonic', return_value=time.monotonic() + 31):
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            breaker.before_call()  # the probe
+            with pytest.raises(CircuitOpenError):
+                breaker.before_call()  # concurrent callers are still rejected
+            breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        with patch('resumetailor.services.retry.time.monotonic', return_value=time.monotonic() + 31):
+            with pytest.raises(APIConnectionError):
+                breaker.call(Mock(side_effect=APIConnectionError(request=Mock())))
+            assert breaker.state == CircuitBreaker.OPEN
+
+    @patch('time.sleep')
+    def test_retryable_chain_stops_retrying_when_open(self, mock_sleep, breaker, mock_chain):
+        """Test that an open circuit cuts the retry ladder short."""
+        mock_chain.invoke.side_effect = APIConnectionError(request=Mock())
+        retryable_chain = RetryableChain(mock_chain, max_retries=5, circuit_breaker=breaker)
+
+        with pytest.raises(CircuitOpenError):
+            retryable_chain.invoke({"input": "test"})
+        assert mock_chain.invoke.call_count == 2
+        assert breaker.snapshot()["state"] == CircuitBreaker.OPEN
+
+
+class TestSharedCooldown:
+    """Test that one rate-limited call pauses all other callers."""
+
+    def test_rate_limit_starts_cooldown_for_other_callers(self):
+        from resumetailor.services.rate_limit import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(requests_per_minute=0, tokens_per_minute=0)
+        limited_chain = Mock()
+        limited_chain.invoke.side_effect = make_status_error(
+            RateLimitError, 429, headers={"retry-after": "20"}
+        )
+        retryable_chain = RetryableChain(limited_chain, max_retries=0, rate_limiter=limiter)
+        with pytest.raises(RateLimitError):
+            retryable_chain.invoke({"input": "test"})
+        assert 19 <= limiter.cooldown_remaining <= 20
+
+        other_chain = Mock()
+        other_chain.invoke = Mock(return_value="ok")
+
+        def other_caller():
+            with patch("resumetailor.services.rate_limit.time.sleep") as mock_sleep:
+                RetryableChain(other_chain, rate_limiter=limiter).invoke({"input": "test"})
+                return mock_sleep.call_args[0][0]
+
+        # Contexts are per thread, so a different thread is not exempt
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            waited = executor.submit(other_caller).result()
+        assert 19 <= waited <= 20
+
+    @patch('time.sleep')
+    def test_caller_that_hit_the_limit_is_not_delayed_twice(self, mock_sleep):
+        from resumetailor.services.rate_limit import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(requests_per_minute=0, tokens_per_minute=0)
+        chain = Mock()
+        chain.invoke.side_effect = [
+            make_status_error(RateLimitError, 429, headers={"retry-after": "5"}),
+            "ok",
+        ]
+        retryable_chain = RetryableChain(chain, max_retries=2, rate_limiter=limiter)
+        assert retryable_chain.invoke({"input": "test"}) == "ok"
+        assert mock_sleep.call_count == 1
+        assert 5.0 <= mock_sleep.call_args[0][0] <= 5.5
+
+    @patch('time.sleep')
+    def test_exemption_ends_when_retries_are_exhausted(self, mock_sleep):
+        from resumetailor.services.rate_limit import TokenBucketRateLimiter
+
+        limiter = TokenBucketRateLimiter(requests_per_minute=0, tokens_per_minute=0)
+        limited_chain = Mock()
+        limited_chain.invoke.side_effect = make_status_error(
+            RateLimitError, 429, headers={"retry-after": "20"}
+        )
+        with pytest.raises(RateLimitError):
+            RetryableChain(limited_chain, max_retries=0, rate_limiter=limiter).invoke({"input": "test"})
+        assert mock_sleep.call_count == 0
+
+        # The next call of the same thread waits for the cooldown like everybody else
+        other_chain = Mock()
+        other_chain.invoke = Mock(return_value="ok")
+        RetryableChain(other_chain, rate_limiter=limiter).invoke({"input": "test"})
+        assert 19 <= mock_sleep.call_args[0][0] <= 20
+
+
 class TestRetryLLMCall:
     """Test the retry_llm_call convenience function."""
     
@@ -0,0 +1,171 @@
+"""
+Tests for the speculative background compilation of resumes awaiting review.
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from resumetailor.models import PersonalInfo, Resume, to_output_resume
+from resumetailor.models.resume import Project, WorkPosition
+
+FULL_RESUME = Resume(
+    work_experience=[WorkPosition(job_title="ML Engineer", company="Acme")],
+    projects=[Project(name="Model server", description="Serves models over gRPC")],
+)
+
+EDITED_PROJECTS = [Project(name="Model server", description="Serves models over gRPC and REST")]
+
+
+@pytest.fixture
+def resume_writer(monkeypatch):
+    """A fresh ResumeWriter with fake chains; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_RESUME", "gpt-5-mini")
+    monkeypatch.setattr("resumetailor.llm.resume.SPECULATIVE_COMPILE", True)
+    from resumetailor.llm.resume import ResumeWriter
+
+    resume_writer = ResumeWriter()
+
+    async def write(input, *args, **kwargs):
+        section_data = getattr(FULL_RESUME, input["section_name"])
+        return SimpleNamespace(section_data=section_data, explanation="rewritten")
+
+    async def edit(input, *args, **kwargs):
+        return SimpleNamespace(section_data=EDITED_PROJECTS, explanation="edited")
+
+    for section in resume_writer.sections:
+        writer_chains = resume_writer.chains[("writer", section)]
+        for task in writer_chains:
+            writer_chains[task] = SimpleNamespace(ainvoke=write)
+        resume_writer.chains[("editor", section)].ainvoke = edit
+    return resume_writer
+
+
+class FakeSummaryChain:
+    """Counts summary calls; each call takes a moment, like a real request."""
+
+    def __init__(self):
+        self.resumes = []
+
+    async def ainvoke(self, input, *args, **kwargs):
+        self.resumes.append(input["resume"])
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(professional_summary=f"Summary {len(self.resumes)}.")
+
+
+@pytest.fixture
+def summary_chain(resume_writer):
+    chain = FakeSummaryChain()
+    resume_writer.chains["summary"] = chain
+    return chain
+
+
+def test_complete_returns_speculative_result(resume_writer, summary_chain):
+    async def run():
+        refined = await resume_writer.agenerate(
+            thread_id="speculative-hit", resume=FULL_RESUME, job_titles="ML Engineer"
+        )
+        assert "speculative-hit" in resume_writer._speculative_compiles
+        # The API sets the private information on the returned resume
+        refined.personal_information = PersonalInfo(name="Jane")
+        await asyncio.sleep(0.1)
+        return await resume_writer.acomplete(thread_id="speculative-hit")
+
+    output_resume = asyncio.run(run())
+    assert len(summary_chain.resumes) == 1
+    assert "Jane" not in summary_chain.resumes[0]
+    assert output_resume == to_output_resume(FULL_RESUME, "Summary 1.")
+    assert "speculative-hit" not in resume_writer._speculative_compiles
+
+
+def test_edits_replace_stale_runs(resume_writer, summary_chain):
+    async def run():
+        await resume_writer.agenerate(
+            thread_id="speculative-edit", resume=FULL_RESUME, job_titles="ML Engineer"
+        )
+        _, stale = resume_writer._speculative_compiles["speculative-edit"]
+        await resume_writer.aedit_section(
+            thread_id="speculative-edit",
+            section_key="projects",
+            editing_suggestions="Mention REST",
+        )
+        output_resume = await resume_writer.acomplete(thread_id="speculative-edit")
+        return stale, output_resume
+
+    stale, output_resume = asyncio.run(run())
+    assert output_resume.projects[0].description == "Serves models over gRPC and REST"
+    # The summary was written from the candidate data, which the suggestions did not change
+    assert output_resume.professional_summary == "Summary 1."
+    assert len(summary_chain.resumes) == 1
+    # With the summary written, the stale run may have finished before the edit replaced it
+    assert stale.cancelled() or stale.result().projects[0].description == "Serves models over gRPC"
+
+
+def test_user_edited_resume_is_recompiled(resume_writer, summary_chain):
+    async def run():
+        await resume_writer.agenerate(
+            thread_id="speculative-miss", resume=FULL_RESUME, job_titles="ML Engineer"
+        )
+        await asyncio.sleep(0.1)
+        edited = FULL_RESUME.model_copy(update={"projects": EDITED_PROJECTS})
+        return await resume_writer.acomplete(thread_id="speculative-miss", user_edited_resume=edited)
+
+    output_resume = asyncio.run(run())
+    assert len(summary_chain.resumes) == 2
+    assert output_resume.projects[0].description == "Serves models over gRPC and REST"
+    assert output_resume.professional_summary == "Summary 2."
+
+
+def test_disabled(resume_writer, summary_chain, monkeypatch):
+    monkeypatch.setattr("resumetailor.llm.resume.SPECULATIVE_COMPILE", False)
+
+    async def run():
+        await resume_writer.agenerate(
+            thread_id="speculative-disabled", resume=FULL_RESUME, job_titles="ML Engineer"
+        )
+        assert resume_writer._speculative_compiles == {}
+        return await resume_writer.acomplete(thread_id="speculative-disabled")
+
+    assert asyncio.run(run()) == to_output_resume(FULL_RESUME, "Summary 1.")
+    assert len(summary_chain.resumes) == 1
+
+
+@pytest.fixture
+def slow_compiler(resume_writer, monkeypatch):
+    """Keeps speculative runs pending long enough to be cancelled."""
+
+    async def compile(*args, **kwargs):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(resume_writer, "_aoutput_compiler", compile)
+
+
+def test_abandoned_threads_are_dropped(resume_writer, summary_chain, slow_compiler, monkeypatch):
+    monkeypatch.setattr("resumetailor.llm.resume.SPECULATIVE_COMPILE_MAX_THREADS", 2)
+
+    async def run():
+        for thread_id in ("abandoned-1", "abandoned-2", "abandoned-3"):
+            await resume_writer.agenerate(thread_id=thread_id, resume=FULL_RESUME)
+        oldest = {thread_id: task for thread_id, (_, task) in resume_writer._speculative_compiles.items()}
+        resume_writer.discard_speculative_compile("abandoned-2")
+        await asyncio.sleep(0.01)
+        return oldest
+
+    tasks = asyncio.run(run())
+    assert list(tasks) == ["abandoned-2", "abandoned-3"]
+    assert tasks["abandoned-2"].cancelled()
+    assert list(resume_writer._speculative_compiles) == ["abandoned-3"]
+
+
+def test_sync_complete_cancels_the_speculative_run(resume_writer, summary_chain, slow_compiler):
+    async def run():
+        await resume_writer.agenerate(thread_id="speculative-sync", resume=FULL_RESUME)
+        _, task = resume_writer._speculative_compiles["speculative-sync"]
+        # The sync API runs in a worker thread, outside the event loop of the task
+        await asyncio.to_thread(resume_writer.complete, thread_id="speculative-sync")
+        await asyncio.sleep(0.01)
+        return task
+
+    task = asyncio.run(run())
+    assert task.cancelled()
+    assert "speculative-sync" not in resume_writer._speculative_compiles
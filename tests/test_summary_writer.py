@@ -0,0 +1,147 @@
+"""
+Tests for the professional summary written concurrently with the section writers.
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from resumetailor.models import PersonalInfo, Resume
+from resumetailor.models.resume import Project, WorkPosition
+
+FULL_RESUME = Resume(
+    work_experience=[WorkPosition(job_title="ML Engineer", company="Acme")],
+    projects=[Project(name="Model server", description="Serves models over gRPC")],
+)
+
+USER_PROJECTS = [Project(name="Vector database", description="Written in Rust")]
+
+
+class FakeSummaryChain:
+    def __init__(self):
+        self.inputs = []
+        self.started = asyncio.Event()
+
+    def invoke(self, input, *args, **kwargs):
+        self.inputs.append(input)
+        return SimpleNamespace(professional_summary=f"Summary {len(self.inputs)}.")
+
+    async def ainvoke(self, input, *args, **kwargs):
+        self.started.set()
+        return self.invoke(input)
+
+
+@pytest.fixture
+def resume_writer(monkeypatch):
+    """A fresh ResumeWriter with fake chains; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_RESUME", "gpt-5-mini")
+    monkeypatch.setattr("resumetailor.llm.resume.SPECULATIVE_COMPILE", False)
+    from resumetailor.llm.resume import ResumeWriter
+
+    resume_writer = ResumeWriter()
+    summary_chain = FakeSummaryChain()
+
+    def write(input, *args, **kwargs):
+        section_data = getattr(FULL_RESUME, input["section_name"])
+        return SimpleNamespace(section_data=section_data, explanation="rewritten")
+
+    async def awrite(input, *args, **kwargs):
+        # Fails unless the summary is written in the same fan-out
+        await asyncio.wait_for(summary_chain.started.wait(), timeout=1)
+        return write(input)
+
+    def edit(input, *args, **kwargs):
+        return SimpleNamespace(section_data=USER_PROJECTS, explanation="edited")
+
+    for section in resume_writer.sections:
+        writer_chains = resume_writer.chains[("writer", section)]
+        for task in writer_chains:
+            writer_chains[task] = SimpleNamespace(invoke=write, ainvoke=awrite)
+        resume_writer.chains[("editor", section)].invoke = edit
+    resume_writer.chains["summary"] = summary_chain
+    return resume_writer
+
+
+def test_summary_is_written_with_the_sections(resume_writer):
+    summary_chain = resume_writer.chains["summary"]
+    asyncio.run(
+        resume_writer.agenerate(
+            thread_id="summary-concurrent",
+            resume=FULL_RESUME,
+            job_titles="ML Engineer",
+            focus_aspects="MLOps",
+        )
+    )
+    assert len(summary_chain.inputs) == 1
+    assert summary_chain.inputs[0]["target"] == "Job titles: ML Engineer\nFocus aspects: MLOps"
+    assert "Model server" in summary_chain.inputs[0]["resume"]
+
+    output_resume = resume_writer.complete(thread_id="summary-concurrent")
+    assert output_resume.professional_summary == "Summary 1."
+    assert len(summary_chain.inputs) == 1
+
+
+def test_suggestions_keep_the_summary(resume_writer):
+    summary_chain = resume_writer.chains["summary"]
+    resume_writer.generate(thread_id="summary-suggestions", resume=FULL_RESUME)
+    resume_writer.edit_section(
+        thread_id="summary-suggestions",
+        section_key="projects",
+        editing_suggestions="Shorter descriptions",
+    )
+    output_resume = resume_writer.complete(thread_id="summary-suggestions")
+    assert output_resume.professional_summary == "Summary 1."
+    assert len(summary_chain.inputs) == 1
+
+
+def test_user_edited_section_makes_the_summary_stale(resume_writer):
+    summary_chain = resume_writer.chains["summary"]
+    resume_writer.generate(thread_id="summary-user-edit", resume=FULL_RESUME)
+    for _ in range(2):
+        resume_writer.edit_section(
+            thread_id="summary-user-edit",
+            section_key="projects",
+            editing_suggestions="",
+            user_edited_section=USER_PROJECTS,
+        )
+    # The same section again does not change the candidate data
+    assert len(summary_chain.inputs) == 2
+    assert "Vector database" in summary_chain.inputs[1]["resume"]
+    assert "Model server" not in summary_chain.inputs[1]["resume"]
+
+    output_resume = resume_writer.complete(thread_id="summary-user-edit")
+    assert output_resume.professional_summary == "Summary 2."
+    assert len(summary_chain.inputs) == 2
+
+
+def test_user_edited_resume(resume_writer):
+    summary_chain = resume_writer.chains["summary"]
+    refined = resume_writer.generate(thread_id="summary-unchanged", resume=FULL_RESUME)
+    unchanged = refined.model_copy(update={"personal_information": PersonalInfo(name="Jane")})
+    output_resume = resume_writer.complete(thread_id="summary-unchanged", user_edited_resume=unchanged)
+    assert output_resume.professional_summary == "Summary 1."
+
+    resume_writer.generate(thread_id="summary-changed", resume=FULL_RESUME)
+    changed = refined.model_copy(update={"projects": USER_PROJECTS})
+    output_resume = resume_writer.complete(thread_id="summary-changed", user_edited_resume=changed)
+    assert output_resume.professional_summary == "Summary 3."
+    assert "Vector database" in summary_chain.inputs[-1]["resume"]
+
+
+def test_regeneration_resets_the_summary(resume_writer):
+    summary_chain = resume_writer.chains["summary"]
+    resume_writer.generate(thread_id="summary-regenerate", resume=FULL_RESUME)
+    resume_writer.edit_section(
+        thread_id="summary-regenerate",
+        section_key="projects",
+        editing_suggestions="",
+        user_edited_section=USER_PROJECTS,
+    )
+    other_resume = Resume(work_experience=[WorkPosition(job_title="Data Engineer", company="Initech")])
+    resume_writer.generate(thread_id="summary-regenerate", resume=other_resume)
+    assert len(summary_chain.inputs) == 3
+    assert "Vector database" not in summary_chain.inputs[-1]["resume"]
+    assert "Initech" in summary_chain.inputs[-1]["resume"]
+    state = resume_writer.graph.get_state({"configurable": {"thread_id": "summary-regenerate"}}).values
+    assert state["user_edited_sections"] == {}
+    assert state["professional_summary"] == "Summary 3."
@@ -0,0 +1,53 @@
+"""
+Tests for the Aho-Corasick dictionary scan of job descriptions.
+"""
+import pytest
+
+from resumetailor.models import JobProfile
+from resumetailor.services.tech_dictionary import AhoCorasick, TechDictionary, tech_dictionary
+
+
+class TestAhoCorasick:
+    def test_finds_overlapping_patterns(self):
+        automaton = AhoCorasick({"he": ("a", "he"), "she": ("a", "she"), "hers": ("a", "hers")})
+        matches = [(m.start, m.end, m.value[1]) for m in automaton.iter("ushers")]
+        assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    def test_no_patterns(self):
+        assert list(AhoCorasick({}).iter("text")) == []
+
+
+class TestTechDictionary:
+    def test_draft_job_profile(self):
+        job_profile = tech_dictionary.draft_job_profile(
+            "We use Python, k8s and Terraform on Google Cloud Platform. "
+            "A CKA is a plus. Fluent English and Deutsch required."
+        )
+        assert job_profile.required_technologies == ["Python", "Kubernetes", "Terraform", "GCP"]
+        assert job_profile.certifications == ["Certified Kubernetes Administrator"]
+        assert job_profile.languages == ["English", "German"]
+        assert job_profile.technical_skills is None
+
+    def test_whole_words_only(self):
+        job_profile = tech_dictionary.draft_job_profile(
+            "JavaScript, C++ and Java, but no sqlite3 or mongodb2 stores"
+        )
+        assert job_profile.required_technologies == ["JavaScript", "C++", "Java"]
+
+    def test_deduplicates_aliases(self):
+        job_profile = tech_dictionary.draft_job_profile("Kubernetes (k8s), K8S")
+        assert job_profile.required_technologies == ["Kubernetes"]
+
+    def test_case_sensitive_aliases(self):
+        job_profile = tech_dictionary.draft_job_profile(
+            "Spark and Excel skills. Excel in a team, spark ideas, go to market."
+        )
+        assert job_profile.required_technologies == ["Apache Spark", "Microsoft Excel"]
+
+    def test_custom_dictionary(self):
+        dictionary = TechDictionary({"required_technologies": {"Foo": ["foo-lang"]}}, {})
+        assert dictionary.draft_job_profile("FOO-LANG").required_technologies == ["Foo"]
+
+    @pytest.mark.parametrize("text", ["", "Nothing to see here."])
+    def test_no_matches(self, text):
+        assert tech_dictionary.draft_job_profile(text) == JobProfile()
@@ -0,0 +1,241 @@
+"""
+Tests for warm-starting resume tailoring from the most similar saved application.
+"""
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+
+from resumetailor.core.session import session_manager
+from resumetailor.models import JobProfile, Resume, to_output_resume
+from resumetailor.models.resume import Project, WorkPosition
+from resumetailor.services.job_profile_cache import JobProfileCache
+from resumetailor.services.llm_cache import LLMCache
+from resumetailor.services.near_duplicates import NearDuplicateIndex
+from resumetailor.services.warm_start import (
+    SECTION_DIGESTS_FILE,
+    WarmStart,
+    WarmStartIndex,
+    job_profile_diff,
+    save_warm_start,
+    section_digests,
+)
+
+MLOPS = JobProfile(
+    position="MLOps Engineer",
+    required_technologies=["Python", "Docker", "Kubernetes", "AWS"],
+    technical_skills=["CI/CD pipelines", "model deployment"],
+    responsibilities=["Deploy ML models to production"],
+)
+MLOPS_GCP = MLOPS.model_copy(
+    update={"required_technologies": ["Python", "Docker", "Kubernetes", "GCP"]}
+)
+PASTRY = JobProfile(
+    position="Pastry Chef",
+    technical_skills=["baking", "laminated dough"],
+    responsibilities=["Bake croissants every morning"],
+)
+
+FULL_RESUME = Resume(
+    work_experience=[
+        WorkPosition(job_title="ML Engineer", company="Acme", keywords=["Python", "AWS"]),
+        WorkPosition(job_title="Barista", company="Cafe"),
+    ],
+    projects=[Project(name="Model server", keywords=["Docker", "Kubernetes"])],
+)
+REFINED_RESUME = Resume(
+    work_experience=[WorkPosition(job_title="ML Engineer", company="Acme", keywords=["AWS"])],
+    projects=[Project(name="Model server", keywords=["Kubernetes"])],
+)
+
+
+def save_application(data_dir, name, job_profile, full_resume=FULL_RESUME):
+    app_dir = data_dir / name
+    app_dir.mkdir(parents=True)
+    (app_dir / "job_profile.json").write_text(json.dumps(job_profile.model_dump()))
+    save_warm_start(app_dir, REFINED_RESUME, section_digests(full_resume))
+    return app_dir
+
+
+class TestJobProfileDiff:
+    def test_equal_profiles(self):
+        assert job_profile_diff(MLOPS, MLOPS.model_copy()) == {}
+        assert job_profile_diff(
+            MLOPS, MLOPS.model_copy(update={"position": " mlops  engineer"})
+        ) == {}
+
+    def test_list_fields(self):
+        assert job_profile_diff(MLOPS, MLOPS_GCP) == {
+            "required_technologies": {"added": ["GCP"], "removed": ["AWS"]}
+        }
+        diff = job_profile_diff(JobProfile(), JobProfile(languages=["English"]))
+        assert diff == {"languages": {"added": ["English"]}}
+
+    def test_scalar_fields(self):
+        diff = job_profile_diff(MLOPS, MLOPS.model_copy(update={"company": "Acme"}))
+        assert diff == {"company": {"before": None, "after": "Acme"}}
+
+
+class TestWarmStartIndex:
+    def test_finds_most_similar_application(self, tmp_path):
+        save_application(tmp_path, "mlops", MLOPS)
+        save_application(tmp_path, "pastry", PASTRY)
+        index = WarmStartIndex(threshold=0.5)
+        assert index.build_from_history(tmp_path) == 2
+        warm_start = index.find(MLOPS_GCP)
+        assert warm_start.application_id == "mlops"
+        assert warm_start.similarity > 0.5
+        assert warm_start.job_profile == MLOPS
+        assert warm_start.resume == REFINED_RESUME
+
+    def test_threshold(self, tmp_path):
+        save_application(tmp_path, "pastry", PASTRY)
+        index = WarmStartIndex(threshold=0.5)
+        index.build_from_history(tmp_path)
+        assert index.find(MLOPS) is None
+        assert WarmStartIndex(threshold=0).find(MLOPS) is None
+        assert index.find(None) is None
+
+    def test_skips_applications_without_digests(self, tmp_path):
+        app_dir = save_application(tmp_path, "mlops", MLOPS)
+        (app_dir / SECTION_DIGESTS_FILE).unlink()
+        assert WarmStartIndex().build_from_history(tmp_path) == 0
+
+    def test_saved_application_keeps_the_refined_resume(self, tmp_path, monkeypatch):
+        """The structured resume and the digests of generation time are saved, not the compiled output."""
+        from resumetailor.services import storage
+
+        index = WarmStartIndex(threshold=0.5)
+        monkeypatch.setattr(storage, "warm_start_index", index)
+        # Saving the job profile also feeds these, keep them out of the data directory
+        cache = LLMCache(tmp_path / "job_profile_cache.sqlite", ttl=0, max_entries=10, enabled=True)
+        monkeypatch.setattr(storage, "job_profile_cache", JobProfileCache(cache))
+        monkeypatch.setattr(storage, "near_duplicate_index", NearDuplicateIndex())
+        session_id = session_manager.create_session("job_application", ["resume"])
+        session_manager.update_session_data(
+            session_id=session_id,
+            data_dir=tmp_path / "mlops",
+            job_description="MLOps Engineer",
+            job_profile=MLOPS,
+            refined_resume=to_output_resume(REFINED_RESUME, "ML engineer."),
+            tailored_resume=REFINED_RESUME,
+            section_digests=section_digests(FULL_RESUME),
+        )
+        (tmp_path / "mlops").mkdir()
+        try:
+            storage.save_job_profile(session_id)
+            storage.save_refined_resume(session_id)
+        finally:
+            session_manager.delete_session(session_id)
+            cache.close()
+        warm_start = index.find(MLOPS)
+        assert warm_start.resume == REFINED_RESUME
+        assert warm_start.resume.projects[0].keywords == ["Kubernetes"]
+        assert warm_start.previous_sections(FULL_RESUME).keys() == {"work_experience", "projects"}
+
+    def test_add_and_remove(self, tmp_path):
+        index = WarmStartIndex(threshold=0.5)
+        index.add(save_application(tmp_path, "mlops", MLOPS), MLOPS)
+        assert index.find(MLOPS).similarity == pytest.approx(1.0)
+        index.remove("mlops")
+        assert index.find(MLOPS) is None
+        assert len(index) == 0
+
+
+def test_previous_sections_require_unchanged_resume_sections():
+    edited = FULL_RESUME.model_copy(
+        update={"projects": [Project(name="Model server", keywords=["Docker"])]}
+    )
+    warm_start = WarmStart("mlops", 1.0, MLOPS, REFINED_RESUME, section_digests(FULL_RESUME))
+    assert set(warm_start.previous_sections(FULL_RESUME)) == {"work_experience", "projects"}
+    assert set(warm_start.previous_sections(edited)) == {"work_experience"}
+
+
+@pytest.fixture
+def resume_writer(monkeypatch):
+    """A fresh ResumeWriter; no request is sent, so a dummy key is enough."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL_RESUME", "gpt-5-mini")
+    from resumetailor.llm.resume import ResumeWriter
+
+    return ResumeWriter()
+
+
+class FakeChain:
+    def __init__(self, section_key, task, calls):
+        self.section_key = section_key
+        self.task = task
+        self.calls = calls
+
+    def _write(self, input):
+        self.calls.append((self.section_key, self.task, input))
+        return SimpleNamespace(
+            section_data=getattr(REFINED_RESUME, self.section_key), explanation="rewritten"
+        )
+
+    def invoke(self, input, *args, **kwargs):
+        return self._write(input)
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self._write(input)
+
+
+class FakeSummaryChain:
+    def invoke(self, input, *args, **kwargs):
+        return SimpleNamespace(professional_summary="An ML engineer.")
+
+    async def ainvoke(self, input, *args, **kwargs):
+        return self.invoke(input)
+
+
+def fake_writer_chains(resume_writer):
+    calls = []
+    for section in resume_writer.sections:
+        writer_chains = resume_writer.chains[("writer", section)]
+        for task in writer_chains:
+            writer_chains[task] = FakeChain(section, task, calls)
+    resume_writer.chains["summary"] = FakeSummaryChain()
+    return calls
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_writer_skips_unchanged_sections(resume_writer, use_async):
+    calls = fake_writer_chains(resume_writer)
+    warm_start = WarmStart("mlops", 1.0, MLOPS, REFINED_RESUME, section_digests(FULL_RESUME))
+    kwargs = dict(
+        thread_id=f"warm-start-skip-{use_async}",
+        resume=FULL_RESUME,
+        job_profile=MLOPS.model_copy(),
+        warm_start=warm_start,
+    )
+    if use_async:
+        refined = asyncio.run(resume_writer.agenerate(**kwargs))
+    else:
+        refined = resume_writer.generate(**kwargs)
+    assert calls == []
+    assert refined.work_experience == REFINED_RESUME.work_experience
+    assert refined.projects == REFINED_RESUME.projects
+
+
+def test_writer_revises_changed_sections(resume_writer):
+    calls = fake_writer_chains(resume_writer)
+    edited = FULL_RESUME.model_copy(
+        update={"projects": [Project(name="Model server", keywords=["Docker"])]}
+    )
+    warm_start = WarmStart("mlops", 0.9, MLOPS, REFINED_RESUME, section_digests(FULL_RESUME))
+    resume_writer.generate(
+        thread_id="warm-start-revise",
+        resume=edited,
+        job_profile=MLOPS_GCP,
+        warm_start=warm_start,
+    )
+    tasks = {section: task for section, task, _ in calls}
+    assert tasks == {"work_experience": "warm_start", "projects": "refine_with_job"}
+    inputs = {section: input for section, _, input in calls}
+    # Work experience is revised from the previous section and the profile diff
+    assert "ML Engineer" in inputs["work_experience"]["previous_section"]
+    assert json.loads(inputs["work_experience"]["job_profile_diff"]) == {
+        "required_technologies": {"added": ["GCP"], "removed": ["AWS"]}
+    }
+    # Projects changed in the full resume, so they are written from scratch
+    assert "previous_section" not in inputs["projects"]